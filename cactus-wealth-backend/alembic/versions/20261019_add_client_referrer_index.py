@@ -0,0 +1,22 @@
+"""add clients.referred_by_client_id index for referral tree walks
+
+Revision ID: client_referrer_20261019
+Revises: client_search_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'client_referrer_20261019'
+down_revision = 'client_search_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_clients_referred_by_client_id', 'clients', ['referred_by_client_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_clients_referred_by_client_id', table_name='clients')
@@ -0,0 +1,45 @@
+"""add full-text and trigram client search indexes
+
+Revision ID: client_search_20261019
+Revises: keyset_indexes_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'client_search_20261019'
+down_revision = 'keyset_indexes_20261019'
+branch_labels = None
+depends_on = None
+
+# Must match client_search_document() in repositories/client_repository.py
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(email, '') || ' ' || coalesce(phone, '')"
+    " || ' ' || coalesce(portfolio_name, '')), 'B')"
+    " || setweight(to_tsvector('simple'::regconfig, coalesce(notes, '') || ' ' || coalesce(live_notes, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    # PostgreSQL only; other backends fall back to LIKE scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(f'CREATE INDEX ix_clients_search_document ON clients USING gin (({SEARCH_DOCUMENT}))')
+    op.execute(
+        "CREATE INDEX ix_clients_full_name_trgm ON clients "
+        "USING gin ((first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+    op.execute('CREATE INDEX ix_clients_email_trgm ON clients USING gin (email gin_trgm_ops)')
+    op.execute('CREATE INDEX ix_clients_phone_trgm ON clients USING gin (phone gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_clients_phone_trgm', table_name='clients')
+    op.drop_index('ix_clients_email_trgm', table_name='clients')
+    op.drop_index('ix_clients_full_name_trgm', table_name='clients')
+    op.drop_index('ix_clients_search_document', table_name='clients')
@@ -0,0 +1,38 @@
+"""add import_jobs table
+
+Revision ID: import_jobs_20261019
+Revises: investment_account_key_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'import_jobs_20261019'
+down_revision = 'investment_account_key_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', sa.String(length=64), primary_key=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='QUEUED'),
+        sa.Column('progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.String(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+    )
+    op.create_index('ix_import_jobs_user_created', 'import_jobs', ['user_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_import_jobs_user_created', table_name='import_jobs')
+    op.drop_table('import_jobs')
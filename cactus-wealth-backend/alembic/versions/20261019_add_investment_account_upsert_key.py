@@ -0,0 +1,52 @@
+"""unique (client_id, account_number) on investment_accounts
+
+Revision ID: investment_account_key_20261019
+Revises: report_content_hash_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'investment_account_key_20261019'
+down_revision = 'report_content_hash_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicated accounts hold real balances, so they are never merged or
+    # deleted here: list them and stop until they are resolved by hand
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT client_id, account_number, COUNT(*) AS copies
+            FROM investment_accounts
+            GROUP BY client_id, account_number
+            HAVING COUNT(*) > 1
+            ORDER BY client_id, account_number
+            """
+        )
+    ).all()
+    if duplicates:
+        pairs = "\n".join(
+            f"  client_id={row.client_id} account_number={row.account_number!r} ({row.copies} rows)"
+            for row in duplicates
+        )
+        raise RuntimeError(
+            "Cannot add the unique (client_id, account_number) key to investment_accounts: "
+            f"{len(duplicates)} accounts are duplicated. Merge or renumber them and "
+            f"run the migration again.\n{pairs}"
+        )
+
+    op.create_index(
+        'uq_investment_accounts_client_account',
+        'investment_accounts',
+        ['client_id', 'account_number'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_investment_accounts_client_account', table_name='investment_accounts')
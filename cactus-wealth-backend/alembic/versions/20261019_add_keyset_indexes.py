@@ -0,0 +1,33 @@
+"""add (created_at, id) composite indexes for keyset pagination
+
+Revision ID: keyset_indexes_20261019
+Revises: import_jobs_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'keyset_indexes_20261019'
+down_revision = 'import_jobs_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_clients_owner_created_id', 'clients', ['owner_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notifications_user_created_id', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+    # The (client_id, created_at) indexes are prefixes of the new ones
+    op.drop_index('ix_client_activities_client_created', table_name='client_activities')
+    op.create_index('ix_client_activities_client_created_id', 'client_activities', ['client_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_client_notes_client_created', table_name='client_notes')
+    op.create_index('ix_client_notes_client_created_id', 'client_notes', ['client_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_client_notes_client_created_id', table_name='client_notes')
+    op.create_index('ix_client_notes_client_created', 'client_notes', ['client_id', 'created_at'], unique=False)
+    op.drop_index('ix_client_activities_client_created_id', table_name='client_activities')
+    op.create_index('ix_client_activities_client_created', 'client_activities', ['client_id', 'created_at'], unique=False)
+    op.drop_index('ix_notifications_user_created_id', table_name='notifications')
+    op.drop_index('ix_clients_owner_created_id', table_name='clients')
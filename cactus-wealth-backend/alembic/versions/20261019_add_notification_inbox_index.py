@@ -0,0 +1,26 @@
+"""add (user_id, is_read, created_at, id) index on notifications for the inbox
+
+Replaces ix_notifications_user_read, which is a prefix of the new index.
+
+Revision ID: notification_inbox_20261019
+Revises: report_timeline_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'notification_inbox_20261019'
+down_revision = 'report_timeline_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notifications_user_read_created_id', 'notifications', ['user_id', 'is_read', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_notifications_user_read', table_name='notifications')
+
+
+def downgrade() -> None:
+    op.create_index('ix_notifications_user_read', 'notifications', ['user_id', 'is_read'], unique=False)
+    op.drop_index('ix_notifications_user_read_created_id', table_name='notifications')
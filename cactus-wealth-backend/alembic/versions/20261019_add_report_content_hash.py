@@ -0,0 +1,25 @@
+"""add content_hash to reports
+
+Revision ID: report_content_hash_20261019
+Revises: report_jobs_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'report_content_hash_20261019'
+down_revision = 'report_jobs_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('reports', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_reports_content_hash', 'reports', ['content_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_content_hash', table_name='reports')
+    op.drop_column('reports', 'content_hash')
@@ -0,0 +1,37 @@
+"""add report_jobs table
+
+Revision ID: report_jobs_20261019
+Revises: backtest_jobs_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'report_jobs_20261019'
+down_revision = 'backtest_jobs_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_jobs',
+        sa.Column('id', sa.String(length=64), primary_key=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='QUEUED'),
+        sa.Column('progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('request', sa.Text(), nullable=False),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.String(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+    )
+    op.create_index('ix_report_jobs_user_created', 'report_jobs', ['user_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_jobs_user_created', table_name='report_jobs')
+    op.drop_table('report_jobs')
@@ -0,0 +1,22 @@
+"""add (client_id, generated_at, id) index on reports for the client timeline
+
+Revision ID: report_timeline_20261019
+Revises: client_referrer_20261019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'report_timeline_20261019'
+down_revision = 'client_referrer_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reports_client_generated_id', 'reports', ['client_id', 'generated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_client_generated_id', table_name='reports')
@@ -5,7 +5,9 @@ from cactus_wealth.api.v1.endpoints import (
     automations,
     clients,
     dashboard,
+    exports,
     health,
+    imports,
     insurance_policies,
     investment_accounts,
     login,
@@ -36,6 +38,8 @@ api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboar
 api_router.include_router(login.router, prefix="/login", tags=["auth"])
 api_router.include_router(passkeys.router, prefix="/auth/passkeys", tags=["auth-passkeys"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
+api_router.include_router(imports.router, prefix="/imports", tags=["imports"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
 api_router.include_router(investment_accounts.router, tags=["investment-accounts"])
 api_router.include_router(insurance_policies.router, tags=["insurance-policies"])
 api_router.include_router(notifications.router, tags=["notifications"])
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
 
+from cactus_wealth.core.ticker_index import ticker_index
 from cactus_wealth.database import get_session
 from cactus_wealth.models import User
-from cactus_wealth.repositories import AssetRepository
 from cactus_wealth.schemas import AssetRead
 from cactus_wealth.security import get_current_user
 
@@ -27,9 +27,8 @@ def search_assets(
     """
     Search for assets by ticker symbol or name.
 
-    First searches the local database for matching assets.
-    If the query appears to be a ticker symbol and we have fewer results than the limit,
-    attempts to fetch the asset from yfinance and stores it locally for future searches.
+    Answered from the in-process ticker index, ranked exact ticker > ticker
+    prefix > name prefix > substring.
 
     Args:
         query: Search term (ticker symbol or asset name)
@@ -38,6 +37,5 @@ def search_assets(
     Returns:
         List of matching assets with their details including sector information
     """
-    asset_repo = AssetRepository(session)
-    assets = asset_repo.search_assets(query=query, limit=limit)
-    return [AssetRead.model_validate(asset) for asset in assets]
+    ticker_index.ensure_loaded(session)
+    return ticker_index.search(query, limit=limit)
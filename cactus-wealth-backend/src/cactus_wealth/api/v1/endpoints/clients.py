@@ -2,24 +2,68 @@
 Client management endpoints for CRM.
 """
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from decimal import Decimal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
 from cactus_wealth import services
+from cactus_wealth.core.cache import get_async_redis_client
+from cactus_wealth.core.fieldsets import (
+    dump_row,
+    group_by,
+    parse_fields,
+    parse_include,
+    sparse_response,
+)
+from cactus_wealth.core.pagination import set_next_cursor
 from cactus_wealth.database import get_session
-from cactus_wealth.models import User
-from cactus_wealth.repositories import ClientRepository
+from cactus_wealth.models import Client, User
+from cactus_wealth.repositories import (
+    ActivityRepository,
+    ClientRepository,
+    ReferralRepository,
+    TimelineRepository,
+)
 from cactus_wealth.repositories.note_repository import NoteRepository
 from cactus_wealth.schemas import (
+    ClientActivityRead,
+    ClientBulkCreate,
+    ClientBulkDelete,
+    ClientBulkReassign,
+    ClientBulkResult,
+    ClientBulkStatus,
+    ClientBulkUpdate,
     ClientCreate,
     ClientNoteCreate,
     ClientNoteRead,
     ClientNoteUpdate,
+    ClientOverview,
     ClientRead,
     ClientReadWithDetails,
+    ClientReferrals,
+    ClientSearchHit,
     ClientUpdate,
+    InsurancePolicyRead,
+    InvestmentAccountRead,
+    ProjectionRequest,
+    ProjectionResponse,
+    ReferralNode,
+    ReferrerStats,
+    TimelineEvent,
 )
 from cactus_wealth.security import get_current_user
+from cactus_wealth.services.webhook_service import CactusWebhookService
 
 router = APIRouter()
 
@@ -28,6 +72,7 @@ router = APIRouter()
 @router.post("", response_model=ClientRead, status_code=status.HTTP_201_CREATED)
 def create_client(
     client_create: ClientCreate,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> ClientRead:
@@ -45,26 +90,230 @@ def create_client(
         except Exception:
             pass
 
+        webhook_service = CactusWebhookService()
+        background_tasks.add_task(
+            webhook_service.client_created, webhook_service.client_payload(client)
+        )
+
         return ClientRead.model_validate(client)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+# Relations that ?include= can embed in client lists
+CLIENT_INCLUDES = {
+    "investment_accounts": InvestmentAccountRead,
+    "insurance_policies": InsurancePolicyRead,
+    "referred_clients": ClientRead,
+}
+CLIENT_INCLUDE_KEYS = {
+    "investment_accounts": "client_id",
+    "insurance_policies": "client_id",
+    "referred_clients": "referred_by_client_id",
+}
+
+
 @router.get("/", response_model=list[ClientReadWithDetails])
 @router.get("", response_model=list[ClientReadWithDetails])
 def read_clients(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
+    fields: str | None = Query(
+        None, description="Comma-separated client columns to return, e.g. first_name,last_name"
+    ),
+    include: str | None = Query(
+        None, description="Relations to embed: " + ", ".join(CLIENT_INCLUDES)
+    ),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
-) -> list[ClientReadWithDetails]:
+) -> list[ClientReadWithDetails] | JSONResponse:
+    """
+    List the user's clients, newest first.
+
+    Pages are keyset-paginated: pass the X-Next-Cursor response header back as
+    ``cursor`` to get the next page. ``skip`` (offset paging) is kept for older
+    clients and is ignored when a cursor is given.
+
+    With ``fields`` and/or ``include`` only the requested columns are selected
+    and only the requested relations are loaded; otherwise every client comes
+    with all of its accounts, policies and referrals.
+    """
     client_repo = ClientRepository(session)
-    clients = client_repo.get_clients_by_user(
-        owner_id=current_user.id, skip=skip, limit=limit, user_role=current_user.role
-    )
+    if fields is not None or include is not None:
+        return _read_sparse_clients(
+            client_repo, current_user, fields, include, skip, limit, cursor
+        )
+    if skip and not cursor:
+        clients = client_repo.get_clients_by_user(
+            owner_id=current_user.id, skip=skip, limit=limit, user_role=current_user.role
+        )
+    else:
+        clients, next_cursor = client_repo.get_clients_page(
+            owner_id=current_user.id, limit=limit, cursor=cursor, user_role=current_user.role
+        )
+        set_next_cursor(response, next_cursor)
     return [ClientReadWithDetails.model_validate(client) for client in clients]
 
 
+def _read_sparse_clients(
+    client_repo: ClientRepository,
+    current_user: User,
+    fields: str | None,
+    include: str | None,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+) -> JSONResponse:
+    names = parse_fields(fields, ClientRead, Client)
+    relations = parse_include(include, CLIENT_INCLUDES)
+    rows, next_cursor = client_repo.get_client_rows(
+        owner_id=current_user.id,
+        names=names,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        user_role=current_user.role,
+    )
+    related = {
+        name: group_by(items, CLIENT_INCLUDE_KEYS[name])
+        for name, items in client_repo.get_related([row.id for row in rows], relations).items()
+    }
+
+    items = []
+    for row in rows:
+        item = dump_row(ClientRead, row, names)
+        for name, groups in related.items():
+            schema = CLIENT_INCLUDES[name]
+            item[name] = [
+                schema.model_validate(obj).model_dump(mode="json") for obj in groups.get(row.id, [])
+            ]
+        items.append(item)
+
+    sparse = sparse_response(items)
+    set_next_cursor(sparse, next_cursor)
+    return sparse
+
+
+@router.get("/search", response_model=list[ClientSearchHit])
+def search_clients(
+    q: str = Query(..., min_length=2, max_length=100, description="Search terms"),
+    limit: int = Query(20, ge=1, le=100),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[ClientSearchHit]:
+    """
+    Search the clients visible to the user by name, email, phone, portfolio
+    name and notes, best match first.
+    """
+    client_repo = ClientRepository(session)
+    rows = client_repo.search_clients(
+        q, owner_ids=client_repo.visible_owner_ids(current_user), limit=limit
+    )
+    return [ClientSearchHit.model_validate(row) for row in rows]
+
+
+@router.get("/referrals/top", response_model=list[ReferrerStats])
+def read_top_referrers(
+    limit: int = Query(50, ge=1, le=500),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[ReferrerStats]:
+    """Referrers in the user's book by the AUM their whole downline brought in."""
+    owner_ids = ClientRepository(session).visible_owner_ids(current_user)
+    rows = ReferralRepository(session).get_referrer_stats(owner_ids=owner_ids, limit=limit)
+    return [ReferrerStats.model_validate(row) for row in rows]
+
+
+@router.post("/bulk", response_model=ClientBulkResult)
+def bulk_create_clients(
+    request: ClientBulkCreate,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientBulkResult:
+    """
+    Create many clients owned by the user in one transaction.
+
+    Items that cannot be created are reported in ``errors`` by their position
+    in the request; the rest are created.
+    """
+    bulk_service = services.ClientBulkService(session)
+    result = bulk_service.create_clients(request, current_user)
+    _emit_bulk_events(background_tasks, bulk_service, "client.created", result)
+    return result
+
+
+@router.patch("/bulk", response_model=ClientBulkResult)
+def bulk_update_clients(
+    request: ClientBulkUpdate,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientBulkResult:
+    """Apply per-client changes to many of the user's clients in one transaction."""
+    bulk_service = services.ClientBulkService(session)
+    result = bulk_service.update_clients(request, current_user)
+    _emit_bulk_events(background_tasks, bulk_service, "client.updated", result)
+    return result
+
+
+@router.post("/bulk/status", response_model=ClientBulkResult)
+def bulk_set_client_status(
+    request: ClientBulkStatus,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientBulkResult:
+    """Move many of the user's clients to one pipeline status."""
+    bulk_service = services.ClientBulkService(session)
+    result = bulk_service.set_status(request, current_user)
+    _emit_bulk_events(background_tasks, bulk_service, "client.updated", result)
+    return result
+
+
+@router.post("/bulk/reassign", response_model=ClientBulkResult)
+def bulk_reassign_clients(
+    request: ClientBulkReassign,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientBulkResult:
+    """Move many of the user's clients to another owner in the user's book."""
+    bulk_service = services.ClientBulkService(session)
+    result = bulk_service.reassign_owner(request, current_user)
+    _emit_bulk_events(background_tasks, bulk_service, "client.updated", result)
+    return result
+
+
+@router.post("/bulk/delete", response_model=ClientBulkResult)
+def bulk_delete_clients(
+    request: ClientBulkDelete,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientBulkResult:
+    """
+    Delete many of the user's clients with their accounts, policies, notes
+    and activities. Clients with portfolios or reports are not deleted.
+    """
+    return services.ClientBulkService(session).delete_clients(request, current_user)
+
+
+def _emit_bulk_events(
+    background_tasks: BackgroundTasks,
+    bulk_service: services.ClientBulkService,
+    event_type: str,
+    result: ClientBulkResult,
+) -> None:
+    if result.client_ids:
+        background_tasks.add_task(
+            CactusWebhookService().emit_client_events,
+            event_type,
+            bulk_service.event_payloads(result.client_ids),
+        )
+
+
 @router.get("/{client_id}", response_model=ClientReadWithDetails)
 def read_client(
     client_id: int,
@@ -78,10 +327,54 @@ def read_client(
     return ClientReadWithDetails.model_validate(client)
 
 
+@router.get("/{client_id}/overview", response_model=ClientOverview)
+def read_client_overview(
+    client_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientOverview:
+    """
+    Everything the client detail page shows in one call: the client, its
+    portfolios with their latest snapshot, accounts, policies, recent
+    activities and notes, latest report and referrals.
+    """
+    return services.ClientOverviewService(session).get_overview(client_id, current_user)
+
+
+@router.get("/{client_id}/referrals", response_model=ClientReferrals)
+def read_client_referrals(
+    client_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClientReferrals:
+    """A client's referral chain up to the root and its full downline with AUM."""
+    client_repo = ClientRepository(session)
+    client = client_repo.get_client(client_id=client_id, owner_id=current_user.id, user_role=current_user.role)
+    if client is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+    owner_ids = client_repo.visible_owner_ids(current_user)
+    referral_repo = ReferralRepository(session)
+    downline = [
+        ReferralNode.model_validate(row._mapping)
+        for row in referral_repo.get_downline(client_id, owner_ids=owner_ids)
+    ]
+    return ClientReferrals(
+        client_id=client_id,
+        chain=[
+            ReferralNode.model_validate(row._mapping)
+            for row in referral_repo.get_chain(client_id, owner_ids=owner_ids)
+        ],
+        downline=downline,
+        downline_size=len(downline),
+        attributed_aum=sum((node.aum or 0 for node in downline), start=Decimal(0)),
+    )
+
+
 @router.put("/{client_id}", response_model=ClientRead)
 def update_client(
     client_id: int,
     client_update: ClientUpdate,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> ClientRead:
@@ -95,6 +388,12 @@ def update_client(
         )
         if client is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+
+        webhook_service = CactusWebhookService()
+        background_tasks.add_task(
+            webhook_service.client_updated, webhook_service.client_payload(client)
+        )
+
         return ClientRead.model_validate(client)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -113,24 +412,94 @@ def delete_client(
     return ClientRead.model_validate(client)
 
 
+@router.post("/{client_id}/projection", response_model=ProjectionResponse)
+async def project_client(
+    client_id: int,
+    request: ProjectionRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ProjectionResponse:
+    """Monte Carlo projection of all of a client's portfolios, with savings contributions."""
+    try:
+        projection_service = services.ProjectionService(
+            session,
+            services.PortfolioBacktestService(redis_client=get_async_redis_client()),
+        )
+        return await projection_service.project_client(client_id, request, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 # -------------------- Client Notes --------------------
 
 
 @router.get("/{client_id}/notes", response_model=list[ClientNoteRead])
 def get_client_notes(
     client_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> list[ClientNoteRead]:
+    """List a client's notes, newest first; the next page's cursor is in X-Next-Cursor."""
     client_repo = ClientRepository(session)
     client = client_repo.get_client(client_id=client_id, owner_id=current_user.id, user_role=current_user.role)
     if client is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
     note_repo = NoteRepository(session)
-    notes = note_repo.get_by_client_id(client_id=client_id)
+    notes, next_cursor = note_repo.get_page_by_client_id(
+        client_id=client_id, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, next_cursor)
     return [ClientNoteRead.model_validate(note) for note in notes]
 
 
+@router.get("/{client_id}/activities", response_model=list[ClientActivityRead])
+def get_client_activities(
+    client_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[ClientActivityRead]:
+    """List a client's activities, newest first; the next page's cursor is in X-Next-Cursor."""
+    client_repo = ClientRepository(session)
+    client = client_repo.get_client(client_id=client_id, owner_id=current_user.id, user_role=current_user.role)
+    if client is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+    activities, next_cursor = ActivityRepository(session).get_page_by_client_id(
+        client_id=client_id, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, next_cursor)
+    return [ClientActivityRead.model_validate(activity) for activity in activities]
+
+
+@router.get("/{client_id}/timeline", response_model=list[TimelineEvent])
+def get_client_timeline(
+    client_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[TimelineEvent]:
+    """
+    A client's activities, notes, reports and account events merged newest
+    first; the next page's cursor is in X-Next-Cursor.
+    """
+    client_repo = ClientRepository(session)
+    client = client_repo.get_client(client_id=client_id, owner_id=current_user.id, user_role=current_user.role)
+    if client is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+    events, next_cursor = TimelineRepository(session).get_page(
+        client_id=client_id, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, next_cursor)
+    return [TimelineEvent.model_validate(event) for event in events]
+
+
 @router.post("/{client_id}/notes", response_model=ClientNoteRead, status_code=status.HTTP_201_CREATED)
 def create_client_note(
     client_id: int,
@@ -0,0 +1,50 @@
+"""
+Streaming bulk export endpoints for CRM data.
+"""
+
+import importlib.util
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from cactus_wealth.database import get_session
+from cactus_wealth.models import User
+from cactus_wealth.repositories import ClientRepository
+from cactus_wealth.security import get_current_user
+from cactus_wealth.services.export_service import (
+    EXPORT_MEDIA_TYPES,
+    ExportDataset,
+    ExportFormat,
+    ExportService,
+)
+
+router = APIRouter()
+
+
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: ExportDataset,
+    format: ExportFormat = Query("csv"),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream a whole dataset (clients, investment_accounts, insurance_policies,
+    notes or snapshots) as CSV, NDJSON or Parquet.
+
+    Rows are read from a server-side cursor and encoded batch by batch, so
+    memory use does not grow with the export. Advisors export their own book,
+    managers include their advisors' books and admins export everything.
+    """
+    if format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+
+    owner_ids = ClientRepository(session).visible_owner_ids(current_user)
+    filename = f"{dataset}-{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        ExportService().stream(dataset, format, owner_ids),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,67 @@
+"""
+Bulk import endpoints: multi-client CSV/Excel files processed by the ARQ worker.
+"""
+
+from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from cactus_wealth.database import get_db
+from cactus_wealth.models import User
+from cactus_wealth.schemas import ImportJobRead, ImportKind
+from cactus_wealth.security import get_current_user
+from cactus_wealth.services import BulkImportService
+
+router = APIRouter()
+
+
+@router.post("", response_model=ImportJobRead, status_code=202)
+async def enqueue_import(
+    file: UploadFile,
+    kind: ImportKind = Form(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ImportJobRead:
+    """
+    Stage a CSV/Excel file and queue its import.
+
+    Accounts and policies reference their client by a client_email column;
+    client files are keyed by email. Progress and the outcome are pushed over
+    the notifications WebSocket (import_job_progress / import_job_completed /
+    import_job_failed) and stay available from GET /imports/{job_id}. A failed
+    import must be uploaded again; rows it already imported are updated, not
+    duplicated.
+    """
+    job_service = BulkImportService(db)
+    try:
+        job = await run_in_threadpool(
+            job_service.create_job, kind, file.filename or "", file.file, current_user
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await job_service.enqueue(job)
+
+    return job_service.to_read(job)
+
+
+@router.get("/{job_id}", response_model=ImportJobRead)
+def get_import_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ImportJobRead:
+    """Get the status and, once finished, the counts of an import job."""
+    return BulkImportService(db).get_job(job_id, current_user)
+
+
+@router.get("/{job_id}/errors")
+def download_import_errors(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> FileResponse:
+    """Download the per-row error report (row, error, data) of an import job."""
+    path = BulkImportService(db).get_error_report(job_id, current_user)
+    return FileResponse(path, media_type="text/csv", filename=f"import-{job_id}-errors.csv")
@@ -1,10 +1,12 @@
 """Investment account endpoints using service + auth, aligned with tests."""
 
-from fastapi import APIRouter, Depends, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
+from cactus_wealth.core.fieldsets import dump_row, parse_fields, sparse_response
 from cactus_wealth.database import get_session
-from cactus_wealth.models import User
+from cactus_wealth.models import InvestmentAccount, User
 from cactus_wealth.schemas import (
     InvestmentAccountCreate,
     InvestmentAccountRead,
@@ -12,9 +14,6 @@ from cactus_wealth.schemas import (
 )
 from cactus_wealth.security import get_current_user
 from cactus_wealth.services import InvestmentAccountService
-from cactus_wealth.services import (
-    InvestmentAccountService as LegacyInvestmentAccountService,
-)
 
 router = APIRouter()
 
@@ -57,9 +56,18 @@ def get_investment_accounts_for_client(
     client_id: int,
     skip: int = 0,
     limit: int = 100,
+    fields: str | None = Query(
+        None, description="Comma-separated account columns to return, e.g. platform,aum"
+    ),
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> list[InvestmentAccountRead]:
+) -> list[InvestmentAccountRead] | JSONResponse:
+    if fields is not None:
+        names = parse_fields(fields, InvestmentAccountRead, InvestmentAccount)
+        rows = account_service.get_account_rows_by_client(
+            client_id=client_id, current_advisor=current_user, names=names, skip=skip, limit=limit
+        )
+        return sparse_response([dump_row(InvestmentAccountRead, row, names) for row in rows])
     accounts = account_service.get_accounts_by_client(
         client_id=client_id, current_advisor=current_user, skip=skip, limit=limit
     )
@@ -97,13 +105,13 @@ def bulk_upload_investment_accounts(
     account_service: InvestmentAccountService = Depends(get_account_service),
 ):
     """Bulk upload investment accounts for a client (CSV/Excel)."""
-    # Reuse service implementation already available in consolidated services module
-    legacy = LegacyInvestmentAccountService(account_service.db)
-    result = legacy.bulk_upload_investment_accounts(client_id, file, current_user)
-    # Normalize response shape for tests
-    if "invalid" not in result:
-        invalid = result.get("invalid_rows") or result.get("errors") or []
-        created = int(result.get("created", 0))
-        updated = int(result.get("updated", 0))
-        return {"created": created, "updated": updated, "invalid": invalid}
-    return result
+    result = account_service.bulk_upload_investment_accounts(client_id, file, current_user)
+    if "error" in result:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result["error"])
+    return {
+        "created": result["created"],
+        "updated": result["updated"],
+        "invalid": result["invalid_rows"],
+        # The first MAX_REPORTED_UPLOAD_ERRORS rejected rows, with their reasons
+        "errors": result["errors"],
+    }
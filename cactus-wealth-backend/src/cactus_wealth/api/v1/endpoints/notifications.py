@@ -1,37 +1,85 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Query, Response
+from sqlmodel import Session
 
+from cactus_wealth.core.pagination import set_next_cursor
 from cactus_wealth.database import get_session
-from cactus_wealth.models import Notification, User
-from cactus_wealth.schemas import NotificationRead
+from cactus_wealth.models import User
+from cactus_wealth.repositories import NotificationRepository
+from cactus_wealth.schemas import (
+    NotificationRead,
+    NotificationUnreadCount,
+    NotificationUpdate,
+)
 from cactus_wealth.security import get_current_user
+from cactus_wealth.services import NotificationService
 
 router = APIRouter()
 
 
 @router.get("/notifications", response_model=list[NotificationRead])
 def get_user_notifications(
+    response: Response,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
+    unread_only: bool = False,
 ):
     """
     Get the most recent notifications for the current user.
 
     Args:
+        response: Outgoing response; carries the X-Next-Cursor header
         db: Database session
         current_user: Current authenticated user
         limit: Maximum number of notifications to return (default: 10)
+        cursor: X-Next-Cursor value of the previous page
+        unread_only: Only return unread notifications
 
     Returns:
         List of recent notifications ordered by created_at descending
     """
-    statement = (
-        select(Notification)
-        .where(Notification.user_id == current_user.id)
-        .order_by(Notification.created_at.desc())
-        .limit(limit)
+    notifications, next_cursor = NotificationRepository(db).get_page(
+        current_user.id, limit=limit, cursor=cursor, unread_only=unread_only
     )
-
-    notifications = db.exec(statement).all()
+    set_next_cursor(response, next_cursor)
     return notifications
+
+
+@router.get("/notifications/unread-count", response_model=NotificationUnreadCount)
+def get_unread_count(
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> NotificationUnreadCount:
+    """Number of unread notifications of the current user (the inbox badge)."""
+    return NotificationUnreadCount(unread=NotificationService(db).unread_count(current_user.id))
+
+
+@router.post("/notifications/read-all", response_model=NotificationUnreadCount)
+def mark_all_notifications_read(
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+    up_to_id: int | None = Query(
+        None, description="Leave notifications newer than this one unread"
+    ),
+) -> NotificationUnreadCount:
+    """Mark the current user's notifications as read and return the new badge count."""
+    notification_service = NotificationService(db)
+    notification_service.mark_all_read(current_user.id, up_to_id=up_to_id)
+    return NotificationUnreadCount(unread=notification_service.unread_count(current_user.id))
+
+
+@router.patch("/notifications/{notification_id}", response_model=NotificationRead)
+def update_notification(
+    notification_id: int,
+    notification_update: NotificationUpdate,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """Mark one of the current user's notifications as read or unread."""
+    notification_service = NotificationService(db)
+    if notification_update.is_read is None:
+        return notification_service.get_notification(current_user.id, notification_id)
+    return notification_service.set_read(
+        current_user.id, notification_id, notification_update.is_read
+    )
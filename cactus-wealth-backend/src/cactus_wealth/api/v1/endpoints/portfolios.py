@@ -2,22 +2,74 @@
 Portfolio management endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from cactus_wealth.core.cache import get_async_redis_client
+from cactus_wealth.core.fieldsets import dump_row, group_by, parse_fields, parse_include
 from cactus_wealth.database import get_db
+from cactus_wealth.models import Portfolio, User
 from cactus_wealth.repositories import PortfolioRepository
+from cactus_wealth.schemas import (
+    BacktestJobRead,
+    BacktestRequest,
+    BacktestResponse,
+    PositionRead,
+    ProjectionRequest,
+    ProjectionResponse,
+)
+from cactus_wealth.security import get_current_user
+from cactus_wealth.services import (
+    BacktestJobService,
+    PortfolioBacktestService,
+    ProjectionService,
+)
 
 router = APIRouter()
 
 
+# Relations that ?include= can embed in portfolio lists
+PORTFOLIO_INCLUDES = ("positions",)
+
+
+def _sparse_portfolios(
+    portfolio_repo: PortfolioRepository,
+    fields: str | None,
+    include: str | None,
+    *criteria,
+) -> dict:
+    """Portfolio list with only the requested columns and relations."""
+    names = parse_fields(fields, Portfolio, Portfolio)
+    relations = parse_include(include, PORTFOLIO_INCLUDES)
+    rows = portfolio_repo.get_columns(names, *criteria)
+    items = [dump_row(Portfolio, row, names) for row in rows]
+    if "positions" in relations:
+        positions = group_by(
+            portfolio_repo.get_positions([row.id for row in rows]), "portfolio_id"
+        )
+        for row, item in zip(rows, items, strict=True):
+            item["positions"] = [
+                PositionRead.model_validate(position).model_dump(mode="json")
+                for position in positions.get(row.id, [])
+            ]
+    return {"portfolios": items}
+
+
 @router.get("/portfolios")
-async def get_portfolios(db: Session = Depends(get_db)):
-    """Get all portfolios."""
+async def get_portfolios(
+    fields: str | None = Query(None, description="Comma-separated portfolio columns to return"),
+    include: str | None = Query(None, description="Relations to embed: positions"),
+    db: Session = Depends(get_db),
+):
+    """Get all portfolios, optionally as a sparse fieldset."""
     try:
         portfolio_repo = PortfolioRepository(db)
+        if fields is not None or include is not None:
+            return _sparse_portfolios(portfolio_repo, fields, include)
         portfolios = portfolio_repo.get_all()
         return {"portfolios": portfolios}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -38,12 +90,23 @@ async def get_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/portfolios/client/{client_id}")
-async def get_client_portfolios(client_id: int, db: Session = Depends(get_db)):
-    """Get all portfolios for a specific client."""
+async def get_client_portfolios(
+    client_id: int,
+    fields: str | None = Query(None, description="Comma-separated portfolio columns to return"),
+    include: str | None = Query(None, description="Relations to embed: positions"),
+    db: Session = Depends(get_db),
+):
+    """Get all portfolios for a specific client, optionally as a sparse fieldset."""
     try:
         portfolio_repo = PortfolioRepository(db)
+        if fields is not None or include is not None:
+            return _sparse_portfolios(
+                portfolio_repo, fields, include, Portfolio.client_id == client_id
+            )
         portfolios = portfolio_repo.get_by_client_id(client_id)
         return {"portfolios": portfolios}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -87,3 +150,72 @@ async def delete_portfolio(portfolio_id: int, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/backtest", response_model=BacktestResponse)
+async def backtest_portfolio(
+    request: BacktestRequest,
+    current_user: User = Depends(get_current_user),
+) -> BacktestResponse:
+    """Backtest a portfolio composition against benchmarks (cached per request)."""
+    try:
+        backtest_service = PortfolioBacktestService(
+            redis_client=get_async_redis_client()
+        )
+        return await backtest_service.perform_backtest(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.post("/backtest/jobs", response_model=BacktestJobRead, status_code=202)
+async def enqueue_backtest(
+    request: BacktestRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> BacktestJobRead:
+    """
+    Queue a backtest to run in the background.
+
+    Progress and the final result are pushed over the notifications WebSocket
+    (backtest_job_progress / backtest_job_completed / backtest_job_failed) and
+    the result stays available from GET /backtest/jobs/{job_id}.
+    """
+    job_service = BacktestJobService(db)
+    try:
+        job = job_service.create_job(request, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await job_service.enqueue(job)
+
+    return job_service.to_read(job)
+
+
+@router.get("/backtest/jobs/{job_id}", response_model=BacktestJobRead)
+def get_backtest_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> BacktestJobRead:
+    """Get the status and, once completed, the result of a queued backtest."""
+    return BacktestJobService(db).get_job(job_id, current_user)
+
+
+@router.post("/{portfolio_id}/projection", response_model=ProjectionResponse)
+async def project_portfolio(
+    portfolio_id: int,
+    request: ProjectionRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ProjectionResponse:
+    """Monte Carlo projection of a portfolio's future value distribution."""
+    try:
+        projection_service = ProjectionService(
+            db,
+            PortfolioBacktestService(redis_client=get_async_redis_client()),
+        )
+        return await projection_service.project_portfolio(
+            portfolio_id, request, current_user
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
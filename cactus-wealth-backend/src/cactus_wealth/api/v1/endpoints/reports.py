@@ -2,14 +2,129 @@
 Report management endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from cactus_wealth.core.report_storage import ReportStorage, get_report_storage
 from cactus_wealth.database import get_db
+from cactus_wealth.models import Client, User, UserRole
 from cactus_wealth.repositories import ReportRepository
+from cactus_wealth.schemas import BulkReportRequest, ReportJobRead, ReportResponse
+from cactus_wealth.security import get_current_user
+from cactus_wealth.services import ReportBatchService, ReportService
 
 router = APIRouter()
 
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _requested_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range Range header into inclusive (start, end) offsets.
+
+    Multi-range and malformed headers return None (full response, as RFC 9110
+    allows).
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    match = _RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None  # Invalid range-spec: ignored
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def _stored_report_response(
+    storage: ReportStorage, key: str, request: Request, filename: str
+) -> Response:
+    """
+    Stream a stored report, honouring Range, If-Range and If-None-Match.
+
+    A missing object, or a key the backend rejects (e.g. a legacy
+    ``./reports/x.pdf`` path), is a 404.
+    """
+    try:
+        stored = storage.stat(key) if key else None
+    except ValueError:
+        stored = None
+    if stored is None:
+        raise HTTPException(status_code=404, detail="Report file not found")
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": stored.etag,
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and stored.etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    start, end, status_code = 0, stored.size - 1, 200
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and stored.size and (if_range is None or if_range == stored.etag):
+        requested = _requested_range(range_header, stored.size)
+        if requested is not None:
+            start, end = requested
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+
+    headers["Content-Length"] = str(end - start + 1)
+    body = storage.iter_range(key, start, end) if stored.size else iter(())
+    return StreamingResponse(
+        body, status_code=status_code, media_type="application/pdf", headers=headers
+    )
+
+
+@router.post("/batch", response_model=ReportJobRead, status_code=202)
+async def enqueue_bulk_reports(
+    request: BulkReportRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ReportJobRead:
+    """
+    Queue report generation for the advisor's whole book (or the given clients).
+
+    Progress and the outcome are pushed over the notifications WebSocket
+    (report_job_progress / report_job_completed / report_job_failed) and stay
+    available from GET /batch/{job_id}.
+    """
+    job_service = ReportBatchService(db)
+    job = job_service.create_job(request, current_user)
+
+    await job_service.enqueue(job)
+
+    return job_service.to_read(job)
+
+
+@router.get("/batch/{job_id}", response_model=ReportJobRead)
+def get_bulk_report_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ReportJobRead:
+    """Get the status and, once completed, the outcome of a bulk report run."""
+    return ReportBatchService(db).get_job(job_id, current_user)
+
 
 @router.get("/reports")
 async def get_reports(db: Session = Depends(get_db)):
@@ -37,6 +152,45 @@ async def get_report(report_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/client/{client_id}/consolidated", response_model=ReportResponse)
+async def generate_client_report(
+    client_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ReportResponse:
+    """Generate one report covering all of a client's portfolios, accounts and policies."""
+    result = await ReportService(db, None).generate_client_report(client_id, current_user)
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.message)
+    return result
+
+
+@router.get("/{report_id}/download")
+def download_report(
+    report_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """
+    Download a report PDF from the configured storage backend.
+
+    The file is streamed in chunks; Range requests return 206 partial content
+    and the ETag supports conditional and resumed downloads.
+    """
+    report = ReportRepository(db).get_by_id(report_id)
+    client = db.get(Client, report.client_id) if report else None
+    if report is None or (
+        current_user.role not in (UserRole.ADMIN, UserRole.GOD)
+        and report.advisor_id != current_user.id
+        and (client is None or client.owner_id != current_user.id)
+    ):
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    filename = f"report_{report.client_id}_{report.generated_at:%Y%m%d}.pdf"
+    return _stored_report_response(get_report_storage(), report.file_path, request, filename)
+
+
 @router.get("/reports/client/{client_id}")
 async def get_client_reports(client_id: int, db: Session = Depends(get_db)):
     """Get all reports for a specific client."""
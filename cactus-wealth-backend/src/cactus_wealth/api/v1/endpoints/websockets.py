@@ -175,15 +175,13 @@ async def handle_client_message(data: dict, user_id: int, websocket: WebSocket):
         # El cliente solicita las últimas notificaciones
         try:
             from cactus_wealth.database import get_session
-            from cactus_wealth.repositories.notification_repository import (
-                NotificationRepository,
-            )
+            from cactus_wealth.services import NotificationService
 
             # Crear una sesión de base de datos para el WebSocket
             session = next(get_session())
             try:
-                notification_repo = NotificationRepository(session)
-                notifications = notification_repo.get_user_notifications(
+                notification_service = NotificationService(session)
+                notifications = notification_service.notification_repo.get_by_user_id(
                     user_id=user_id, limit=10
                 )
 
@@ -195,11 +193,12 @@ async def handle_client_message(data: dict, user_id: int, websocket: WebSocket):
                                 {
                                     "id": notification.id,
                                     "message": notification.message,
-                                    "read": notification.read,
+                                    "read": notification.is_read,
                                     "created_at": notification.created_at.isoformat(),
                                 }
                                 for notification in notifications
                             ],
+                            "unread": notification_service.unread_count(user_id),
                         }
                     )
                 )
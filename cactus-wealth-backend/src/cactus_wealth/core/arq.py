@@ -42,6 +42,33 @@ class ARQConfig:
                 await pool.close()
 
 
+    @staticmethod
+    async def enqueue_persisted_job(
+        function: str, job_id: str, redis_pool: ArqRedis | None = None
+    ) -> str:
+        """
+        Enqueue a worker function for a persisted job row (backtest, report, import).
+
+        The row id doubles as the ARQ job id, so a job cannot be queued twice.
+
+        Args:
+            function: Name of the worker function, e.g. ``run_backtest_job``
+            job_id: ID of the job row to run
+            redis_pool: Optional Redis pool. If None, a new one will be created.
+
+        Returns:
+            Job ID of the enqueued task
+        """
+        pool = redis_pool or await ARQConfig.get_redis_pool()
+
+        try:
+            await pool.enqueue_job(function, job_id, _job_id=job_id)
+            return job_id
+        finally:
+            if not redis_pool:  # Only close if we created the pool
+                await pool.close()
+
+
 # Example usage for FastAPI endpoints (future use)
 """
 from cactus_wealth.core.arq import ARQConfig
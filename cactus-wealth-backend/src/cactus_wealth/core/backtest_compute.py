@@ -0,0 +1,314 @@
+"""
+CPU-bound backtest math executed off the event loop.
+
+The aligned price matrix is handed to a process pool through shared memory, so
+only its name and shape are pickled on the way in; results come back as plain
+Python data ready for ``BacktestResponse``. With ``BACKTEST_PROCESS_WORKERS``
+set to 0 the same code runs in a thread instead.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .config import settings
+
+TRADING_DAYS = 252
+BASE_VALUE = 100.0
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the lazily created backtest process pool.
+
+    Returns:
+        Shared executor, or None when process offloading is disabled
+    """
+    global _process_pool
+
+    if settings.BACKTEST_PROCESS_WORKERS <= 0:
+        return None
+    if _process_pool is None:
+        # spawn: forking a process that runs an event loop and threadpool is unsafe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.BACKTEST_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the backtest process pool (application shutdown)."""
+    global _process_pool
+
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+    _process_pool = None
+
+
+def portfolio_daily_returns(prices: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Weighted daily portfolio returns for a (days x tickers) price matrix.
+
+    Gaps are forward/backward filled per ticker; the first day's return is 0.
+    """
+    filled = pd.DataFrame(prices).ffill().bfill()
+    returns = filled.pct_change().fillna(0.0).to_numpy()
+    return returns @ weights
+
+
+def rebalance_starts(
+    prices: np.ndarray,
+    dates_ns: np.ndarray,
+    weights: np.ndarray,
+    mode: str,
+    threshold: float = 0.05,
+) -> np.ndarray:
+    """
+    Row indices at which the portfolio is (re)set to its target weights.
+
+    Row 0 is always the first entry. ``daily`` rebalances every row (fixed
+    weights), ``none`` buys and holds, ``monthly``/``quarterly`` rebalance on the
+    first trading day of each calendar period and ``threshold`` whenever any
+    holding drifts more than ``threshold`` away from its target weight.
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    n_rows = len(prices)
+    if mode == "daily":
+        return np.arange(n_rows)
+    if mode == "none":
+        return np.zeros(1, dtype=np.int64)
+    if mode in ("monthly", "quarterly"):
+        months = dates_ns.view("M8[ns]").astype("M8[M]").astype(np.int64)
+        periods = months if mode == "monthly" else months // 3
+        return np.concatenate(([0], np.flatnonzero(np.diff(periods)) + 1))
+    if mode == "threshold":
+        return _threshold_rebalance_starts(prices, weights, threshold)
+    raise ValueError(f"Unknown rebalancing mode: {mode}")
+
+
+def _threshold_rebalance_starts(
+    prices: np.ndarray, weights: np.ndarray, threshold: float, window: int = TRADING_DAYS
+) -> np.ndarray:
+    # Path-dependent: each breach resets the drift, so scan forward one segment
+    # at a time, checking a whole window of days per vectorized step
+    starts = [0]
+    start, n_rows = 0, len(prices)
+    scan_from = 1
+    while scan_from < n_rows:
+        scan_to = min(scan_from + window, n_rows)
+        held = prices[scan_from:scan_to] / prices[start] * weights
+        drift = held / held.sum(axis=1, keepdims=True)
+        breached = np.flatnonzero(np.abs(drift - weights).max(axis=1) > threshold)
+        if breached.size:
+            start = scan_from + int(breached[0])
+            starts.append(start)
+            scan_from = start + 1
+        else:
+            scan_from = scan_to
+    return np.asarray(starts, dtype=np.int64)
+
+
+def rebalanced_values(
+    prices: np.ndarray,
+    weights: np.ndarray,
+    starts: np.ndarray,
+    cost_bps: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Portfolio values for weights reset at ``starts`` and left to drift in between.
+
+    Within a segment the value is a weighted sum of price growth since the
+    segment start; segment start values are a cumulative product of segment
+    growth net of rebalancing costs, so no per-day loop is needed.
+
+    Args:
+        prices: Gap-free (days x holdings) price matrix
+        weights: Target weights
+        starts: Rebalance rows from ``rebalance_starts``
+        cost_bps: Transaction cost in basis points of traded value
+
+    Returns:
+        Values (starting at BASE_VALUE) and the turnover of each rebalance
+    """
+    segment = np.zeros(len(prices), dtype=np.int64)
+    segment[starts[1:]] = 1
+    segment = np.cumsum(segment)
+
+    growth_in_segment = (prices / prices[starts[segment]]) @ weights
+
+    held = prices[starts[1:]] / prices[starts[:-1]] * weights
+    segment_growth = held.sum(axis=1)
+    drifted = held / segment_growth[:, None]
+    turnover = np.abs(drifted - weights).sum(axis=1)
+
+    start_values = BASE_VALUE * np.concatenate(
+        ([1.0], np.cumprod(segment_growth * (1 - turnover * cost_bps / 10_000)))
+    )
+    return start_values[segment] * growth_in_segment, turnover
+
+
+def compute_backtest(
+    prices: np.ndarray,
+    dates_ns: np.ndarray,
+    weights: np.ndarray,
+    benchmark_columns: dict[str, int],
+    rebalancing: str = "daily",
+    rebalance_threshold: float = 0.05,
+    transaction_cost_bps: float = 0.0,
+) -> dict[str, Any]:
+    """
+    Compute portfolio values, performance metrics and response data points.
+
+    Args:
+        prices: Aligned close prices, one row per day; the first ``len(weights)``
+            columns are the portfolio holdings
+        dates_ns: Row dates as epoch nanoseconds
+        weights: Portfolio weights
+        benchmark_columns: Benchmark ticker -> column in ``prices``
+        rebalancing: Rebalancing mode (see ``rebalance_starts``)
+        rebalance_threshold: Drift band for ``threshold`` rebalancing
+        transaction_cost_bps: Cost of rebalancing trades in basis points
+
+    Returns:
+        Dict with ``performance_metrics`` and ``data_points``
+    """
+    holdings = pd.DataFrame(prices[:, : len(weights)]).ffill().bfill().to_numpy()
+    starts = rebalance_starts(
+        holdings, dates_ns, weights, rebalancing, rebalance_threshold
+    )
+    values, turnover = rebalanced_values(
+        holdings, weights, starts, transaction_cost_bps
+    )
+
+    value_returns = pd.Series(values).pct_change()
+    mean_return = value_returns.mean()
+    volatility = value_returns.std()
+    running_max = np.maximum.accumulate(values)
+
+    performance_metrics = {
+        "total_return": float(values[-1] / BASE_VALUE - 1),
+        "annualized_return": float(mean_return * TRADING_DAYS),
+        "annualized_volatility": float(volatility * np.sqrt(TRADING_DAYS)),
+        "sharpe_ratio": float(
+            (mean_return / (volatility + 1e-9)) * np.sqrt(TRADING_DAYS)
+        ),
+        "max_drawdown": float((values / running_max - 1).min()),
+        "start_value": BASE_VALUE,
+        "end_value": float(values[-1]),
+        "rebalance_count": float(len(turnover)),
+        "turnover": float(turnover.sum()),
+    }
+
+    dates = np.datetime_as_string(dates_ns.view("M8[ns]"), unit="D").tolist()
+    benchmark_names = list(benchmark_columns)
+    benchmark_series = [
+        (BASE_VALUE * prices[:, col] / prices[0, col]).tolist()
+        for col in benchmark_columns.values()
+    ]
+
+    data_points = [
+        {
+            "date": date,
+            "portfolio_value": value,
+            "benchmark_values": dict(zip(benchmark_names, row, strict=True)),
+            "dividend_events": [],
+        }
+        for date, value, *row in zip(dates, values.tolist(), *benchmark_series, strict=True)
+    ]
+
+    return {"performance_metrics": performance_metrics, "data_points": data_points}
+
+
+def _compute_backtest_shared(
+    shm_name: str,
+    n_rows: int,
+    n_cols: int,
+    weights: np.ndarray,
+    benchmark_columns: dict[str, int],
+    **options: Any,
+) -> dict[str, Any]:
+    """Process-pool entry point: attach to the shared matrix and compute."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        dates_ns = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+        prices = np.ndarray(
+            (n_rows, n_cols), dtype=np.float64, buffer=shm.buf, offset=n_rows * 8
+        )
+        result = compute_backtest(
+            prices, dates_ns, weights, benchmark_columns, **options
+        )
+        # Views must be released before the segment can be closed
+        del dates_ns, prices
+        return result
+    finally:
+        shm.close()
+
+
+async def run_backtest_computation(
+    data: pd.DataFrame, weights: np.ndarray, benchmarks: list[str], **options: Any
+) -> dict[str, Any]:
+    """
+    Run ``compute_backtest`` for an aligned price frame without blocking the loop.
+
+    Args:
+        data: Close prices indexed by date; portfolio tickers first, in weight order
+        weights: Portfolio weights
+        benchmarks: Benchmark tickers to include in the data points
+        **options: Rebalancing options forwarded to ``compute_backtest``
+
+    Returns:
+        Result of ``compute_backtest``
+    """
+    columns = list(data.columns)
+    benchmark_columns = {b: columns.index(b) for b in benchmarks if b in columns}
+
+    index = pd.DatetimeIndex(data.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    dates_ns = index.asi8
+    prices = data.to_numpy(dtype=np.float64)
+
+    pool = get_process_pool()
+    if pool is None:
+        return await asyncio.to_thread(
+            partial(compute_backtest, prices, dates_ns, weights, benchmark_columns, **options)
+        )
+
+    n_rows, n_cols = prices.shape
+    shm = SharedMemory(create=True, size=max(1, n_rows * (n_cols + 1) * 8))
+    try:
+        shared_dates = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+        shared_prices = np.ndarray(
+            (n_rows, n_cols), dtype=np.float64, buffer=shm.buf, offset=n_rows * 8
+        )
+        shared_dates[:] = dates_ns
+        shared_prices[:] = prices
+        del shared_dates, shared_prices
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool,
+            partial(
+                _compute_backtest_shared,
+                shm.name,
+                n_rows,
+                n_cols,
+                weights,
+                benchmark_columns,
+                **options,
+            ),
+        )
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,91 @@
+"""
+Shared Redis clients for request-path caches.
+
+Caches are always best-effort: when Redis is unreachable the helpers return
+None and callers fall back to computing results directly.
+
+Async code paths must use ``get_async_redis_client`` so cache I/O never blocks
+the event loop; the synchronous client is only for sync contexts (threadpool
+endpoints, scripts, workers).
+"""
+
+import asyncio
+import time
+
+import redis
+import redis.asyncio as aioredis
+
+from .config import settings
+from .logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Seconds to wait before retrying a Redis server that failed to answer a ping
+REDIS_RETRY_INTERVAL = 30
+
+_redis_client: redis.Redis | None = None
+_redis_retry_at: float = 0.0
+
+# Async connections are bound to the loop that opened them
+_async_redis_client: aioredis.Redis | None = None
+_async_redis_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_redis_client() -> redis.Redis | None:
+    """
+    Get the process-wide synchronous Redis client.
+
+    Returns:
+        Connected Redis client (binary responses), or None if Redis is unavailable
+    """
+    global _redis_client, _redis_retry_at
+
+    if _redis_client is not None:
+        return _redis_client
+    if time.monotonic() < _redis_retry_at:
+        return None
+
+    try:
+        client = redis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
+        client.ping()
+    except Exception as e:
+        logger.warning("redis_unavailable", error=str(e))
+        _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        return None
+
+    _redis_client = client
+    return client
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    Get the process-wide asyncio Redis client backed by a shared connection pool.
+
+    Connections are opened lazily, so an unreachable server surfaces as errors on
+    individual commands, which callers treat as cache misses.
+
+    Returns:
+        Async Redis client (binary responses) for the running event loop
+    """
+    global _async_redis_client, _async_redis_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_redis_client is None or _async_redis_loop is not loop:
+        pool = aioredis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_connect_timeout=1,
+        )
+        _async_redis_client = aioredis.Redis(connection_pool=pool)
+        _async_redis_loop = loop
+    return _async_redis_client
+
+
+async def close_async_redis_client() -> None:
+    """Close the shared async Redis pool (application shutdown)."""
+    global _async_redis_client, _async_redis_loop
+
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+    _async_redis_client = None
+    _async_redis_loop = None
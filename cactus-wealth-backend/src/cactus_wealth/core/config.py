@@ -29,6 +29,37 @@ class Settings(BaseSettings):
     # Redis settings for caching
     REDIS_URL: str = "redis://redis:6379/0"
     REDIS_TTL: int = 300  # 5 minutes default TTL
+    REDIS_MAX_CONNECTIONS: int = 50  # shared async pool size per process
+    PRICE_CACHE_COMPRESS: bool = True  # zlib-compress cached price series
+    # Seconds before the in-process ticker index picks up assets added by other processes
+    ASSET_INDEX_TTL: int = 300
+    # Seconds before a cached unread notification count is recounted from the database
+    NOTIFICATION_COUNT_TTL: int = 3600
+    # Seconds a user's notification events are buffered before they are
+    # written (and pushed) as digests
+    NOTIFICATION_DIGEST_WINDOW: float = 30.0
+
+    # Backtest math runs in a process pool; 0 runs it in a thread instead
+    BACKTEST_PROCESS_WORKERS: int = 2
+    # Report PDFs render in a warm process pool; 0 renders in a thread instead
+    PDF_RENDER_WORKERS: int = 2
+
+    # Rendered report storage: "local" (REPORT_STORAGE_DIR) or "s3" (any
+    # S3-compatible service; credentials come from the standard AWS variables)
+    REPORT_STORAGE_BACKEND: str = "local"
+    REPORT_STORAGE_DIR: str = "./reports"
+    REPORT_S3_BUCKET: str = ""
+    REPORT_S3_PREFIX: str = "reports/"
+    REPORT_S3_ENDPOINT_URL: str | None = None
+    REPORT_S3_REGION: str = "us-east-1"
+
+    # Bulk uploads are parsed and upserted this many rows at a time
+    BULK_UPLOAD_CHUNK_SIZE: int = 1000
+    # Import files are staged here for the worker, next to their error reports;
+    # the API and worker processes must share this directory
+    IMPORT_STAGING_DIR: str = "./imports"
+    # Exports fetch rows from a server-side cursor this many at a time
+    EXPORT_BATCH_SIZE: int = 2000
 
     # Security settings
     # Must be provided via environment in production
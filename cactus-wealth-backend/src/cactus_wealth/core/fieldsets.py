@@ -0,0 +1,88 @@
+"""
+Sparse fieldsets for list endpoints: ``?fields=`` and ``?include=``.
+
+``fields`` is a comma-separated list of columns to return (``id`` is always
+returned). It is pushed into the SELECT, so only those columns are read and
+no ORM objects are built. ``include`` names the relations to embed; relations
+that are not named are not loaded at all. Endpoints return their full schema
+when neither parameter is given.
+"""
+
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from typing import Any
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlmodel import SQLModel
+
+
+def _names(value: str) -> list[str]:
+    return list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+
+def column_fields(schema: type[BaseModel], model: type[SQLModel]) -> list[str]:
+    """Fields of a read schema that are plain columns of the model."""
+    columns = model.__table__.columns.keys()  # type: ignore[attr-defined]
+    return [name for name in schema.model_fields if name in columns]
+
+
+def parse_fields(
+    fields: str | None, schema: type[BaseModel], model: type[SQLModel]
+) -> list[str]:
+    """
+    Columns requested by ``fields`` (all of the schema's columns if omitted).
+
+    Raises:
+        HTTPException: 400 if a field is not a column of the schema
+    """
+    allowed = column_fields(schema, model)
+    if fields is None:
+        return allowed
+    requested = _names(fields)
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return ["id", *(name for name in requested if name != "id")]
+
+
+def parse_include(include: str | None, allowed: Collection[str]) -> set[str]:
+    """
+    Relations requested by ``include``.
+
+    Raises:
+        HTTPException: 400 if a relation cannot be included
+    """
+    if include is None:
+        return set()
+    requested = _names(include)
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(unknown)}",
+        )
+    return set(requested)
+
+
+def dump_row(schema: type[BaseModel], row: Any, names: Sequence[str]) -> dict[str, Any]:
+    """JSON-ready dict of the named columns of a row, serialized as the schema would."""
+    values = {name: getattr(row, name) for name in names}
+    return schema.model_construct(**values).model_dump(mode="json", include=set(names))
+
+
+def group_by(items: Iterable[Any], key: str) -> Mapping[int, list[Any]]:
+    """Items grouped by a foreign key attribute."""
+    groups: dict[int, list[Any]] = defaultdict(list)
+    for item in items:
+        groups[getattr(item, key)].append(item)
+    return groups
+
+
+def sparse_response(content: Any) -> JSONResponse:
+    """Response for an already serialized sparse payload (skips response_model)."""
+    return JSONResponse(content=content)
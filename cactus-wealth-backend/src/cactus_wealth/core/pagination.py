@@ -0,0 +1,80 @@
+"""
+Keyset (cursor) pagination over (created_at, id), newest first.
+
+A cursor is the opaque, URL-safe encoding of the last row a page returned.
+The next page is "rows strictly older than that row", which a composite
+index on (..., created_at, id) answers without scanning the skipped rows and
+which stays consistent when new rows are inserted between requests.
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor pointing just after the given row."""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from e
+
+
+def keyset_page(
+    statement: Select,
+    created_at_column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Restrict a SELECT to one newest-first page.
+
+    One extra row is fetched so page_items can tell whether a next page exists.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(created_at_column, id_column) < tuple_(created_at, row_id)
+        )
+    return statement.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def page_items(rows: Sequence[T], limit: int) -> tuple[list[T], str | None]:
+    """Split the rows fetched by keyset_page into the page and the next cursor."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last: Any = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """Expose the next page's cursor (absent on the last page)."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
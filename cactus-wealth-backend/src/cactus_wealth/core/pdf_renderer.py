@@ -0,0 +1,100 @@
+"""
+PDF rendering pool for reports.
+
+WeasyPrint rendering is CPU-bound and slow to start: fonts must be discovered
+and the report stylesheet parsed. Renders therefore run in a dedicated process
+pool whose workers load the stylesheet and font configuration once, in their
+initializer, and reuse them for every document. ``render_pdf`` is the awaitable
+entry point; ``render_pdf_sync`` renders in the calling process.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .config import settings
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+REPORT_STYLESHEET = TEMPLATES_DIR / "styles.css"
+
+_render_pool: ProcessPoolExecutor | None = None
+
+
+@lru_cache(maxsize=1)
+def _warm_resources() -> tuple[Any, Any]:
+    """Parsed report stylesheet and font configuration, built once per process."""
+    from weasyprint import CSS  # type: ignore
+    from weasyprint.text.fonts import FontConfiguration  # type: ignore
+
+    font_config = FontConfiguration()
+    stylesheet = CSS(filename=str(REPORT_STYLESHEET), font_config=font_config)
+    return stylesheet, font_config
+
+
+def render_pdf_sync(html: str) -> bytes:
+    """
+    Render HTML to PDF in the current process with the warm report resources.
+
+    Raises:
+        ImportError: If WeasyPrint (or its system libraries) is not available
+    """
+    from weasyprint import HTML  # type: ignore
+
+    stylesheet, font_config = _warm_resources()
+    return HTML(string=html, base_url=str(TEMPLATES_DIR)).write_pdf(
+        stylesheets=[stylesheet], font_config=font_config
+    )
+
+
+def _init_render_worker() -> None:
+    # Pay the font discovery and CSS parsing cost when the worker starts
+    _warm_resources()
+
+
+def get_render_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the lazily created PDF rendering pool.
+
+    Returns:
+        Shared executor, or None when rendering runs in a thread instead
+    """
+    global _render_pool
+
+    if settings.PDF_RENDER_WORKERS <= 0:
+        return None
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+        )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the PDF rendering pool (application shutdown)."""
+    global _render_pool
+
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+    _render_pool = None
+
+
+async def render_pdf(html: str) -> bytes:
+    """
+    Render HTML to PDF without blocking the event loop.
+
+    Args:
+        html: Rendered report HTML (relative URLs resolve against the templates)
+
+    Returns:
+        PDF content as bytes
+    """
+    pool = get_render_pool()
+    if pool is None:
+        return await asyncio.to_thread(render_pdf_sync, html)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, render_pdf_sync, html)
@@ -0,0 +1,71 @@
+"""
+Compact binary encoding for daily close price series stored in Redis.
+
+Layout: a fixed header followed by two contiguous little-endian buffers, the
+int64 epoch-nanosecond dates and then the float64 closes. The body may be
+zlib-compressed. Decoding wraps the buffers with ``np.frombuffer`` so no
+per-element parsing happens.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+
+PRICE_SERIES_MAGIC = b"CWPS"
+PRICE_SERIES_VERSION = 1
+FLAG_ZLIB = 0x01
+
+# magic, version, flags, number of points
+_HEADER = struct.Struct("<4sBBI")
+
+
+def encode_price_series(series: pd.Series, compress: bool = True) -> bytes:
+    """
+    Encode a date-indexed price series as bytes.
+
+    Args:
+        series: Prices indexed by a DatetimeIndex (timezone info is dropped)
+        compress: Whether to zlib-compress the body
+
+    Returns:
+        Encoded payload
+    """
+    index = pd.DatetimeIndex(series.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    dates = np.ascontiguousarray(index.asi8, dtype="<i8")
+    prices = np.ascontiguousarray(series.to_numpy(dtype="<f8"))
+    body = dates.tobytes() + prices.tobytes()
+
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_ZLIB
+
+    return _HEADER.pack(PRICE_SERIES_MAGIC, PRICE_SERIES_VERSION, flags, len(series)) + body
+
+
+def decode_price_series(payload: bytes) -> pd.Series:
+    """
+    Decode a payload produced by ``encode_price_series``.
+
+    Raises:
+        ValueError: If the payload is not a supported price series encoding
+    """
+    if len(payload) < _HEADER.size:
+        raise ValueError("Price series payload is truncated")
+
+    magic, version, flags, length = _HEADER.unpack_from(payload)
+    if magic != PRICE_SERIES_MAGIC or version != PRICE_SERIES_VERSION:
+        raise ValueError("Unsupported price series payload")
+
+    body: bytes | memoryview = memoryview(payload)[_HEADER.size :]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    dates = np.frombuffer(body, dtype="<i8", count=length)
+    prices = np.frombuffer(body, dtype="<f8", count=length, offset=length * 8)
+    return pd.Series(prices, index=pd.DatetimeIndex(dates.view("M8[ns]")), copy=False)
@@ -0,0 +1,178 @@
+"""
+Storage backends for rendered report PDFs.
+
+Reports are stored under a key (``<content hash>.pdf``) that is recorded in
+``Report.file_path``. The local backend keeps them in a directory on this node;
+the S3 backend keeps them in a bucket of any S3-compatible service, so every
+API node can serve every report. Both expose byte ranges as chunk iterators so
+downloads never hold a whole file in memory.
+"""
+
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .config import settings
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class StoredReport:
+    """Metadata of a stored report object."""
+
+    key: str
+    size: int
+    etag: str  # Quoted, as sent in the ETag header
+
+
+class ReportStorage(ABC):
+    """Abstract base class for report storage backends."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """Store an object; readers never observe a partially written one."""
+
+    @abstractmethod
+    def stat(self, key: str) -> StoredReport | None:
+        """Metadata of a stored object, or None if it does not exist."""
+
+    @abstractmethod
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield bytes ``start`` through ``end`` (inclusive) of an object in chunks."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete an object if it exists."""
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+
+class LocalReportStorage(ReportStorage):
+    """Reports stored as files in a local directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        if not key or Path(key).name != key:
+            raise ValueError(f"Invalid report key: {key!r}")
+        return self.root / key
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def stat(self, key: str) -> StoredReport | None:
+        try:
+            st = self._path(key).stat()
+        except FileNotFoundError:
+            return None
+        return StoredReport(key=key, size=st.st_size, etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"')
+
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class S3ReportStorage(ReportStorage):
+    """
+    Reports stored in an S3-compatible bucket (AWS S3, MinIO, R2, ...).
+
+    The client only needs ``put_object``, ``head_object``, ``get_object`` and
+    ``delete_object``; by default a boto3 client for the configured endpoint.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any | None = None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=settings.REPORT_S3_ENDPOINT_URL or None,
+                region_name=settings.REPORT_S3_REGION,
+            )
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def put(self, key: str, data: bytes) -> None:
+        # Single PUTs are atomic: the object appears complete or not at all
+        self.client.put_object(
+            Bucket=self.bucket, Key=self._key(key), Body=data, ContentType="application/pdf"
+        )
+
+    def stat(self, key: str) -> StoredReport | None:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return StoredReport(key=key, size=head["ContentLength"], etag=head["ETag"])
+
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        response = self.client.get_object(
+            Bucket=self.bucket, Key=self._key(key), Range=f"bytes={start}-{end}"
+        )
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+@lru_cache(maxsize=1)
+def get_report_storage() -> ReportStorage:
+    """
+    Get the configured report storage backend.
+
+    Raises:
+        ValueError: If REPORT_STORAGE_BACKEND is unknown or S3 has no bucket
+    """
+    backend = settings.REPORT_STORAGE_BACKEND
+    if backend == "local":
+        return LocalReportStorage(settings.REPORT_STORAGE_DIR)
+    if backend == "s3":
+        if not settings.REPORT_S3_BUCKET:
+            raise ValueError("REPORT_S3_BUCKET must be set for the s3 report storage backend")
+        return S3ReportStorage(settings.REPORT_S3_BUCKET, settings.REPORT_S3_PREFIX)
+    raise ValueError(f"Unknown report storage backend: {backend}")
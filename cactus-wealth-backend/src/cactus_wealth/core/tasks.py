@@ -2,32 +2,46 @@ import structlog
 from sqlmodel import Session
 
 from cactus_wealth import services
-from cactus_wealth.core.dataprovider import MarketDataProvider
-from cactus_wealth.database import engine
-from cactus_wealth.repositories import ClientRepository
+from cactus_wealth.database import get_engine
 
 logger = structlog.get_logger(__name__)
 
 def get_db_session():
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
 
-async def create_all_snapshots():
-    """ARQ job to create portfolio snapshots for all clients."""
+async def create_all_snapshots(ctx) -> int:
+    """ARQ job to snapshot every portfolio and notify each owner once."""
     logger.info("Starting create_all_snapshots ARQ job")
     with next(get_db_session()) as db_session:
-        client_repo = ClientRepository(db_session)
-        portfolio_service = services.PortfolioService(db_session, MarketDataProvider())
-
-        all_clients = client_repo.get_all()
-        logger.info(f"Found {len(all_clients)} clients to process.")
-
-        for client in all_clients:
-            logger.info(f"Processing client {client.id}: {client.first_name} {client.last_name}")
-            for portfolio in client.portfolios:
-                try:
-                    portfolio_service.create_snapshot_for_portfolio(portfolio.id)
-                    logger.info(f"Snapshot created for portfolio {portfolio.id} of client {client.id}")
-                except Exception as e:
-                    logger.error(f"Failed to create snapshot for portfolio {portfolio.id} of client {client.id}: {e}")
-    logger.info("Finished create_all_snapshots ARQ job")
+        async with services.NotificationAggregator(db_session) as notifier:
+            created = await services.PortfolioSnapshotService(db_session).snapshot_all(notifier)
+    logger.info("Finished create_all_snapshots ARQ job", snapshots=created)
+    return created
+
+
+async def run_backtest_job(ctx, job_id: str) -> str:
+    """ARQ job to run a queued backtest and persist its result."""
+    logger.info("Starting run_backtest_job ARQ job", job_id=job_id)
+    with next(get_db_session()) as db_session:
+        await services.BacktestJobService(db_session).run_job(job_id)
+    logger.info("Finished run_backtest_job ARQ job", job_id=job_id)
+    return job_id
+
+
+async def run_report_job(ctx, job_id: str) -> str:
+    """ARQ job to generate a queued bulk report run."""
+    logger.info("Starting run_report_job ARQ job", job_id=job_id)
+    with next(get_db_session()) as db_session:
+        await services.ReportBatchService(db_session).run_job(job_id)
+    logger.info("Finished run_report_job ARQ job", job_id=job_id)
+    return job_id
+
+
+async def run_import_job(ctx, job_id: str) -> str:
+    """ARQ job to import a staged bulk import file."""
+    logger.info("Starting run_import_job ARQ job", job_id=job_id)
+    with next(get_db_session()) as db_session:
+        await services.BulkImportService(db_session).run_job(job_id)
+    logger.info("Finished run_import_job ARQ job", job_id=job_id)
+    return job_id
@@ -0,0 +1,212 @@
+"""
+In-process autocomplete index over the assets table.
+
+Ticker autocomplete fires on every keystroke, so it is answered from memory:
+sorted arrays of tickers and of normalized name tokens, searched with bisect.
+Results are ranked exact ticker > ticker prefix > name prefix > substring.
+
+The index is loaded on first use and kept current by session hooks that apply
+committed asset inserts, updates and deletes. Assets written by other
+processes are picked up every ASSET_INDEX_TTL seconds by loading rows with a
+higher id than any indexed one.
+"""
+
+import bisect
+import re
+import threading
+import time
+import unicodedata
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..models import Asset
+from ..schemas import AssetRead
+from .config import settings
+from .logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Rank tiers, best first
+EXACT_TICKER, TICKER_PREFIX, NAME_PREFIX, SUBSTRING = range(4)
+
+_PENDING_KEY = "ticker_index_pending"
+
+
+def normalize(text: str) -> str:
+    """Lower-case, accent-free form of a name or query."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def name_tokens(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", normalize(text))
+
+
+class TickerIndex:
+    """Ranked prefix search over asset tickers and names."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._assets: dict[int, AssetRead] = {}
+        self._tickers: list[tuple[str, int]] = []  # (TICKER, id), sorted
+        self._tokens: list[tuple[str, int]] = []  # (name token, id), sorted
+        self._names: dict[int, str] = {}  # id -> normalized name
+        self._max_id = 0
+        self._loaded = False
+        self._checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def ensure_loaded(self, session: Session) -> None:
+        """Load the index on first use, then top it up once per ASSET_INDEX_TTL."""
+        if self._loaded and time.monotonic() - self._checked_at < settings.ASSET_INDEX_TTL:
+            return
+        statement = select(Asset)
+        if self._loaded:
+            statement = statement.where(Asset.id > self._max_id)
+        assets = session.exec(statement).all()
+        with self._lock:
+            for asset in assets:
+                self._put(AssetRead.model_validate(asset))
+            first_load = not self._loaded
+            self._loaded = True
+            self._checked_at = time.monotonic()
+        if first_load:
+            logger.info("ticker_index_loaded", assets=len(self._assets))
+
+    def reset(self) -> None:
+        """Drop everything; the next search reloads from the database."""
+        with self._lock:
+            self._clear()
+
+    def apply(self, upserted: Iterable[AssetRead], deleted_ids: Iterable[int] = ()) -> None:
+        """Apply committed asset changes to a loaded index."""
+        with self._lock:
+            if not self._loaded:
+                return  # The first load will read them
+            for asset_id in deleted_ids:
+                self._remove(asset_id)
+            for asset in upserted:
+                self._put(asset)
+
+    def search(self, query: str, limit: int = 10) -> list[AssetRead]:
+        """Best-ranked assets for a ticker or name fragment."""
+        ticker = query.strip().upper()
+        if not ticker:
+            return []
+        with self._lock:
+            return self._search(ticker, query, limit)
+
+    def _search(self, ticker: str, query: str, limit: int) -> list[AssetRead]:
+        terms = name_tokens(query)
+        ranks: dict[int, int] = {}
+
+        def offer(asset_id: int, rank: int) -> None:
+            if rank < ranks.get(asset_id, SUBSTRING + 1):
+                ranks[asset_id] = rank
+
+        for symbol, asset_id in self._prefixed(self._tickers, ticker):
+            offer(asset_id, EXACT_TICKER if symbol == ticker else TICKER_PREFIX)
+
+        if terms:
+            # Every query term must prefix some token of the name
+            matches: set[int] | None = None
+            for term in terms:
+                ids = {asset_id for _, asset_id in self._prefixed(self._tokens, term)}
+                matches = ids if matches is None else matches & ids
+            for asset_id in matches or ():
+                offer(asset_id, NAME_PREFIX)
+
+        if len(ranks) < limit:
+            needle = normalize(query.strip())
+            for symbol, asset_id in self._tickers:
+                if asset_id not in ranks and (
+                    ticker in symbol or needle in self._names.get(asset_id, "")
+                ):
+                    offer(asset_id, SUBSTRING)
+
+        best = sorted(
+            ranks,
+            key=lambda asset_id: (
+                ranks[asset_id],
+                len(self._assets[asset_id].ticker_symbol),
+                self._assets[asset_id].ticker_symbol,
+            ),
+        )
+        return [self._assets[asset_id] for asset_id in best[:limit]]
+
+    @staticmethod
+    def _prefixed(entries: list[tuple[str, int]], prefix: str) -> list[tuple[str, int]]:
+        start = bisect.bisect_left(entries, (prefix, -1))
+        end = bisect.bisect_left(entries, (prefix + "\uffff", -1), lo=start)
+        return entries[start:end]
+
+    def _put(self, asset: AssetRead) -> None:
+        self._remove(asset.id)
+        self._assets[asset.id] = asset
+        self._names[asset.id] = normalize(asset.name)
+        bisect.insort(self._tickers, (asset.ticker_symbol.upper(), asset.id))
+        for token in set(name_tokens(asset.name)):
+            bisect.insort(self._tokens, (token, asset.id))
+        self._max_id = max(self._max_id, asset.id)
+
+    def _remove(self, asset_id: int) -> None:
+        asset = self._assets.pop(asset_id, None)
+        if asset is None:
+            return
+        self._names.pop(asset_id, None)
+        self._discard(self._tickers, (asset.ticker_symbol.upper(), asset_id))
+        for token in set(name_tokens(asset.name)):
+            self._discard(self._tokens, (token, asset_id))
+
+    @staticmethod
+    def _discard(entries: list[tuple[str, int]], entry: tuple[str, int]) -> None:
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+
+ticker_index = TickerIndex()
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _collect_asset_changes(session: Any, flush_context: Any) -> None:
+    """Remember flushed asset changes until the transaction commits."""
+    changed = [obj for obj in (*session.new, *session.dirty) if isinstance(obj, Asset)]
+    deleted = [obj.id for obj in session.deleted if isinstance(obj, Asset)]
+    if changed or deleted:
+        pending = session.info.setdefault(_PENDING_KEY, ({}, set()))
+        for asset in changed:
+            try:
+                # Snapshot now: committed instances are expired
+                pending[0][asset.id] = AssetRead.model_validate(asset)
+            except ValueError as e:
+                logger.warning("ticker_index_update_failed", error=str(e))
+                ticker_index.reset()
+        pending[1].update(deleted)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _apply_asset_changes(session: Any) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    changed, deleted = pending
+    try:
+        ticker_index.apply(changed.values(), deleted)
+    except Exception as e:  # The index must never break a commit
+        logger.warning("ticker_index_update_failed", error=str(e))
+        ticker_index.reset()
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _drop_asset_changes(session: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
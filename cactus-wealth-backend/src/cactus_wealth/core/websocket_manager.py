@@ -5,12 +5,15 @@ Gestiona conexiones WebSocket en tiempo real para notificaciones push,
 actualizaciones de KPIs y comunicación bidireccional con el frontend.
 """
 
+import asyncio
+import contextlib
 import json
 from datetime import datetime
 from typing import Any
 
 from fastapi import WebSocket
 
+from .cache import get_async_redis_client
 from .logging_config import get_structured_logger
 
 logger = get_structured_logger(__name__)
@@ -238,3 +241,61 @@ class ConnectionManager:
 
 # Instancia global del connection manager
 connection_manager = ConnectionManager()
+
+
+# Canal Redis para entregar mensajes publicados desde otros procesos (workers ARQ)
+WS_RELAY_CHANNEL = "ws:relay"
+WS_RELAY_RETRY_SECONDS = 5
+
+
+async def publish_user_message(
+    message: dict[str, Any], user_id: int, redis_client: Any | None = None
+) -> None:
+    """
+    Publica un mensaje para un usuario desde cualquier proceso.
+
+    Los procesos de la API lo reenvían a las conexiones locales del usuario
+    mediante ``relay_published_messages``.
+
+    Args:
+        message: Diccionario con el mensaje a enviar
+        user_id: ID del usuario destinatario
+        redis_client: Cliente Redis async opcional (por defecto el pool compartido)
+    """
+    client = redis_client or get_async_redis_client()
+    await client.publish(
+        WS_RELAY_CHANNEL,
+        json.dumps({"user_id": user_id, "message": message}, default=str),
+    )
+
+
+async def relay_published_messages(manager: ConnectionManager = connection_manager) -> None:
+    """
+    Reenvía a los WebSockets locales los mensajes publicados en Redis.
+
+    Se ejecuta como tarea de fondo en cada proceso de la API y se reconecta
+    automáticamente si Redis no está disponible.
+    """
+    while True:
+        pubsub = None
+        try:
+            pubsub = get_async_redis_client().pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(WS_RELAY_CHANNEL)
+            async for item in pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                envelope = json.loads(item["data"])
+                # Cada proceso recibe todo; solo entrega a sus propias conexiones
+                if envelope["user_id"] in manager.active_connections:
+                    await manager.send_personal_message(
+                        envelope["message"], envelope["user_id"]
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("websocket_relay_error", error=str(e))
+            await asyncio.sleep(WS_RELAY_RETRY_SECONDS)
+        finally:
+            if pubsub is not None:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
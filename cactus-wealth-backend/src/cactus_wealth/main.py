@@ -1,12 +1,19 @@
 """
 Main FastAPI application entry point.
 """
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from cactus_wealth.api.v1.api import api_router
+from cactus_wealth.core.backtest_compute import shutdown_process_pool
+from cactus_wealth.core.cache import close_async_redis_client
 from cactus_wealth.core.config import settings
 from cactus_wealth.core.logging_config import configure_structured_logging
+from cactus_wealth.core.pdf_renderer import shutdown_render_pool
+from cactus_wealth.core.websocket_manager import relay_published_messages
 from cactus_wealth.database import create_tables
 
 # from cactus_wealth.core.middleware import (
@@ -52,6 +59,19 @@ async def on_startup() -> None:
         except Exception:
             # Best-effort: avoid crashing app on start if concurrent creates
             pass
+    # Deliver WebSocket messages published by background workers
+    app.state.ws_relay_task = asyncio.create_task(relay_published_messages())
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    relay_task = getattr(app.state, "ws_relay_task", None)
+    if relay_task is not None:
+        relay_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await relay_task
+    await close_async_redis_client()
+    shutdown_process_pool()
+    shutdown_render_pool()
 
 @app.get("/")
 async def root():
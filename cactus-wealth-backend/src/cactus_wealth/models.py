@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Enum, Index, LargeBinary
+from sqlalchemy import Column, DateTime, Enum, Index, LargeBinary, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -242,6 +242,12 @@ class Client(SQLModel, table=True):
         Index(
             "ix_clients_email_owner", "email", "owner_id"
         ),  # Composite index for auth queries
+        Index(
+            "ix_clients_owner_created_id", "owner_id", "created_at", "id"
+        ),  # Keyset pagination of client lists
+        Index(
+            "ix_clients_referred_by_client_id", "referred_by_client_id"
+        ),  # Referral tree walks
     )
 
 
@@ -269,8 +275,8 @@ class ClientActivity(SQLModel, table=True):
         Index("ix_client_activities_created_at", "created_at"),
         Index("ix_client_activities_type", "activity_type"),
         Index(
-            "ix_client_activities_client_created", "client_id", "created_at"
-        ),  # Composite index for timeline queries
+            "ix_client_activities_client_created_id", "client_id", "created_at", "id"
+        ),  # Composite index for keyset-paginated timeline queries
     )
 
 
@@ -302,8 +308,8 @@ class ClientNote(SQLModel, table=True):
         Index("ix_client_notes_created_at", "created_at"),
         Index("ix_client_notes_updated_at", "updated_at"),
         Index(
-            "ix_client_notes_client_created", "client_id", "created_at"
-        ),  # Composite index for recent notes
+            "ix_client_notes_client_created_id", "client_id", "created_at", "id"
+        ),  # Composite index for keyset-paginated recent notes
     )
 
 
@@ -439,6 +445,8 @@ class Report(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     file_path: str = Field(max_length=500)
     report_type: str = Field(max_length=50, default="PORTFOLIO_SUMMARY")
+    # SHA-256 of the report inputs; reports with equal hashes share one stored PDF
+    content_hash: str | None = Field(default=None, max_length=64)
     generated_at: datetime = Field(
         default_factory=datetime.utcnow, sa_column=Column(DateTime, nullable=False)
     )
@@ -454,6 +462,10 @@ class Report(SQLModel, table=True):
         Index(
             "ix_reports_client_advisor", "client_id", "advisor_id"
         ),  # Composite index for report queries
+        Index(
+            "ix_reports_client_generated_id", "client_id", "generated_at", "id"
+        ),  # Client timeline pages
+        Index("ix_reports_content_hash", "content_hash"),
     )
 
 
@@ -485,6 +497,12 @@ class InvestmentAccount(SQLModel, table=True):
         Index(
             "ix_investment_accounts_client_platform", "client_id", "platform"
         ),  # Composite index for account queries
+        Index(
+            "uq_investment_accounts_client_account",
+            "client_id",
+            "account_number",
+            unique=True,
+        ),  # Conflict target for bulk upload upserts
     )
 
 
@@ -540,7 +558,11 @@ class Notification(SQLModel, table=True):
         Index("ix_notifications_user_id", "user_id"),
         Index("ix_notifications_is_read", "is_read"),
         Index("ix_notifications_created_at", "created_at"),
-        Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_user_created_id", "user_id", "created_at", "id"),
+        # Unread counts and the unread inbox, newest first
+        Index(
+            "ix_notifications_user_read_created_id", "user_id", "is_read", "created_at", "id"
+        ),
     )
 
 
@@ -640,3 +662,53 @@ class ManagerChangeRequest(SQLModel, table=True):
         Index("ix_manager_change_requests_advisor_id", "advisor_id"),
         Index("ix_manager_change_requests_status", "status"),
     )
+
+
+class JobBase(SQLModel):
+    """Columns shared by persisted background jobs run through ARQ."""
+
+    id: str = Field(primary_key=True, max_length=64)  # Also the ARQ job id
+    user_id: int = Field(foreign_key="users.id")
+    status: str = Field(default="QUEUED", max_length=20)  # QUEUED | RUNNING | COMPLETED | FAILED
+    progress: int = Field(default=0)  # 0-100
+    result: str | None = Field(default=None, sa_type=Text, nullable=True)  # Result schema JSON
+    error: str | None = Field(default=None, max_length=1000)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_type=DateTime, nullable=False)
+    completed_at: datetime | None = Field(default=None, sa_type=DateTime, nullable=True)
+
+
+class BacktestJob(JobBase, table=True):
+    """Asynchronous backtest run and its persisted result."""
+
+    __tablename__ = "backtest_jobs"
+
+    request: str = Field(sa_type=Text, nullable=False)  # BacktestRequest JSON
+
+    __table_args__ = (
+        Index("ix_backtest_jobs_user_created", "user_id", "created_at"),
+    )
+
+
+class ReportJob(JobBase, table=True):
+    """Asynchronous bulk report run over an advisor's book."""
+
+    __tablename__ = "report_jobs"
+
+    request: str = Field(sa_type=Text, nullable=False)  # BulkReportRequest JSON
+
+    __table_args__ = (
+        Index("ix_report_jobs_user_created", "user_id", "created_at"),
+    )
+
+
+class ImportJob(JobBase, table=True):
+    """Asynchronous bulk import of a staged CSV/Excel file covering many clients."""
+
+    __tablename__ = "import_jobs"
+
+    kind: str = Field(max_length=30)  # investment_accounts | insurance_policies | clients
+    filename: str = Field(max_length=255)  # Original upload name
+
+    __table_args__ = (
+        Index("ix_import_jobs_user_created", "user_id", "created_at"),
+    )
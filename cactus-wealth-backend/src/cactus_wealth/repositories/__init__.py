@@ -15,7 +15,9 @@ from .model_portfolio_repository import ModelPortfolioRepository
 from .note_repository import NoteRepository
 from .notification_repository import NotificationRepository
 from .portfolio_repository import PortfolioRepository
+from .referral_repository import ReferralRepository
 from .report_repository import ReportRepository
+from .timeline_repository import TimelineRepository
 from .user_repository import UserRepository
 
 __all__ = [
@@ -31,4 +33,6 @@ __all__ = [
     "NoteRepository",
     "InvestmentAccountRepository",
     "InsurancePolicyRepository",
+    "ReferralRepository",
+    "TimelineRepository",
 ]
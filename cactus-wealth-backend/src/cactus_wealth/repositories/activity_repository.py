@@ -1,5 +1,6 @@
 from sqlmodel import Session, select
 
+from ..core.pagination import keyset_page, page_items
 from ..models import ClientActivity
 from .base_repository import BaseRepository
 
@@ -12,8 +13,21 @@ class ActivityRepository(BaseRepository[ClientActivity]):
         statement = (
             select(ClientActivity)
             .where(ClientActivity.client_id == client_id)
-            .order_by(ClientActivity.created_at.desc())
+            .order_by(ClientActivity.created_at.desc(), ClientActivity.id.desc())
             .limit(limit)
             .offset(offset)
         )
         return list(self.session.exec(statement).all())
+
+    def get_page_by_client_id(
+        self, client_id: int, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[ClientActivity], str | None]:
+        """Keyset-paginated activities of a client, newest first, plus the next cursor."""
+        statement = keyset_page(
+            select(ClientActivity).where(ClientActivity.client_id == client_id),
+            ClientActivity.created_at,
+            ClientActivity.id,
+            limit,
+            cursor,
+        )
+        return page_items(self.session.exec(statement).all(), limit)
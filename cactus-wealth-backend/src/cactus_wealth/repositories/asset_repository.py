@@ -3,8 +3,8 @@ Asset repository for managing financial assets.
 """
 
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlmodel import Session, select
 
 from cactus_wealth.models import Asset
 
@@ -29,19 +29,21 @@ class AssetRepository(BaseRepository[Asset]):
         """Get all assets of a specific type."""
         return self.db.query(Asset).filter(Asset.asset_type == asset_type).all()
 
-    def search_assets(self, query: str, client_id: int | None = None) -> list[Asset]:
-        """Search assets by name or symbol."""
-        filters = [
-            or_(
-                Asset.name.ilike(f"%{query}%"),
-                Asset.symbol.ilike(f"%{query}%")
-            )
-        ]
-
-        if client_id:
-            filters.append(Asset.client_id == client_id)
-
-        return self.db.query(Asset).filter(and_(*filters)).all()
+    def search_assets(self, query: str, limit: int = 10) -> list[Asset]:
+        """
+        Search assets by ticker or name straight from the database.
+
+        Request paths should prefer core.ticker_index, which answers the same
+        question from memory.
+        """
+        pattern = f"%{query}%"
+        statement = (
+            select(Asset)
+            .where(or_(Asset.ticker_symbol.ilike(pattern), Asset.name.ilike(pattern)))
+            .order_by(Asset.ticker_symbol)
+            .limit(limit)
+        )
+        return list(self.session.exec(statement).all())
 
     def get_total_value_by_portfolio(self, portfolio_id: int) -> float:
         """Calculate total value of all assets in a portfolio."""
@@ -2,8 +2,10 @@
 Base repository class providing common database operations.
 """
 
-from typing import Generic, TypeVar
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
 
+from sqlalchemy import Row
 from sqlmodel import Session, SQLModel, func, select
 
 T = TypeVar("T", bound=SQLModel)
@@ -68,6 +70,33 @@ class BaseRepository(Generic[T]):
         statement = select(self.model_class).offset(skip).limit(limit)
         return list(self.session.exec(statement).all())
 
+    def get_columns(
+        self, names: Sequence[str], *criteria: Any, skip: int = 0, limit: int = 100
+    ) -> list[Row]:
+        """
+        Rows of only the named columns, in primary key order.
+
+        Used for sparse list projections: no ORM objects or relations are loaded.
+
+        Args:
+            names: Column names to select
+            criteria: Optional WHERE clauses
+            skip: Number of rows to skip
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of rows with attribute access by column name
+        """
+        model: Any = self.model_class
+        statement = (
+            select(*(getattr(model, name) for name in names))
+            .where(*criteria)
+            .order_by(model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(self.session.exec(statement).all())
+
     def create(self, entity: T) -> T:
         """
         Create a new entity in the database.
@@ -2,18 +2,81 @@
 Client repository for client-related database operations.
 """
 
+import re
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from sqlalchemy import Float, Row, case, literal, literal_column, or_
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import ColumnElement
 from sqlmodel import Session, func, select
 
+from ..core.pagination import keyset_page, page_items
 from ..models import (
     Client,
     ClientStatus,
     InsurancePolicy,
     InvestmentAccount,
+    User,
     UserRole,
 )
 from ..schemas import ClientCreate, ClientUpdate
 from .base_repository import BaseRepository
+from .referral_repository import ReferralRepository
+
+# Text search configuration. 'simple' does no stemming, which suits names,
+# emails and phone numbers, and keeps the query side identical to the index
+# expressions created in the add_client_search_indexes migration.
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+def _joined(*columns: ColumnElement) -> ColumnElement:
+    """Space-joined text of nullable columns."""
+    expression: ColumnElement = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        expression = expression + " " + func.coalesce(column, "")
+    return expression
+
+
+def client_full_name() -> ColumnElement:
+    return Client.first_name + " " + Client.last_name
+
+
+def client_search_document() -> ColumnElement:
+    """
+    Weighted tsvector of a client: names (A), contact and portfolio (B), notes (C).
+
+    Must stay in sync with ix_clients_search_document.
+    """
+    return (
+        func.setweight(
+            func.to_tsvector(SEARCH_CONFIG, _joined(Client.first_name, Client.last_name)),
+            literal_column("'A'"),
+        ).op("||")(
+            func.setweight(
+                func.to_tsvector(
+                    SEARCH_CONFIG, _joined(Client.email, Client.phone, Client.portfolio_name)
+                ),
+                literal_column("'B'"),
+            )
+        ).op("||")(
+            func.setweight(
+                func.to_tsvector(SEARCH_CONFIG, _joined(Client.notes, Client.live_notes)),
+                literal_column("'C'"),
+            )
+        )
+    )
+
+
+def search_terms(query: str) -> list[str]:
+    """Lower-cased word tokens of a search query."""
+    return re.findall(r"[^\W_]+", query.lower())
+
+
+def substring_pattern(text: str) -> str:
+    """LIKE pattern matching ``text`` literally anywhere; escape character is backslash."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class ClientRepository(BaseRepository[Client]):
@@ -33,6 +96,24 @@ class ClientRepository(BaseRepository[Client]):
             statement = statement.where(Client.owner_id == owner_id)
         return self.session.exec(statement).first()
 
+    def visible_owner_ids(self, user: User) -> list[int] | None:
+        """
+        Owner IDs whose clients a user may see in book-wide views.
+
+        ADMIN and GOD see every client (None), a MANAGER sees their own and
+        their advisors' clients, and advisors see only their own.
+        """
+        if user.role in (UserRole.ADMIN, UserRole.GOD):
+            return None
+        if user.role == UserRole.MANAGER:
+            advisor_ids = self.session.exec(
+                select(User.id).where(
+                    User.manager_id == user.id, User.role == UserRole.ADVISOR
+                )
+            ).all()
+            return [user.id, *advisor_ids]
+        return [user.id]
+
     def get_by_email(self, email: str) -> Client | None:
         """
         Get a client by email address.
@@ -84,15 +165,188 @@ class ClientRepository(BaseRepository[Client]):
             .options(
                 selectinload(Client.investment_accounts),
                 selectinload(Client.insurance_policies),
+                selectinload(Client.referred_clients),
             )
             .offset(skip)
             .limit(limit)
-            .order_by(Client.created_at.desc())
+            .order_by(Client.created_at.desc(), Client.id.desc())
         )
         if user_role != UserRole.GOD:
             statement = statement.where(Client.owner_id == owner_id)
         return list(self.session.exec(statement).all())
 
+    def get_clients_page(
+        self,
+        owner_id: int,
+        limit: int = 100,
+        cursor: str | None = None,
+        user_role: UserRole | None = None,
+    ) -> tuple[list[Client], str | None]:
+        """
+        Keyset-paginated client list, newest first. GOD can see all clients.
+
+        Returns:
+            The page of clients and the cursor of the next page (None on the last)
+        """
+        statement = select(Client).options(
+            selectinload(Client.investment_accounts),
+            selectinload(Client.insurance_policies),
+            selectinload(Client.referred_clients),
+        )
+        if user_role != UserRole.GOD:
+            statement = statement.where(Client.owner_id == owner_id)
+        statement = keyset_page(statement, Client.created_at, Client.id, limit, cursor)
+        return page_items(self.session.exec(statement).all(), limit)
+
+    def get_client_rows(
+        self,
+        owner_id: int,
+        names: Sequence[str],
+        limit: int = 100,
+        cursor: str | None = None,
+        skip: int = 0,
+        user_role: UserRole | None = None,
+    ) -> tuple[list[Row], str | None]:
+        """
+        Sparse client list: only the named columns, newest first.
+
+        Keyset-paginated like get_clients_page unless a legacy offset (skip)
+        is given without a cursor.
+
+        Returns:
+            The page of rows and the cursor of the next page (None on the last)
+        """
+        columns = [getattr(Client, name) for name in names]
+        # The cursor is built from created_at and id
+        for required in (Client.id, Client.created_at):
+            if required.key not in names:
+                columns.append(required)
+        statement = select(*columns)
+        if user_role != UserRole.GOD:
+            statement = statement.where(Client.owner_id == owner_id)
+        if skip and not cursor:
+            statement = statement.order_by(Client.created_at.desc(), Client.id.desc())
+            return list(self.session.exec(statement.offset(skip).limit(limit)).all()), None
+        statement = keyset_page(statement, Client.created_at, Client.id, limit, cursor)
+        return page_items(self.session.exec(statement).all(), limit)
+
+    def get_related(
+        self, client_ids: Sequence[int], include: Collection[str]
+    ) -> dict[str, list[Any]]:
+        """
+        Load only the requested relations of a page of clients, one query each.
+
+        Args:
+            client_ids: IDs of the clients on the page
+            include: Any of investment_accounts, insurance_policies, referred_clients
+
+        Returns:
+            Related rows per relation name
+        """
+        statements = {
+            "investment_accounts": select(InvestmentAccount)
+            .where(InvestmentAccount.client_id.in_(client_ids))
+            .order_by(InvestmentAccount.id),
+            "insurance_policies": select(InsurancePolicy)
+            .where(InsurancePolicy.client_id.in_(client_ids))
+            .order_by(InsurancePolicy.id),
+            "referred_clients": select(Client)
+            .where(Client.referred_by_client_id.in_(client_ids))
+            .order_by(Client.id),
+        }
+        if not client_ids:
+            return {name: [] for name in include}
+        return {name: list(self.session.exec(statements[name]).all()) for name in include}
+
+    def search_clients(
+        self, query: str, owner_ids: list[int] | None, limit: int = 20
+    ) -> list:
+        """
+        Ranked search over client names, email, phone, portfolio name and notes.
+
+        On PostgreSQL every query term must prefix-match the weighted tsvector,
+        or the whole query must be trigram-similar to the full name, or (as
+        typed) be a substring of the email or phone (all GIN-indexed). Elsewhere (SQLite
+        tests) every term must be a substring of one of the fields.
+
+        Args:
+            query: Free-text query
+            owner_ids: Owners whose clients are visible (None for all)
+            limit: Maximum number of results
+
+        Returns:
+            Rows of client columns plus ``rank``, best match first
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        phrase = " ".join(terms)
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            document = client_search_document()
+            ts_query = func.to_tsquery(
+                SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms)
+            )
+            full_name = client_full_name()
+            # Email and phone match the query as typed: search terms drop @ . - +
+            substring = substring_pattern(query.strip())
+            match = or_(
+                document.op("@@")(ts_query),
+                full_name.op("%")(phrase),
+                Client.email.ilike(substring, escape="\\"),
+                Client.phone.ilike(substring, escape="\\"),
+            )
+            rank = func.ts_rank(document, ts_query) + func.similarity(full_name, phrase)
+        else:
+            haystack = func.lower(
+                _joined(
+                    Client.first_name,
+                    Client.last_name,
+                    Client.email,
+                    Client.phone,
+                    Client.portfolio_name,
+                    Client.notes,
+                    Client.live_notes,
+                )
+            )
+            match = haystack.contains(terms[0])
+            for term in terms[1:]:
+                match = match & haystack.contains(term)
+            name = func.lower(client_full_name())
+            rank = case(
+                (or_(func.lower(Client.email) == phrase, name == phrase), 4.0),
+                (
+                    or_(
+                        func.lower(Client.first_name).startswith(terms[0]),
+                        func.lower(Client.last_name).startswith(terms[0]),
+                    ),
+                    3.0,
+                ),
+                (name.contains(terms[0]), 2.0),
+                (func.lower(Client.email).contains(terms[0]), 1.5),
+                else_=literal(1.0, Float),
+            )
+
+        statement = (
+            select(
+                Client.id,
+                Client.first_name,
+                Client.last_name,
+                Client.email,
+                Client.phone,
+                Client.status,
+                Client.portfolio_name,
+                Client.owner_id,
+                rank.label("rank"),
+            )
+            .where(match)
+            .order_by(literal_column("rank").desc(), Client.id)
+            .limit(limit)
+        )
+        if owner_ids is not None:
+            statement = statement.where(Client.owner_id.in_(owner_ids))
+        return list(self.session.exec(statement).all())
+
     def get_with_products(self, client_id: int) -> Client | None:
         """
         Get a client with all financial products (accounts and policies) loaded.
@@ -246,12 +500,22 @@ class ClientRepository(BaseRepository[Client]):
         owner_id: int,
         user_role: UserRole | None = None,
     ) -> Client | None:
-        """Update an existing client if the user has access."""
+        """
+        Update an existing client if the user has access.
+
+        Raises:
+            ValueError: If the new referrer would make the referral tree cyclic
+        """
         client = self.get_client(client_id=client_id, owner_id=owner_id, user_role=user_role)
         if client is None:
             return None
 
         update_dict = client_update.model_dump(exclude_unset=True)
+        referrer_id = update_dict.get("referred_by_client_id")
+        if referrer_id is not None and ReferralRepository(self.session).would_create_cycle(
+            client_id, referrer_id
+        ):
+            raise ValueError("A client cannot be referred by itself or by its own referrals")
         for key, value in update_dict.items():
             setattr(client, key, value)
 
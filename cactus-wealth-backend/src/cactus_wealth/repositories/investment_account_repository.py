@@ -16,9 +16,17 @@ class InvestmentAccountRepository(BaseRepository[InvestmentAccount]):
     def __init__(self, session: Session):
         super().__init__(session, InvestmentAccount)
 
-    def get_by_client_id(self, client_id: int) -> list[InvestmentAccount]:
-        """Get all investment accounts for a specific client."""
-        statement = select(InvestmentAccount).where(InvestmentAccount.client_id == client_id)
+    def get_by_client_id(
+        self, client_id: int, skip: int = 0, limit: int | None = None
+    ) -> list[InvestmentAccount]:
+        """Get a client's investment accounts in primary key order, optionally paged."""
+        statement = (
+            select(InvestmentAccount)
+            .where(InvestmentAccount.client_id == client_id)
+            .order_by(InvestmentAccount.id)
+            .offset(skip)
+            .limit(limit)
+        )
         return list(self.session.exec(statement).all())
 
     def get_by_account_type(self, account_type: str) -> list[InvestmentAccount]:
@@ -1,5 +1,6 @@
 from sqlmodel import Session, select
 
+from ..core.pagination import keyset_page, page_items
 from ..models import ClientNote
 from .base_repository import BaseRepository
 
@@ -12,6 +13,19 @@ class NoteRepository(BaseRepository[ClientNote]):
         statement = select(ClientNote).where(ClientNote.client_id == client_id)
         return list(self.session.exec(statement).all())
 
+    def get_page_by_client_id(
+        self, client_id: int, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[ClientNote], str | None]:
+        """Keyset-paginated notes of a client, newest first, plus the next cursor."""
+        statement = keyset_page(
+            select(ClientNote).where(ClientNote.client_id == client_id),
+            ClientNote.created_at,
+            ClientNote.id,
+            limit,
+            cursor,
+        )
+        return page_items(self.session.exec(statement).all(), limit)
+
     # Convenience wrappers for BaseRepository semantics expected in endpoints
     def get_by_id(self, note_id: int) -> ClientNote | None:  # type: ignore[override]
         return super().get_by_id(note_id)
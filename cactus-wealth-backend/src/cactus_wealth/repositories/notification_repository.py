@@ -2,12 +2,21 @@
 Notification repository for notification-related database operations.
 """
 
-from sqlmodel import Session, select
+from collections.abc import Collection
+from typing import Any
 
+from sqlalchemy import update
+from sqlmodel import Session, func, select
+
+from ..core.pagination import keyset_page, page_items
 from ..models import Notification
 from .base_repository import BaseRepository
 
 
+def _unread(user_id: int) -> Any:
+    return (Notification.user_id == user_id) & Notification.is_read.is_(False)
+
+
 class NotificationRepository(BaseRepository[Notification]):
     """Repository for Notification-related database operations."""
 
@@ -28,29 +37,56 @@ class NotificationRepository(BaseRepository[Notification]):
         statement = (
             select(Notification)
             .where(Notification.user_id == user_id)
-            .order_by(Notification.created_at.desc())
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
             .limit(limit)
         )
         return list(self.session.exec(statement).all())
 
-    def get_unread_by_user_id(self, user_id: int) -> list[Notification]:
+    def get_unread_by_user_id(self, user_id: int, limit: int = 50) -> list[Notification]:
         """
-        Get all unread notifications for a specific user.
+        Get the unread notifications for a specific user.
 
         Args:
             user_id: The user's ID
+            limit: Maximum number of notifications to return
 
         Returns:
             List of unread notifications for the user (newest first)
         """
         statement = (
             select(Notification)
-            .where(Notification.user_id == user_id)
-            .where(not Notification.is_read)
-            .order_by(Notification.created_at.desc())
+            .where(_unread(user_id))
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
+            .limit(limit)
         )
         return list(self.session.exec(statement).all())
 
+    def get_page(
+        self,
+        user_id: int,
+        limit: int = 10,
+        cursor: str | None = None,
+        unread_only: bool = False,
+    ) -> tuple[list[Notification], str | None]:
+        """
+        One newest-first page of a user's inbox.
+
+        Both variants are read off the (user_id, is_read, created_at, id) or
+        (user_id, created_at, id) index.
+
+        Returns:
+            Notifications and the cursor of the next page (None on the last)
+        """
+        criterion = _unread(user_id) if unread_only else Notification.user_id == user_id
+        statement = keyset_page(
+            select(Notification).where(criterion),
+            Notification.created_at,
+            Notification.id,
+            limit,
+            cursor,
+        )
+        return page_items(self.session.exec(statement).all(), limit)
+
     def mark_as_read(self, notification_id: int) -> Notification | None:
         """
         Mark a notification as read.
@@ -67,37 +103,68 @@ class NotificationRepository(BaseRepository[Notification]):
             return self.update(notification)
         return None
 
-    def mark_all_as_read_for_user(self, user_id: int) -> int:
+    def set_read_for_user(
+        self, user_id: int, notification_ids: Collection[int], is_read: bool = True
+    ) -> int:
         """
-        Mark all notifications as read for a user.
+        Mark some of a user's notifications as read (or unread) with one UPDATE.
 
-        Args:
-            user_id: The user's ID
+        Notifications of other users and those already in that state are left
+        alone, so the result is exactly how much the unread count changed.
 
         Returns:
             Number of notifications updated
         """
-        unread_notifications = self.get_unread_by_user_id(user_id)
-        count = 0
+        if not notification_ids:
+            return 0
+        statement = (
+            update(Notification)
+            .where(
+                Notification.user_id == user_id,
+                Notification.id.in_(notification_ids),
+                Notification.is_read.is_(not is_read),
+            )
+            .values(is_read=is_read)
+            .execution_options(synchronize_session=False)
+        )
+        updated = self.session.exec(statement).rowcount
+        if updated:
+            self.session.commit()
+        return updated
 
-        for notification in unread_notifications:
-            notification.is_read = True
-            self.session.add(notification)
-            count += 1
+    def mark_all_as_read_for_user(self, user_id: int, up_to_id: int | None = None) -> int:
+        """
+        Mark all notifications as read for a user with one UPDATE.
 
-        if count > 0:
-            self.session.commit()
+        Args:
+            user_id: The user's ID
+            up_to_id: Only mark notifications up to this id, so ones that
+                arrived after the user last looked stay unread
 
-        return count
+        Returns:
+            Number of notifications updated
+        """
+        statement = update(Notification).where(_unread(user_id))
+        if up_to_id is not None:
+            statement = statement.where(Notification.id <= up_to_id)
+        updated = self.session.exec(
+            statement.values(is_read=True).execution_options(synchronize_session=False)
+        ).rowcount
+        if updated:
+            self.session.commit()
+        return updated
 
     def count_unread_for_user(self, user_id: int) -> int:
         """
         Count unread notifications for a user.
 
+        Counted in the database from the (user_id, is_read, ...) index.
+
         Args:
             user_id: The user's ID
 
         Returns:
             Number of unread notifications
         """
-        return len(self.get_unread_by_user_id(user_id))
+        statement = select(func.count()).select_from(Notification).where(_unread(user_id))
+        return self.session.exec(statement).one()
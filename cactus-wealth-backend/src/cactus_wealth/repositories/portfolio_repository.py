@@ -3,12 +3,14 @@ Portfolio repository for managing investment portfolios.
 """
 
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 
 from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
-from ..models import Client, Portfolio, PortfolioSnapshot
+from ..models import Client, Portfolio, PortfolioSnapshot, Position
 from .base_repository import BaseRepository
 
 
@@ -22,6 +24,18 @@ class PortfolioRepository(BaseRepository[Portfolio]):
         """Get all portfolios for a specific client."""
         return list(self.session.exec(select(Portfolio).where(Portfolio.client_id == client_id)).all())
 
+    def get_positions(self, portfolio_ids: Sequence[int]) -> list[Position]:
+        """Positions (with their assets) of several portfolios in one query."""
+        if not portfolio_ids:
+            return []
+        statement = (
+            select(Position)
+            .where(Position.portfolio_id.in_(portfolio_ids))
+            .options(selectinload(Position.asset))
+            .order_by(Position.id)
+        )
+        return list(self.session.exec(statement).all())
+
     def get_by_advisor_id(self, advisor_id: int) -> list[Portfolio]:
         """Get all portfolios managed by a specific advisor."""
         return list(self.session.exec(select(Portfolio).where(Portfolio.advisor_id == advisor_id)).all())
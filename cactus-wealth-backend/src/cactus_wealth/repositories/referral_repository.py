@@ -0,0 +1,229 @@
+"""
+Referral graph queries over Client.referred_by_client_id.
+
+Every question is answered by one recursive CTE in the database instead of
+walking relationships in Python (one query per node). Walks only pass through
+clients whose owner is in ``owner_ids`` (None means every owner), and stop at
+MAX_REFERRAL_DEPTH so that corrupt data with a cycle cannot recurse forever.
+"""
+
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import Row, case, literal, true
+from sqlmodel import Session, func, select
+
+from ..models import Client, InvestmentAccount
+from .base_repository import BaseRepository
+
+MAX_REFERRAL_DEPTH = 50
+
+
+def _visible(owner_ids: list[int] | None) -> Any:
+    return Client.owner_id.in_(owner_ids) if owner_ids is not None else true()
+
+
+def client_aum() -> Any:
+    """Total investment account AUM per client."""
+    return (
+        select(
+            InvestmentAccount.client_id,
+            func.sum(InvestmentAccount.aum).label("aum"),
+        )
+        .group_by(InvestmentAccount.client_id)
+        .subquery("client_aum")
+    )
+
+
+def downline_cte(client_id: int, owner_ids: list[int] | None) -> Any:
+    """(id, depth) of every client referred by client_id, directly or not."""
+    downline = (
+        select(Client.id, literal(1).label("depth"))
+        .where(Client.referred_by_client_id == client_id, _visible(owner_ids))
+        .cte("downline", recursive=True)
+    )
+    return downline.union_all(
+        select(Client.id, downline.c.depth + 1)
+        .join(downline, Client.referred_by_client_id == downline.c.id)
+        .where(downline.c.depth < MAX_REFERRAL_DEPTH, _visible(owner_ids))
+    )
+
+
+def referral_pairs_cte(owner_ids: list[int] | None) -> Any:
+    """(ancestor_id, descendant_id, depth) for every referral path in the book."""
+    pairs = (
+        select(
+            Client.referred_by_client_id.label("ancestor_id"),
+            Client.id.label("descendant_id"),
+            literal(1).label("depth"),
+        )
+        .where(Client.referred_by_client_id.is_not(None), _visible(owner_ids))
+        .cte("referral_pairs", recursive=True)
+    )
+    return pairs.union_all(
+        select(pairs.c.ancestor_id, Client.id, pairs.c.depth + 1)
+        .join(pairs, Client.referred_by_client_id == pairs.c.descendant_id)
+        .where(pairs.c.depth < MAX_REFERRAL_DEPTH, _visible(owner_ids))
+    )
+
+
+class ReferralRepository(BaseRepository[Client]):
+    """Repository for referral tree queries."""
+
+    def __init__(self, session: Session):
+        super().__init__(session, Client)
+
+    def get_chain(self, client_id: int, owner_ids: list[int] | None = None) -> list[Row]:
+        """
+        Referrers of a client, from its direct referrer up to the root.
+
+        Returns:
+            Rows of id, first_name, last_name, status and depth (1 = direct referrer)
+        """
+        chain = (
+            select(Client.id, Client.referred_by_client_id, literal(0).label("depth"))
+            .where(Client.id == client_id)
+            .cte("referral_chain", recursive=True)
+        )
+        chain = chain.union_all(
+            select(Client.id, Client.referred_by_client_id, chain.c.depth + 1)
+            .join(chain, Client.id == chain.c.referred_by_client_id)
+            .where(chain.c.depth < MAX_REFERRAL_DEPTH, _visible(owner_ids))
+        )
+        statement = (
+            select(
+                Client.id,
+                Client.first_name,
+                Client.last_name,
+                Client.status,
+                func.min(chain.c.depth).label("depth"),
+            )
+            .join(chain, chain.c.id == Client.id)
+            .where(chain.c.depth > 0)
+            .group_by(Client.id, Client.first_name, Client.last_name, Client.status)
+            .order_by("depth")
+        )
+        return list(self.session.exec(statement).all())
+
+    def get_downline(self, client_id: int, owner_ids: list[int] | None = None) -> list[Row]:
+        """
+        Every client referred by a client, directly or through others.
+
+        Returns:
+            Rows of id, first_name, last_name, status, referred_by_client_id,
+            depth (1 = direct referral) and aum, shallowest first
+        """
+        downline = downline_cte(client_id, owner_ids)
+        nodes = (
+            select(downline.c.id, func.min(downline.c.depth).label("depth"))
+            .group_by(downline.c.id)
+            .subquery()
+        )
+        aum = client_aum()
+        statement = (
+            select(
+                Client.id,
+                Client.first_name,
+                Client.last_name,
+                Client.status,
+                Client.referred_by_client_id,
+                nodes.c.depth,
+                func.coalesce(aum.c.aum, 0).label("aum"),
+            )
+            .join(nodes, nodes.c.id == Client.id)
+            .outerjoin(aum, aum.c.client_id == Client.id)
+            .order_by(nodes.c.depth, Client.id)
+        )
+        return list(self.session.exec(statement).all())
+
+    def get_referrer_stats(
+        self, owner_ids: list[int] | None = None, limit: int = 50
+    ) -> list[Row]:
+        """
+        Downline size and attributed AUM of every referrer in the book.
+
+        Returns:
+            Rows of id, first_name, last_name, direct_referrals, downline_size,
+            depth and attributed_aum, by attributed AUM descending
+        """
+        pairs = referral_pairs_cte(owner_ids)
+        # One row per (ancestor, descendant) even if bad data repeats a path
+        paths = (
+            select(
+                pairs.c.ancestor_id,
+                pairs.c.descendant_id,
+                func.min(pairs.c.depth).label("depth"),
+            )
+            .group_by(pairs.c.ancestor_id, pairs.c.descendant_id)
+            .subquery()
+        )
+        aum = client_aum()
+        stats = (
+            select(
+                paths.c.ancestor_id,
+                func.sum(case((paths.c.depth == 1, 1), else_=0)).label("direct_referrals"),
+                func.count().label("downline_size"),
+                func.max(paths.c.depth).label("depth"),
+                func.coalesce(func.sum(aum.c.aum), 0).label("attributed_aum"),
+            )
+            .outerjoin(aum, aum.c.client_id == paths.c.descendant_id)
+            .group_by(paths.c.ancestor_id)
+            .subquery()
+        )
+        statement = (
+            select(
+                Client.id,
+                Client.first_name,
+                Client.last_name,
+                stats.c.direct_referrals,
+                stats.c.downline_size,
+                stats.c.depth,
+                stats.c.attributed_aum,
+            )
+            .join(stats, stats.c.ancestor_id == Client.id)
+            .where(_visible(owner_ids))
+            .order_by(stats.c.attributed_aum.desc(), Client.id)
+            .limit(limit)
+        )
+        return list(self.session.exec(statement).all())
+
+    def would_create_cycle(self, client_id: int, referred_by_client_id: int) -> bool:
+        """Whether making referred_by_client_id the client's referrer closes a loop."""
+        if referred_by_client_id == client_id:
+            return True
+        downline = downline_cte(client_id, None)
+        statement = select(downline.c.id).where(downline.c.id == referred_by_client_id).limit(1)
+        return self.session.exec(statement).first() is not None
+
+    def find_cycles(self, client_ids: Collection[int]) -> set[int]:
+        """
+        Which of the given clients are their own (indirect) referrer.
+
+        Run after a batch of referrer changes has been written to find every
+        changed client that ended up on a loop, including loops closed only by
+        several changes of the same batch together.
+        """
+        if not client_ids:
+            return set()
+        chain = (
+            select(
+                Client.id.label("start_id"),
+                Client.referred_by_client_id.label("ancestor_id"),
+                literal(1).label("depth"),
+            )
+            .where(Client.id.in_(client_ids), Client.referred_by_client_id.is_not(None))
+            .cte("referrer_walk", recursive=True)
+        )
+        chain = chain.union_all(
+            select(chain.c.start_id, Client.referred_by_client_id, chain.c.depth + 1)
+            .join(chain, Client.id == chain.c.ancestor_id)
+            .where(
+                Client.referred_by_client_id.is_not(None),
+                chain.c.ancestor_id != chain.c.start_id,
+                chain.c.depth < MAX_REFERRAL_DEPTH,
+            )
+        )
+        statement = (
+            select(chain.c.start_id).where(chain.c.ancestor_id == chain.c.start_id).distinct()
+        )
+        return set(self.session.exec(statement).all())
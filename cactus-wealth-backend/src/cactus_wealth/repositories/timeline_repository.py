@@ -0,0 +1,142 @@
+"""
+Client timeline: activities, notes, reports and account events in one stream.
+
+Each source contributes at most one page of rows, read newest first through its
+(client_id, timestamp, id) index with the cursor pushed down. The database then
+merges those short runs with UNION ALL under the shared (created_at, id) sort
+key, so a page costs the same no matter how long the client's history is.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Integer, String, cast, func, literal, null, tuple_, union_all
+from sqlmodel import Session, select
+
+from ..core.pagination import decode_cursor, keyset_page, page_items
+from ..models import ClientActivity, ClientNote, InvestmentAccount, Report
+
+# Event ids are source_id * SOURCE_SLOTS + source code, unique across sources
+SOURCE_SLOTS = 8
+SOURCE_CODES = {
+    "activity": 0,
+    "note": 1,
+    "report": 2,
+    "account_opened": 3,
+    "account_updated": 4,
+}
+
+# Longest note excerpt included in an event
+NOTE_EXCERPT = 500
+
+
+def _branch(
+    kind: str,
+    source_id: Any,
+    created_at: Any,
+    title: Any,
+    detail: Any,
+    actor_id: Any,
+    *criteria: Any,
+    limit: int,
+    after: tuple[datetime, int] | None,
+) -> Any:
+    """
+    One page of a source's events as
+    (id, created_at, kind, source_id, title, detail, actor_id), newest first.
+
+    The cursor is applied to the source's own (timestamp, id) so the page is
+    read straight off its index.
+    """
+    code = SOURCE_CODES[kind]
+    statement = select(
+        (source_id * SOURCE_SLOTS + code).label("id"),
+        created_at.label("created_at"),
+        literal(kind).label("kind"),
+        source_id.label("source_id"),
+        cast(title, String).label("title"),
+        cast(detail, String).label("detail"),
+        cast(actor_id, Integer).label("actor_id"),
+    ).where(*criteria)
+    if after is not None:
+        after_created_at, after_event_id = after
+        # source_id * SOURCE_SLOTS + code < after_event_id, solved for source_id
+        id_bound = (after_event_id - code - 1) // SOURCE_SLOTS + 1
+        statement = statement.where(
+            tuple_(created_at, source_id) < tuple_(after_created_at, id_bound)
+        )
+    return statement.order_by(created_at.desc(), source_id.desc()).limit(limit + 1).subquery()
+
+
+class TimelineRepository:
+    """Repository for the merged, keyset-paginated client timeline."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_page(
+        self, client_id: int, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[Any], str | None]:
+        """
+        One page of a client's timeline, newest first.
+
+        Returns:
+            Event rows and the cursor of the next page (None on the last)
+        """
+        page = {"limit": limit, "after": decode_cursor(cursor) if cursor else None}
+        runs = [
+            _branch(
+                "activity",
+                ClientActivity.id,
+                ClientActivity.created_at,
+                ClientActivity.activity_type,
+                ClientActivity.description,
+                ClientActivity.created_by,
+                ClientActivity.client_id == client_id,
+                **page,
+            ),
+            _branch(
+                "note",
+                ClientNote.id,
+                ClientNote.created_at,
+                ClientNote.title,
+                func.substr(ClientNote.content, 1, NOTE_EXCERPT),
+                ClientNote.created_by,
+                ClientNote.client_id == client_id,
+                **page,
+            ),
+            _branch(
+                "report",
+                Report.id,
+                Report.generated_at,
+                Report.report_type,
+                null(),
+                Report.advisor_id,
+                Report.client_id == client_id,
+                **page,
+            ),
+            _branch(
+                "account_opened",
+                InvestmentAccount.id,
+                InvestmentAccount.created_at,
+                InvestmentAccount.platform,
+                InvestmentAccount.account_number,
+                null(),
+                InvestmentAccount.client_id == client_id,
+                **page,
+            ),
+            _branch(
+                "account_updated",
+                InvestmentAccount.id,
+                InvestmentAccount.updated_at,
+                InvestmentAccount.platform,
+                InvestmentAccount.account_number,
+                null(),
+                InvestmentAccount.client_id == client_id,
+                InvestmentAccount.updated_at > InvestmentAccount.created_at,
+                **page,
+            ),
+        ]
+        merged = union_all(*(select(*run.c) for run in runs)).subquery("timeline")
+        statement = keyset_page(select(*merged.c), merged.c.created_at, merged.c.id, limit)
+        return page_items(self.session.exec(statement).all(), limit)
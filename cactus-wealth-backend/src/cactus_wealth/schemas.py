@@ -1,8 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from cactus_wealth.models import (
     ActivityType,
@@ -112,6 +112,82 @@ class ClientRead(BaseModel):
         from_attributes = True
 
 
+class ClientSearchHit(BaseModel):
+    """Schema for one ranked client search result."""
+
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    phone: str | None
+    status: ClientStatus
+    portfolio_name: str | None
+    owner_id: int
+    rank: float
+
+    class Config:
+        from_attributes = True
+
+
+# Bulk Client Schemas
+MAX_BULK_CLIENTS = 1000
+
+
+class ClientBulkCreate(BaseModel):
+    """Schema for creating many clients in one request."""
+
+    items: list[ClientCreate] = Field(min_length=1, max_length=MAX_BULK_CLIENTS)
+
+
+class ClientBulkUpdateItem(ClientUpdate):
+    """Changes to one client of a bulk update; unset fields are left as is."""
+
+    id: int
+
+
+class ClientBulkUpdate(BaseModel):
+    """Schema for updating many clients in one request."""
+
+    items: list[ClientBulkUpdateItem] = Field(min_length=1, max_length=MAX_BULK_CLIENTS)
+
+
+class ClientBulkStatus(BaseModel):
+    """Schema for moving many clients to one pipeline status."""
+
+    client_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_CLIENTS)
+    status: ClientStatus
+
+
+class ClientBulkReassign(BaseModel):
+    """Schema for moving many clients to another owner."""
+
+    client_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_CLIENTS)
+    owner_id: int
+
+
+class ClientBulkDelete(BaseModel):
+    """Schema for deleting many clients."""
+
+    client_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_CLIENTS)
+
+
+class ClientBulkError(BaseModel):
+    """Item of a bulk request that was not applied and why."""
+
+    # Position of the item in the request
+    index: int
+    client_id: int | None = None
+    reason: str
+
+
+class ClientBulkResult(BaseModel):
+    """Outcome of a bulk client request."""
+
+    # Ids of the clients written, in request order
+    client_ids: list[int] = []
+    errors: list[ClientBulkError] = []
+
+
 class UserRead(BaseModel):
     """Schema for reading user data (without sensitive information)."""
 
@@ -201,7 +277,7 @@ class ClientActivityRead(BaseModel):
     client_id: int
     activity_type: ActivityType
     description: str
-    extra_data: str | None
+    extra_data: str | None = None
     created_at: datetime
     created_by: int
 
@@ -313,6 +389,7 @@ class ReportRead(BaseModel):
     generated_at: datetime
     file_path: str
     report_type: str
+    content_hash: str | None = None
 
     class Config:
         from_attributes = True
@@ -327,6 +404,70 @@ class ReportResponse(BaseModel):
     file_path: str | None = None
 
 
+class BulkReportRequest(BaseModel):
+    """Schema for generating reports across an advisor's book in one run."""
+
+    # None means every client in the advisor's book
+    client_ids: list[int] | None = None
+    report_type: str = "CLIENT_CONSOLIDATED"
+
+
+class BulkReportSkip(BaseModel):
+    """Client left out of a bulk report run and why."""
+
+    client_id: int
+    reason: str
+
+
+class BulkReportResult(BaseModel):
+    """Outcome of a bulk report run."""
+
+    generated: int
+    # Reports whose identical PDF already existed and was not re-rendered
+    reused: int = 0
+    report_ids: list[int] = []
+    skipped: list[BulkReportSkip] = []
+
+
+class JobRead(BaseModel):
+    """Fields shared by the read schemas of persisted background jobs."""
+
+    id: str
+    status: str  # QUEUED | RUNNING | COMPLETED | FAILED
+    progress: int
+    error: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
+
+
+class ReportJobRead(JobRead):
+    """Schema for an asynchronous bulk report job and its stored result."""
+
+    result: BulkReportResult | None = None
+
+
+ImportKind = Literal["investment_accounts", "insurance_policies", "clients"]
+
+
+class ImportJobResult(BaseModel):
+    """Outcome of a bulk import job."""
+
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    invalid: int = 0
+    # A per-row error report is available from GET /imports/{job_id}/errors
+    has_error_report: bool = False
+
+
+class ImportJobRead(JobRead):
+    """Schema for an asynchronous bulk import job and its stored result."""
+
+    kind: ImportKind
+    filename: str
+    result: ImportJobResult | None = None
+
+
 # Investment Account Schemas
 class InvestmentAccountCreate(BaseModel):
     """Schema for creating a new investment account."""
@@ -450,6 +591,12 @@ class NotificationUpdate(BaseModel):
     is_read: bool | None = None
 
 
+class NotificationUnreadCount(BaseModel):
+    """Schema for the unread notification badge."""
+
+    unread: int
+
+
 # Model Portfolio Schemas
 class ModelPortfolioCreate(BaseModel):
     """Schema for creating a new model portfolio."""
@@ -556,6 +703,11 @@ class PortfolioComposition(BaseModel):
     ticker: str
     weight: float  # As decimal (0.0 to 1.0)
 
+    @field_validator("ticker")
+    @classmethod
+    def normalize_ticker(cls, value: str) -> str:
+        return value.strip().upper()
+
 
 class BacktestRequest(BaseModel):
     """Schema for portfolio backtesting request."""
@@ -563,6 +715,17 @@ class BacktestRequest(BaseModel):
     composition: list[PortfolioComposition]
     benchmarks: list[str] = ["SPY"]  # Default benchmark
     period: str = "1y"  # 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
+    # daily keeps fixed weights; none is buy-and-hold; threshold rebalances on drift
+    rebalancing: Literal["daily", "none", "monthly", "quarterly", "threshold"] = "daily"
+    rebalance_threshold: float = Field(default=0.05, gt=0, lt=1)  # Max weight drift
+    transaction_cost_bps: float = Field(default=0.0, ge=0, le=1000)
+
+    @field_validator("benchmarks")
+    @classmethod
+    def normalize_benchmarks(cls, value: list[str]) -> list[str]:
+        # Same form as composition tickers, so price lookups, cache keys and
+        # the benchmark_values of the response all agree
+        return [benchmark.strip().upper() for benchmark in value]
 
 
 class BacktestDataPoint(BaseModel):
@@ -588,6 +751,47 @@ class BacktestResponse(BaseModel):
         from_attributes = True
 
 
+class BacktestJobRead(JobRead):
+    """Schema for an asynchronous backtest job and its stored result."""
+
+    result: BacktestResponse | None = None
+
+
+class ProjectionRequest(BaseModel):
+    """Schema for a Monte Carlo projection of a portfolio or client."""
+
+    horizon_years: int = Field(default=10, ge=1, le=50)
+    n_paths: int = Field(default=10000, ge=100, le=100000)
+    method: Literal["bootstrap", "parametric"] = "bootstrap"
+    history_period: str = "5y"  # yfinance period used to estimate returns
+    monthly_contribution: float | None = None  # Defaults to the client's savings_capacity
+    percentiles: list[float] = [5, 25, 50, 75, 95]
+    seed: int | None = None
+
+
+class ProjectionBand(BaseModel):
+    """Projected value distribution at the end of a given year."""
+
+    year: int
+    mean: float
+    percentiles: dict[str, float]  # {"p5": 98000.0, "p50": 120000.0, ...}
+
+
+class ProjectionResponse(BaseModel):
+    """Schema for Monte Carlo projection results."""
+
+    client_id: int
+    portfolio_ids: list[int]
+    initial_value: float
+    monthly_contribution: float
+    horizon_years: int
+    n_paths: int
+    method: str
+    seed: int
+    loss_probability: float  # Share of paths ending below the amount invested
+    bands: list[ProjectionBand]
+
+
 class ClientNoteCreate(BaseModel):
     client_id: int
     title: str
@@ -612,6 +816,104 @@ class ClientNoteRead(BaseModel):
         from_attributes = True
 
 
+# Client Overview Schemas
+class ClientReferral(BaseModel):
+    """Schema for a client on either side of a referral."""
+
+    id: int
+    first_name: str
+    last_name: str
+    status: ClientStatus
+
+    class Config:
+        from_attributes = True
+
+
+class ReferralNode(ClientReferral):
+    """Schema for a client in a referral chain or downline."""
+
+    depth: int
+    referred_by_client_id: int | None = None
+    aum: Decimal | None = None
+
+
+class ClientReferrals(BaseModel):
+    """Schema for a client's position in the referral tree."""
+
+    client_id: int
+    # Direct referrer first, up to the root
+    chain: list[ReferralNode]
+    # Everyone referred directly or indirectly, shallowest first
+    downline: list[ReferralNode]
+    downline_size: int
+    attributed_aum: Decimal
+
+
+class ReferrerStats(BaseModel):
+    """Schema for a referrer's downline size and the AUM it brought in."""
+
+    id: int
+    first_name: str
+    last_name: str
+    direct_referrals: int
+    downline_size: int
+    depth: int
+    attributed_aum: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class PortfolioOverview(BaseModel):
+    """Schema for a portfolio with its latest snapshot value."""
+
+    id: int
+    name: str
+    current_value: Decimal
+    updated_at: datetime
+    latest_snapshot_value: Decimal | None = None
+    latest_snapshot_at: datetime | None = None
+
+
+class ClientOverview(BaseModel):
+    """Schema for everything the client detail page shows, in one payload."""
+
+    client: ClientRead
+    portfolios: list[PortfolioOverview]
+    investment_accounts: list[InvestmentAccountRead]
+    insurance_policies: list[InsurancePolicyRead]
+    total_aum: Decimal
+    recent_activities: list[ClientActivityRead]
+    recent_notes: list[ClientNoteRead]
+    latest_report: ReportRead | None = None
+    referred_by: ClientReferral | None = None
+    referred_clients: list[ClientReferral]
+    # Changes whenever anything shown here changes; also the cache key
+    version: str
+
+
+# Client Timeline Schemas
+TimelineEventKind = Literal[
+    "activity", "note", "report", "account_opened", "account_updated"
+]
+
+
+class TimelineEvent(BaseModel):
+    """Schema for one entry of the merged client timeline."""
+
+    # Unique across sources; source_id is the id of the underlying row
+    id: int
+    kind: TimelineEventKind
+    source_id: int
+    created_at: datetime
+    title: str | None = None
+    detail: str | None = None
+    actor_id: int | None = None
+
+    class Config:
+        from_attributes = True
+
+
 # Google Auth Schemas
 class GoogleUser(BaseModel):
     """Schema for Google user information."""
@@ -1,14 +1,24 @@
 """Services package for Cactus Wealth application."""
 
+from .backtest_job_service import BacktestJobService
+from .bulk_import_service import BulkImportService
+from .client_bulk_service import ClientBulkService
+from .client_overview_service import ClientOverviewService
 from .dashboard_service import DashboardService
 from .insurance_policy_service import InsurancePolicyService
 from .investment_account_service import InvestmentAccountService
+from .notification_aggregator import NotificationAggregator
+from .notification_service import NotificationService
 from .portfolio_backtest_service import PortfolioBacktestService  # type: ignore
+from .portfolio_snapshot_service import PortfolioSnapshotService
+from .projection_service import ProjectionService
+from .report_batch_service import ReportBatchService
 
 # Backwards-compat: test suites import these names from services
 from .report_service import ReportService  # type: ignore
 from .user_advisor_service import UserAdvisorService
 from .webauthn_service import WebAuthnService
+from .webhook_service import CactusWebhookService
 
 __all__ = [
     "DashboardService",
@@ -18,4 +28,14 @@ __all__ = [
     "InvestmentAccountService",
     "ReportService",
     "PortfolioBacktestService",
+    "CactusWebhookService",
+    "ProjectionService",
+    "BacktestJobService",
+    "ReportBatchService",
+    "BulkImportService",
+    "ClientOverviewService",
+    "ClientBulkService",
+    "NotificationService",
+    "NotificationAggregator",
+    "PortfolioSnapshotService",
 ]
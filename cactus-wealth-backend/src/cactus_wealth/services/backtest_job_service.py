@@ -0,0 +1,41 @@
+"""Asynchronous backtest jobs: persistence, execution and progress streaming."""
+
+import numpy as np
+
+from ..core.cache import get_async_redis_client
+from ..models import BacktestJob, User
+from ..schemas import BacktestJobRead, BacktestRequest, BacktestResponse
+from .job_service import JobService, ProgressCallback
+from .portfolio_backtest_service import PortfolioBacktestService
+
+
+class BacktestJobService(JobService[BacktestJob, BacktestResponse]):
+    """Service for queued backtests whose results are stored for later fetch."""
+
+    job_model = BacktestJob
+    read_schema = BacktestJobRead
+    result_schema = BacktestResponse
+    name = "backtest"
+
+    def create_job(self, request: BacktestRequest, current_user: User) -> BacktestJob:
+        """
+        Persist a queued backtest job.
+
+        Raises:
+            ValueError: If the portfolio weights are invalid
+        """
+        total_weight = sum(c.weight for c in request.composition)
+        if not np.isclose(total_weight, 1.0):
+            raise ValueError("Portfolio weights must sum to 1.0")
+
+        return self._add_job(current_user, request=request.model_dump_json())
+
+    async def _execute(
+        self, job: BacktestJob, report_progress: ProgressCallback
+    ) -> BacktestResponse:
+        backtest_service = PortfolioBacktestService(
+            redis_client=get_async_redis_client(), progress_callback=report_progress
+        )
+        return await backtest_service.perform_backtest(
+            BacktestRequest.model_validate_json(job.request)
+        )
@@ -0,0 +1,436 @@
+"""Background bulk imports of accounts, policies and clients from staged CSV/Excel files."""
+
+import csv
+import shutil
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import pandas as pd  # type: ignore[import-untyped]
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from ..core.bulk_upload import (
+    count_upload_rows,
+    error_report_line,
+    first_failure,
+    iter_upload_chunks,
+    numeric_column,
+    rejected_rows,
+    text_column,
+    upsert_insert,
+)
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..models import (
+    Client,
+    ClientStatus,
+    ImportJob,
+    InsurancePolicy,
+    LeadSource,
+    RiskProfile,
+    User,
+    UserRole,
+)
+from ..schemas import ImportJobRead, ImportJobResult, ImportKind
+from .investment_account_service import (
+    upsert_investment_accounts,
+    validate_account_rows,
+)
+from .job_service import JobService, ProgressCallback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_structured_logger(__name__)
+
+IMPORT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "investment_accounts": ("client_email", "platform", "account_number", "aum"),
+    "insurance_policies": (
+        "client_email",
+        "policy_number",
+        "insurance_type",
+        "coverage_amount",
+        "premium_amount",
+    ),
+    "clients": ("first_name", "last_name", "email"),
+}
+IMPORT_SUFFIXES = (".csv", ".xlsx")
+# coverage_amount is NUMERIC(15, 2) and premium_amount NUMERIC(10, 2)
+MAX_POLICY_COVERAGE = 10**13
+MAX_POLICY_PREMIUM = 10**8
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+# (created, updated, rejected rows) for one chunk
+ChunkOutcome = tuple[int, int, list[dict[str, Any]]]
+
+
+def _sees_all_clients(user: User) -> bool:
+    return user.role in (UserRole.ADMIN, UserRole.GOD)
+
+
+class BulkImportService(JobService[ImportJob, ImportJobResult]):
+    """Service for importing large multi-client files in the ARQ worker."""
+
+    job_model = ImportJob
+    read_schema = ImportJobRead
+    result_schema = ImportJobResult
+    name = "import"
+
+    def __init__(self, db_session: Session, staging_dir: Path | str | None = None):
+        """Initialize the bulk import service."""
+        super().__init__(db_session)
+        self.staging_dir = Path(staging_dir or settings.IMPORT_STAGING_DIR)
+
+    def staged_path(self, job: ImportJob) -> Path:
+        """Where the job's uploaded file waits for the worker."""
+        return self.staging_dir / f"{job.id}{Path(job.filename).suffix.lower()}"
+
+    def error_report_path(self, job: ImportJob) -> Path:
+        """Where the job's per-row error report (CSV) is written."""
+        return self.staging_dir / f"{job.id}.errors.csv"
+
+    def create_job(
+        self, kind: ImportKind, filename: str, stream: BinaryIO, current_user: User
+    ) -> ImportJob:
+        """
+        Stage an uploaded file to disk and persist a queued import job.
+
+        Raises:
+            ValueError: If the file is not a .csv or .xlsx file
+        """
+        if Path(filename).suffix.lower() not in IMPORT_SUFFIXES:
+            raise ValueError("Formato no soportado: se aceptan archivos .csv y .xlsx")
+
+        filename = Path(filename).name[:255]
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        staged = self.staging_dir / f"{uuid.uuid4().hex}.upload"
+        with staged.open("wb") as out:
+            shutil.copyfileobj(stream, out, 1 << 20)
+
+        job = self._add_job(current_user, kind=kind, filename=filename)
+        staged.replace(self.staged_path(job))
+        return job
+
+    def mark_failed(self, job: ImportJob, error: str) -> None:
+        """Record a job failure and drop its staged file; the file must be uploaded again."""
+        super().mark_failed(job, error)
+        self.staged_path(job).unlink(missing_ok=True)
+
+    def get_error_report(self, job_id: str, current_user: User) -> Path:
+        """
+        Path of a finished job's per-row error report.
+
+        Raises:
+            HTTPException: If the job is not visible or has no error report
+        """
+        path = self.error_report_path(self.get_visible_job(job_id, current_user))
+        if not path.is_file():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Import job has no error report"
+            )
+        return path
+
+    async def _execute(self, job: ImportJob, report_progress: ProgressCallback) -> ImportJobResult:
+        """
+        Import the job's staged file, committing every chunk in its own transaction.
+
+        A failure part-way through keeps the chunks already imported and stores
+        the counts so far on the job; rows of a chunk whose write fails are
+        reported as errors. The staged file is dropped once the import finishes
+        or its failure is recorded, so a failed import must be uploaded again
+        (rows already imported are updated, not duplicated). A run interrupted
+        before either (worker shutdown, timeout) keeps it for the re-run.
+        """
+        staged = self.staged_path(job)
+        if not staged.is_file():
+            raise FileNotFoundError("Staged import file is missing")
+        advisor = self.db.get(User, job.user_id)
+
+        result = ImportJobResult()
+        try:
+            total = count_upload_rows(staged)
+        except Exception:
+            total = 0  # Progress is best-effort; parsing errors surface below
+
+        report_path = self.error_report_path(job)
+        try:
+            with staged.open("rb") as stream, report_path.open("w", newline="") as report:
+                writer = csv.writer(report)
+                writer.writerow(["row", "error", "data"])
+                for chunk in iter_upload_chunks(
+                    stream, job.filename, settings.BULK_UPLOAD_CHUNK_SIZE
+                ):
+                    missing = set(IMPORT_COLUMNS[job.kind]) - set(chunk.columns)
+                    if missing:
+                        raise ValueError(
+                            f"Faltan columnas requeridas: {', '.join(sorted(missing))}"
+                        )
+
+                    created, updated, errors = self._import_chunk(job.kind, chunk, advisor)
+                    result.rows += len(chunk)
+                    result.created += created
+                    result.updated += updated
+                    result.invalid += len(errors)
+                    writer.writerows(error_report_line(error) for error in errors)
+
+                    if total:
+                        # Counts so far are polled from the job while it runs
+                        job.result = result.model_dump_json()
+                        await report_progress(
+                            "importing", min(result.rows * 100 // total, 99), rows=result.rows
+                        )
+        except Exception:
+            self.db.rollback()
+            self._close_error_report(result, report_path)
+            job.result = result.model_dump_json()
+            raise
+
+        staged.unlink(missing_ok=True)
+        self._close_error_report(result, report_path)
+        logger.info("import_job_rows", job_id=job.id, rows=result.rows, invalid=result.invalid)
+        return result
+
+    @staticmethod
+    def _close_error_report(result: ImportJobResult, report_path: Path) -> None:
+        result.has_error_report = result.invalid > 0
+        if not result.has_error_report:
+            report_path.unlink(missing_ok=True)
+
+    def _import_chunk(self, kind: str, chunk: pd.DataFrame, advisor: User) -> ChunkOutcome:
+        """Import one chunk in its own transaction."""
+        importers: dict[str, Callable[[pd.DataFrame, User], ChunkOutcome]] = {
+            "investment_accounts": self._import_accounts,
+            "insurance_policies": self._import_policies,
+            "clients": self._import_clients,
+        }
+        try:
+            created, updated, errors = importers[kind](chunk, advisor)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.warning(
+                "import_chunk_failed",
+                kind=kind,
+                first_row=int(chunk.index[0]),
+                error=str(e),
+            )
+            reason = f"Error al guardar en base de datos: {str(getattr(e, 'orig', e))[:200]}"
+            return 0, 0, rejected_rows(chunk, pd.Series(reason, index=chunk.index))
+        return created, updated, sorted(errors, key=lambda error: error["row"])
+
+    def _resolve_clients(self, emails: pd.Series, advisor: User) -> pd.Series:
+        """Map client emails to ids of clients the advisor may import into (NaN otherwise)."""
+        wanted = [email for email in emails.unique().tolist() if email]
+        if not wanted:
+            return pd.Series(float("nan"), index=emails.index)
+        statement = select(Client.email, Client.id).where(Client.email.in_(wanted))
+        if not _sees_all_clients(advisor):
+            statement = statement.where(Client.owner_id == advisor.id)
+        ids = dict(self.db.exec(statement).all())
+        return emails.map(ids).astype(float)
+
+    def _import_accounts(self, chunk: pd.DataFrame, advisor: User) -> ChunkOutcome:
+        valid, errors = validate_account_rows(chunk)
+        client_ids = self._resolve_clients(text_column(chunk, "client_email")[valid.index], advisor)
+        unknown = client_ids.isna()
+        errors += rejected_rows(
+            chunk.loc[valid.index], pd.Series("Cliente no encontrado", index=valid.index).where(unknown)
+        )
+
+        rows = valid[~unknown].assign(client_id=client_ids[~unknown].astype(int))
+        if rows.empty:
+            return 0, 0, errors
+        created = upsert_investment_accounts(self.db, rows)
+        return created, len(rows) - created, errors
+
+    def _import_policies(self, chunk: pd.DataFrame, advisor: User) -> ChunkOutcome:
+        client_ids = self._resolve_clients(text_column(chunk, "client_email"), advisor)
+        number = text_column(chunk, "policy_number")
+        insurance_type = text_column(chunk, "insurance_type")
+        coverage = numeric_column(chunk, "coverage_amount")
+        premium = numeric_column(chunk, "premium_amount")
+
+        holders = dict(
+            self.db.exec(
+                select(InsurancePolicy.policy_number, InsurancePolicy.client_id).where(
+                    InsurancePolicy.policy_number.in_(number.unique().tolist())
+                )
+            ).all()
+        )
+        holder = number.map(holders).astype(float)
+
+        reasons = first_failure(
+            chunk.index,
+            [
+                (client_ids.notna(), "Cliente no encontrado"),
+                (number.str.len().between(1, 100), "policy_number inválido"),
+                (insurance_type.str.len().between(1, 100), "insurance_type inválido"),
+                (
+                    coverage.notna() & (coverage.abs() < MAX_POLICY_COVERAGE),
+                    "coverage_amount inválido",
+                ),
+                (
+                    premium.notna() & (premium.abs() < MAX_POLICY_PREMIUM),
+                    "premium_amount inválido",
+                ),
+                (holder.isna() | (holder == client_ids), "La póliza pertenece a otro cliente"),
+            ],
+        )
+        valid = reasons.isna()
+        errors = rejected_rows(chunk, reasons)
+        if not valid.any():
+            return 0, 0, errors
+
+        rows = pd.DataFrame(
+            {
+                "client_id": client_ids,
+                "policy_number": number,
+                "insurance_type": insurance_type,
+                "coverage_amount": coverage,
+                "premium_amount": premium,
+            }
+        )[valid].drop_duplicates("policy_number", keep="last")
+        now = datetime.utcnow()
+        insert = upsert_insert(self.db)(InsurancePolicy).values(
+            [
+                {
+                    "client_id": int(row.client_id),
+                    "policy_number": row.policy_number,
+                    "insurance_type": row.insurance_type,
+                    "coverage_amount": Decimal(str(row.coverage_amount)),
+                    "premium_amount": Decimal(str(row.premium_amount)),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for row in rows.itertuples(index=False)
+            ]
+        )
+        self.db.exec(
+            insert.on_conflict_do_update(
+                index_elements=["policy_number"],
+                set_={
+                    "insurance_type": insert.excluded.insurance_type,
+                    "coverage_amount": insert.excluded.coverage_amount,
+                    "premium_amount": insert.excluded.premium_amount,
+                    "updated_at": insert.excluded.updated_at,
+                },
+            )
+        )
+        created = int(holder[rows.index].isna().sum())
+        return created, int(valid.sum()) - created, errors
+
+    def _import_clients(self, chunk: pd.DataFrame, advisor: User) -> ChunkOutcome:
+        email = text_column(chunk, "email")
+        first_name = text_column(chunk, "first_name")
+        last_name = text_column(chunk, "last_name")
+        phone = text_column(chunk, "phone")
+        risk_profile = text_column(chunk, "risk_profile").str.upper()
+        client_status = text_column(chunk, "status").str.lower()
+        lead_source = text_column(chunk, "lead_source").str.lower()
+        notes = text_column(chunk, "notes")
+        portfolio_name = text_column(chunk, "portfolio_name")
+
+        existing = pd.DataFrame(
+            self.db.exec(
+                select(Client.email, Client.owner_id, Client.risk_profile, Client.status).where(
+                    Client.email.in_(email.unique().tolist())
+                )
+            ).all(),
+            columns=["email", "owner_id", "risk_profile", "status"],
+        ).set_index("email")
+        owner = email.map(existing["owner_id"]).astype(float)
+
+        reasons = first_failure(
+            chunk.index,
+            [
+                (first_name.str.len().between(1, 100), "first_name inválido"),
+                (last_name.str.len().between(1, 100), "last_name inválido"),
+                (
+                    email.str.match(EMAIL_PATTERN) & (email.str.len() <= 255),
+                    "email inválido",
+                ),
+                (phone.str.len() <= 20, "phone inválido"),
+                (risk_profile.isin(["", *(r.value for r in RiskProfile)]), "risk_profile inválido"),
+                (client_status.isin(["", *(s.value for s in ClientStatus)]), "status inválido"),
+                (lead_source.isin(["", *(s.value for s in LeadSource)]), "lead_source inválido"),
+                (notes.str.len() <= 2000, "notes inválido"),
+                (portfolio_name.str.len() <= 100, "portfolio_name inválido"),
+                (
+                    owner.isna() | (owner == advisor.id) | _sees_all_clients(advisor),
+                    "El cliente pertenece a otro asesor",
+                ),
+            ],
+        )
+        valid = reasons.isna()
+        errors = rejected_rows(chunk, reasons)
+        if not valid.any():
+            return 0, 0, errors
+
+        # Blank risk profile / status cells keep the client's current value
+        # (or take the model default for new clients)
+        current_risk = email.map(existing["risk_profile"].map(lambda r: r.value))
+        current_status = email.map(existing["status"].map(lambda s: s.value))
+        risk_profile = risk_profile.mask(risk_profile == "", current_risk).fillna("")
+        client_status = client_status.mask(client_status == "", current_status).fillna("")
+
+        rows = pd.DataFrame(
+            {
+                "email": email,
+                "first_name": first_name,
+                "last_name": last_name,
+                "phone": phone,
+                "risk_profile": risk_profile.replace("", RiskProfile.MEDIUM.value),
+                "status": client_status.replace("", ClientStatus.prospect.value),
+                "lead_source": lead_source,
+                "notes": notes,
+                "portfolio_name": portfolio_name,
+            }
+        )[valid].drop_duplicates("email", keep="last")
+        now = datetime.utcnow()
+        insert = upsert_insert(self.db)(Client).values(
+            [
+                {
+                    "email": row.email,
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "phone": row.phone or None,
+                    "risk_profile": RiskProfile(row.risk_profile),
+                    "status": ClientStatus(row.status),
+                    "lead_source": LeadSource(row.lead_source) if row.lead_source else None,
+                    "notes": row.notes or None,
+                    "portfolio_name": row.portfolio_name or None,
+                    "owner_id": advisor.id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for row in rows.itertuples(index=False)
+            ]
+        )
+        columns = Client.__table__.c
+        self.db.exec(
+            insert.on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    "first_name": insert.excluded.first_name,
+                    "last_name": insert.excluded.last_name,
+                    "risk_profile": insert.excluded.risk_profile,
+                    "status": insert.excluded.status,
+                    # Optional fields left blank in the file keep their value
+                    **{
+                        name: func.coalesce(insert.excluded[name], columns[name])
+                        for name in ("phone", "lead_source", "notes", "portfolio_name")
+                    },
+                    "updated_at": insert.excluded.updated_at,
+                },
+            )
+        )
+        created = int(owner[rows.index].isna().sum())
+        return created, int(valid.sum()) - created, errors
+
+    async def _notify(self, job: ImportJob, message: dict) -> None:
+        await super()._notify(job, {**message, "kind": job.kind})
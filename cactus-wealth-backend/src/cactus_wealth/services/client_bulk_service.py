@@ -0,0 +1,350 @@
+"""Bulk client writes: create, update, re-status, reassign and delete many clients at once."""
+
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, union, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from ..core.logging_config import get_structured_logger
+from ..models import (
+    Client,
+    ClientActivity,
+    ClientNote,
+    InsurancePolicy,
+    InvestmentAccount,
+    Portfolio,
+    Report,
+    User,
+    UserRole,
+)
+from ..repositories import ClientRepository, ReferralRepository
+from ..schemas import (
+    ClientBulkCreate,
+    ClientBulkDelete,
+    ClientBulkError,
+    ClientBulkReassign,
+    ClientBulkResult,
+    ClientBulkStatus,
+    ClientBulkUpdate,
+)
+from .webhook_service import CactusWebhookService
+
+logger = get_structured_logger(__name__)
+
+CLIENT_NOT_FOUND = "Client not found"
+DUPLICATE_CLIENT = "Client appears more than once in the request"
+DUPLICATE_EMAIL = "Email appears more than once in the request"
+EMAIL_TAKEN = "A client with this email already exists"
+REFERRER_NOT_FOUND = "Referring client not found"
+REFERRAL_CYCLE = "A client cannot be referred by itself or by its own referrals"
+HAS_HISTORY = "Client has portfolios or reports"
+# Client columns that cannot be set to null through an update
+REQUIRED_FIELDS = ("first_name", "last_name", "email", "risk_profile", "status")
+
+# (request index, client id) of an item that passed validation
+Item = tuple[int, int | None]
+
+
+class ClientBulkService:
+    """
+    Service for writing many clients in one request.
+
+    Every request is validated with a fixed number of queries, its valid items
+    are written with set-based statements in one transaction, and invalid items
+    are reported one by one instead of failing the whole request. Clients are
+    only written under the same rule as the single-client endpoints
+    (``ClientRepository.get_client``): the user must own them, unless they are
+    GOD; book-wide read access of managers and admins does not extend here.
+    """
+
+    def __init__(self, db_session: Session):
+        """Initialize the bulk client service."""
+        self.db = db_session
+        self.client_repo = ClientRepository(db_session)
+
+    def create_clients(self, request: ClientBulkCreate, current_user: User) -> ClientBulkResult:
+        """Create clients owned by the user with one multi-row INSERT."""
+        emails = {str(item.email) for item in request.items}
+        taken = set(self.db.exec(select(Client.email).where(Client.email.in_(emails))).all())
+        referrers = self._existing(
+            {item.referred_by_client_id for item in request.items} - {None}
+        )
+
+        now = datetime.utcnow()
+        items: list[Item] = []
+        rows: list[dict[str, Any]] = []
+        errors: list[ClientBulkError] = []
+        seen: set[str] = set()
+        for index, item in enumerate(request.items):
+            email = str(item.email)
+            if email in taken:
+                reason = EMAIL_TAKEN
+            elif email in seen:
+                reason = DUPLICATE_EMAIL
+            elif item.referred_by_client_id is not None and item.referred_by_client_id not in referrers:
+                reason = REFERRER_NOT_FOUND
+            else:
+                seen.add(email)
+                items.append((index, None))
+                rows.append(
+                    {
+                        **item.model_dump(),
+                        "email": email,
+                        "owner_id": current_user.id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                continue
+            errors.append(ClientBulkError(index=index, reason=reason))
+
+        def write() -> list[int]:
+            statement = insert(Client).returning(Client.id, sort_by_parameter_order=True)
+            return list(self.db.exec(statement, params=rows).scalars())
+
+        return self._apply("create", items, errors, write)
+
+    def update_clients(self, request: ClientBulkUpdate, current_user: User) -> ClientBulkResult:
+        """
+        Apply per-client changes with one executemany UPDATE by primary key.
+
+        Referral loops are detected after the write, in the same transaction,
+        so loops closed by several items together are caught as well; the
+        items on a loop are rejected and the rest written again.
+        """
+        items, errors = self._accessible([item.id for item in request.items], current_user)
+        changes = {
+            index: request.items[index].model_dump(exclude_unset=True, exclude={"id"})
+            for index, _ in items
+        }
+
+        emails = {str(c["email"]) for c in changes.values() if c.get("email") is not None}
+        email_owners = dict(
+            self.db.exec(select(Client.email, Client.id).where(Client.email.in_(emails))).all()
+        )
+        referrers = self._existing(
+            {c.get("referred_by_client_id") for c in changes.values()} - {None}
+        )
+
+        valid: list[Item] = []
+        seen: set[str] = set()
+        for index, client_id in items:
+            change = changes[index]
+            email = str(change["email"]) if change.get("email") is not None else None
+            referrer_id = change.get("referred_by_client_id")
+            nulled = [name for name in REQUIRED_FIELDS if name in change and change[name] is None]
+            if nulled:
+                reason = f"{', '.join(nulled)} cannot be null"
+            elif email is not None and email_owners.get(email, client_id) != client_id:
+                reason = EMAIL_TAKEN
+            elif email is not None and email in seen:
+                reason = DUPLICATE_EMAIL
+            elif referrer_id is not None and referrer_id not in referrers:
+                reason = REFERRER_NOT_FOUND
+            else:
+                if email is not None:
+                    change["email"] = email
+                    seen.add(email)
+                valid.append((index, client_id))
+                continue
+            errors.append(ClientBulkError(index=index, client_id=client_id, reason=reason))
+
+        def write_changes() -> None:
+            now = datetime.utcnow()
+            params = [
+                {"id": client_id, **changes[index], "updated_at": now} for index, client_id in valid
+            ]
+            if params:
+                self.db.exec(update(Client), params=params)
+
+        def write() -> list[int]:
+            write_changes()
+            cycles = ReferralRepository(self.db).find_cycles(
+                [
+                    client_id
+                    for index, client_id in valid
+                    if client_id is not None
+                    and changes[index].get("referred_by_client_id") is not None
+                ]
+            )
+            if cycles:
+                # Dropping referral changes cannot close a loop, so one retry is enough
+                self.db.rollback()
+                errors.extend(
+                    ClientBulkError(index=index, client_id=client_id, reason=REFERRAL_CYCLE)
+                    for index, client_id in valid
+                    if client_id in cycles
+                )
+                valid[:] = [item for item in valid if item[1] not in cycles]
+                write_changes()
+            return [client_id for _, client_id in valid if client_id is not None]
+
+        return self._apply("update", valid, errors, write)
+
+    def set_status(self, request: ClientBulkStatus, current_user: User) -> ClientBulkResult:
+        """Move clients to one pipeline status with a single UPDATE."""
+        items, errors = self._accessible(request.client_ids, current_user)
+        return self._apply(
+            "status",
+            items,
+            errors,
+            self._update_all(items, status=request.status),
+        )
+
+    def reassign_owner(self, request: ClientBulkReassign, current_user: User) -> ClientBulkResult:
+        """
+        Move clients to another owner with a single UPDATE.
+
+        Raises:
+            HTTPException: 404 if the new owner is not an active user in the
+                user's book
+        """
+        owner_ids = self.client_repo.visible_owner_ids(current_user)
+        owner = self.db.get(User, request.owner_id)
+        if (
+            owner is None
+            or not owner.is_active
+            or (owner_ids is not None and owner.id not in owner_ids)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Owner not found"
+            )
+
+        items, errors = self._accessible(request.client_ids, current_user)
+        return self._apply(
+            "reassign",
+            items,
+            errors,
+            self._update_all(items, owner_id=request.owner_id),
+        )
+
+    def delete_clients(self, request: ClientBulkDelete, current_user: User) -> ClientBulkResult:
+        """
+        Delete clients together with their accounts, policies, notes and
+        activities, one DELETE per table.
+
+        Clients with portfolios or reports are rejected, since those hold the
+        client's financial history. Clients they referred are kept and lose
+        their referrer.
+        """
+        items, errors = self._accessible(request.client_ids, current_user)
+        requested = [client_id for _, client_id in items]
+        with_history = set(
+            self.db.exec(
+                union(
+                    select(Portfolio.client_id).where(Portfolio.client_id.in_(requested)),
+                    select(Report.client_id).where(Report.client_id.in_(requested)),
+                )
+            ).scalars()
+        )
+        errors += [
+            ClientBulkError(index=index, client_id=client_id, reason=HAS_HISTORY)
+            for index, client_id in items
+            if client_id in with_history
+        ]
+        items = [item for item in items if item[1] not in with_history]
+        client_ids = [client_id for _, client_id in items]
+
+        def write() -> list[int]:
+            for model in (InvestmentAccount, InsurancePolicy, ClientNote, ClientActivity):
+                self.db.exec(delete(model).where(model.client_id.in_(client_ids)))
+            self.db.exec(
+                update(Client)
+                .where(Client.referred_by_client_id.in_(client_ids))
+                .values(referred_by_client_id=None)
+            )
+            self.db.exec(delete(Client).where(Client.id.in_(client_ids)))
+            return [client_id for client_id in client_ids if client_id is not None]
+
+        return self._apply("delete", items, errors, write)
+
+    def event_payloads(self, client_ids: Sequence[int]) -> list[dict[str, Any]]:
+        """Webhook payloads of the written clients, read in one query."""
+        if not client_ids:
+            return []
+        clients = self.db.exec(select(Client).where(Client.id.in_(client_ids))).all()
+        return [CactusWebhookService.client_payload(client) for client in clients]
+
+    def _existing(self, client_ids: set[Any]) -> set[int]:
+        """Which of the given client ids exist."""
+        if not client_ids:
+            return set()
+        return set(self.db.exec(select(Client.id).where(Client.id.in_(client_ids))).all())
+
+    def _accessible(
+        self, client_ids: Sequence[int], current_user: User
+    ) -> tuple[list[Item], list[ClientBulkError]]:
+        """Split requested clients into those the user may write (owns, or GOD) and errors."""
+        statement = select(Client.id).where(Client.id.in_(set(client_ids)))
+        if current_user.role != UserRole.GOD:
+            statement = statement.where(Client.owner_id == current_user.id)
+        visible = set(self.db.exec(statement).all())
+
+        items: list[Item] = []
+        errors: list[ClientBulkError] = []
+        seen: set[int] = set()
+        for index, client_id in enumerate(client_ids):
+            if client_id not in visible:
+                errors.append(
+                    ClientBulkError(index=index, client_id=client_id, reason=CLIENT_NOT_FOUND)
+                )
+            elif client_id in seen:
+                errors.append(
+                    ClientBulkError(index=index, client_id=client_id, reason=DUPLICATE_CLIENT)
+                )
+            else:
+                seen.add(client_id)
+                items.append((index, client_id))
+        return items, errors
+
+    def _update_all(self, items: list[Item], **values: Any) -> Callable[[], list[int]]:
+        client_ids = [client_id for _, client_id in items if client_id is not None]
+
+        def write() -> list[int]:
+            self.db.exec(
+                update(Client)
+                .where(Client.id.in_(client_ids))
+                .values(**values, updated_at=datetime.utcnow())
+            )
+            return client_ids
+
+        return write
+
+    def _apply(
+        self,
+        action: str,
+        items: list[Item],
+        errors: list[ClientBulkError],
+        write: Callable[[], list[int]],
+    ) -> ClientBulkResult:
+        """
+        Run a batch's writes in one transaction.
+
+        If the database rejects the batch, nothing is written and every item
+        that passed validation is reported with the database error.
+        """
+        client_ids: list[int] = []
+        if items:
+            try:
+                client_ids = write()
+                self.db.commit()
+            except SQLAlchemyError as e:
+                self.db.rollback()
+                logger.warning("client_bulk_failed", action=action, items=len(items), error=str(e))
+                reason = f"Database error: {str(getattr(e, 'orig', e))[:200]}"
+                errors += [
+                    ClientBulkError(index=index, client_id=client_id, reason=reason)
+                    for index, client_id in items
+                ]
+                client_ids = []
+
+        logger.info(
+            "client_bulk_applied", action=action, written=len(client_ids), rejected=len(errors)
+        )
+        return ClientBulkResult(
+            client_ids=client_ids, errors=sorted(errors, key=lambda error: error.index)
+        )
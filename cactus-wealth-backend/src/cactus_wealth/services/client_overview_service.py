@@ -0,0 +1,263 @@
+"""Client 360 overview: one payload for the client detail page."""
+
+import hashlib
+import json
+from typing import Any
+
+import redis
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from ..core.cache import get_redis_client
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..models import (
+    Client,
+    ClientActivity,
+    ClientNote,
+    InsurancePolicy,
+    InvestmentAccount,
+    Portfolio,
+    PortfolioSnapshot,
+    Report,
+    User,
+    UserRole,
+)
+from ..schemas import (
+    ClientActivityRead,
+    ClientNoteRead,
+    ClientOverview,
+    ClientRead,
+    ClientReferral,
+    InsurancePolicyRead,
+    InvestmentAccountRead,
+    PortfolioOverview,
+    ReportRead,
+)
+
+logger = get_structured_logger(__name__)
+
+# Activities and notes shown on the overview (newest first)
+RECENT_ITEMS = 10
+
+
+def _scalar(statement: Any) -> Any:
+    return statement.scalar_subquery()
+
+
+class ClientOverviewService:
+    """Service that assembles and caches the client overview."""
+
+    def __init__(self, db_session: Session, redis_client: redis.Redis | None = None):
+        """
+        Initialize the client overview service.
+
+        Args:
+            db_session: Database session
+            redis_client: Synchronous Redis client; defaults to the shared one
+        """
+        self.db = db_session
+        self.redis_client = redis_client
+
+    def get_overview(self, client_id: int, current_user: User) -> ClientOverview:
+        """
+        Overview of a client the user may access.
+
+        A single probe query checks access and computes the client's version;
+        cached overviews are keyed by it, so any change to the client or its
+        related rows misses the cache. A miss costs a fixed number of queries,
+        however much data the client has.
+
+        Raises:
+            HTTPException: 404 if the client does not exist or is not accessible
+        """
+        probe = self.db.exec(self._version_statement(client_id)).first()
+        if probe is None or (
+            probe.owner_id != current_user.id and current_user.role != UserRole.GOD
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+            )
+
+        version = hashlib.sha256(
+            json.dumps(list(probe), default=str).encode()
+        ).hexdigest()[:16]
+        cache_key = f"client:overview:{client_id}:{version}"
+
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        overview = self._build(client_id, version)
+        self._cache(cache_key, overview)
+        return overview
+
+    @staticmethod
+    def _version_statement(client_id: int) -> Any:
+        """Owner plus a fingerprint of every row the overview is built from."""
+        referrer = Client.__table__.alias("referrer")  # type: ignore[attr-defined]
+        referred = Client.__table__.alias("referred")  # type: ignore[attr-defined]
+
+        def fingerprint(stamp: Any, criterion: Any) -> list[Any]:
+            """Row count and newest stamp of the related rows (catches deletes too)."""
+            return [
+                _scalar(select(func.count()).where(criterion)),
+                _scalar(select(func.max(stamp)).where(criterion)),
+            ]
+
+        return select(
+            Client.owner_id,
+            Client.updated_at,
+            _scalar(
+                select(referrer.c.updated_at).where(
+                    referrer.c.id == Client.referred_by_client_id
+                )
+            ),
+            *fingerprint(
+                InvestmentAccount.updated_at, InvestmentAccount.client_id == Client.id
+            ),
+            *fingerprint(InsurancePolicy.updated_at, InsurancePolicy.client_id == Client.id),
+            *fingerprint(Portfolio.updated_at, Portfolio.client_id == Client.id),
+            _scalar(
+                select(func.max(PortfolioSnapshot.id))
+                .join(Portfolio, Portfolio.id == PortfolioSnapshot.portfolio_id)
+                .where(Portfolio.client_id == Client.id)
+            ),
+            *fingerprint(ClientActivity.id, ClientActivity.client_id == Client.id),
+            *fingerprint(ClientNote.updated_at, ClientNote.client_id == Client.id),
+            *fingerprint(Report.id, Report.client_id == Client.id),
+            *fingerprint(referred.c.updated_at, referred.c.referred_by_client_id == Client.id),
+        ).where(Client.id == client_id)
+
+    def _build(self, client_id: int, version: str) -> ClientOverview:
+        client = self.db.exec(select(Client).where(Client.id == client_id)).one()
+
+        accounts = self.db.exec(
+            select(InvestmentAccount)
+            .where(InvestmentAccount.client_id == client_id)
+            .order_by(InvestmentAccount.id)
+        ).all()
+        policies = self.db.exec(
+            select(InsurancePolicy)
+            .where(InsurancePolicy.client_id == client_id)
+            .order_by(InsurancePolicy.id)
+        ).all()
+
+        # Each portfolio with its newest snapshot, ranked in the database
+        latest = (
+            select(
+                PortfolioSnapshot.portfolio_id,
+                PortfolioSnapshot.value,
+                PortfolioSnapshot.timestamp,
+                func.row_number()
+                .over(
+                    partition_by=PortfolioSnapshot.portfolio_id,
+                    order_by=(PortfolioSnapshot.timestamp.desc(), PortfolioSnapshot.id.desc()),
+                )
+                .label("position"),
+            )
+            .join(Portfolio, Portfolio.id == PortfolioSnapshot.portfolio_id)
+            .where(Portfolio.client_id == client_id)
+            .subquery()
+        )
+        portfolios = self.db.exec(
+            select(
+                Portfolio.id,
+                Portfolio.name,
+                Portfolio.current_value,
+                Portfolio.updated_at,
+                latest.c.value.label("latest_snapshot_value"),
+                latest.c.timestamp.label("latest_snapshot_at"),
+            )
+            .outerjoin(
+                latest, (latest.c.portfolio_id == Portfolio.id) & (latest.c.position == 1)
+            )
+            .where(Portfolio.client_id == client_id)
+            .order_by(Portfolio.id)
+        ).all()
+
+        activities = self.db.exec(
+            select(ClientActivity)
+            .where(ClientActivity.client_id == client_id)
+            .order_by(ClientActivity.created_at.desc(), ClientActivity.id.desc())
+            .limit(RECENT_ITEMS)
+        ).all()
+        notes = self.db.exec(
+            select(ClientNote)
+            .where(ClientNote.client_id == client_id)
+            .order_by(ClientNote.created_at.desc(), ClientNote.id.desc())
+            .limit(RECENT_ITEMS)
+        ).all()
+        report = self.db.exec(
+            select(Report)
+            .where(Report.client_id == client_id)
+            .order_by(Report.generated_at.desc(), Report.id.desc())
+            .limit(1)
+        ).first()
+
+        # Referrer and referred clients in one query
+        referrals = self.db.exec(
+            select(
+                Client.id,
+                Client.first_name,
+                Client.last_name,
+                Client.status,
+                Client.referred_by_client_id,
+            )
+            .where(
+                (Client.id == client.referred_by_client_id)
+                | (Client.referred_by_client_id == client_id)
+            )
+            .order_by(Client.id)
+        ).all()
+
+        account_reads = [InvestmentAccountRead.model_validate(a) for a in accounts]
+        return ClientOverview(
+            client=ClientRead.model_validate(client),
+            portfolios=[PortfolioOverview.model_validate(p._mapping) for p in portfolios],
+            investment_accounts=account_reads,
+            insurance_policies=[InsurancePolicyRead.model_validate(p) for p in policies],
+            total_aum=sum((a.aum for a in account_reads), start=0),
+            recent_activities=[ClientActivityRead.model_validate(a) for a in activities],
+            recent_notes=[ClientNoteRead.model_validate(n) for n in notes],
+            latest_report=ReportRead.model_validate(report) if report else None,
+            referred_by=next(
+                (
+                    ClientReferral.model_validate(r)
+                    for r in referrals
+                    if r.id == client.referred_by_client_id
+                ),
+                None,
+            ),
+            referred_clients=[
+                ClientReferral.model_validate(r)
+                for r in referrals
+                if r.referred_by_client_id == client_id
+            ],
+            version=version,
+        )
+
+    def _redis(self) -> redis.Redis | None:
+        return self.redis_client or get_redis_client()
+
+    def _get_cached(self, cache_key: str) -> ClientOverview | None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return None
+        try:
+            raw = redis_client.get(cache_key)
+            if raw:
+                return ClientOverview.model_validate_json(raw)
+        except Exception as e:
+            logger.warning("client_overview_cache_read_failed", error=str(e))
+        return None
+
+    def _cache(self, cache_key: str, overview: ClientOverview) -> None:
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.setex(cache_key, settings.REDIS_TTL, overview.model_dump_json())
+        except Exception as e:
+            logger.warning("client_overview_cache_write_failed", error=str(e))
@@ -0,0 +1,280 @@
+"""Streaming CSV / NDJSON / Parquet exports of CRM data."""
+
+import csv
+import enum
+import io
+import json
+from collections.abc import Callable, Iterator, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Literal
+
+import sqlalchemy as sa
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
+
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..database import get_engine
+from ..models import (
+    Client,
+    ClientNote,
+    InsurancePolicy,
+    InvestmentAccount,
+    Portfolio,
+    PortfolioSnapshot,
+)
+
+logger = get_structured_logger(__name__)
+
+ExportDataset = Literal[
+    "clients", "investment_accounts", "insurance_policies", "notes", "snapshots"
+]
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def export_statement(dataset: ExportDataset, owner_ids: list[int] | None) -> Select:
+    """
+    Column-only SELECT for a dataset, restricted to the given client owners.
+
+    Only plain columns are selected (no ORM entities or relationships), in
+    primary key order so exports are stable.
+    """
+    if dataset == "clients":
+        statement = select(
+            Client.id,
+            Client.first_name,
+            Client.last_name,
+            Client.email,
+            Client.phone,
+            Client.risk_profile,
+            Client.status,
+            Client.lead_source,
+            Client.portfolio_name,
+            Client.savings_capacity,
+            Client.referred_by_client_id,
+            Client.owner_id,
+            Client.created_at,
+            Client.updated_at,
+        ).order_by(Client.id)
+    elif dataset == "investment_accounts":
+        statement = (
+            select(
+                InvestmentAccount.id,
+                InvestmentAccount.client_id,
+                Client.email.label("client_email"),
+                InvestmentAccount.platform,
+                InvestmentAccount.account_number,
+                InvestmentAccount.aum,
+                InvestmentAccount.created_at,
+                InvestmentAccount.updated_at,
+            )
+            .join(Client, Client.id == InvestmentAccount.client_id)
+            .order_by(InvestmentAccount.id)
+        )
+    elif dataset == "insurance_policies":
+        statement = (
+            select(
+                InsurancePolicy.id,
+                InsurancePolicy.client_id,
+                Client.email.label("client_email"),
+                InsurancePolicy.policy_number,
+                InsurancePolicy.insurance_type,
+                InsurancePolicy.coverage_amount,
+                InsurancePolicy.premium_amount,
+                InsurancePolicy.created_at,
+                InsurancePolicy.updated_at,
+            )
+            .join(Client, Client.id == InsurancePolicy.client_id)
+            .order_by(InsurancePolicy.id)
+        )
+    elif dataset == "notes":
+        statement = (
+            select(
+                ClientNote.id,
+                ClientNote.client_id,
+                ClientNote.title,
+                ClientNote.content,
+                ClientNote.created_by,
+                ClientNote.created_at,
+                ClientNote.updated_at,
+            )
+            .join(Client, Client.id == ClientNote.client_id)
+            .order_by(ClientNote.id)
+        )
+    elif dataset == "snapshots":
+        statement = (
+            select(
+                PortfolioSnapshot.id,
+                PortfolioSnapshot.portfolio_id,
+                Portfolio.name.label("portfolio_name"),
+                Portfolio.client_id,
+                PortfolioSnapshot.value,
+                PortfolioSnapshot.timestamp,
+            )
+            .join(Portfolio, Portfolio.id == PortfolioSnapshot.portfolio_id)
+            .join(Client, Client.id == Portfolio.client_id)
+            .order_by(PortfolioSnapshot.id)
+        )
+    else:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+
+    if owner_ids is not None:
+        statement = statement.where(Client.owner_id.in_(owner_ids))
+    return statement
+
+
+def _plain(value: Any) -> Any:
+    """JSON/CSV-friendly form of a column value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class ExportService:
+    """Service that streams a dataset straight from a server-side cursor."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        batch_size: int | None = None,
+    ):
+        """
+        Initialize the export service.
+
+        The export owns its session: a streamed response outlives the request's
+        dependency-managed session.
+        """
+        self.session_factory = session_factory or (lambda: Session(get_engine()))
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+
+    def stream(
+        self, dataset: ExportDataset, fmt: ExportFormat, owner_ids: list[int] | None
+    ) -> Iterator[bytes]:
+        """Encoded export of a dataset, one chunk per fetched batch of rows."""
+        encoders = {
+            "csv": self._encode_csv,
+            "ndjson": self._encode_ndjson,
+            "parquet": self._encode_parquet,
+        }
+        statement = export_statement(dataset, owner_ids)
+        return encoders[fmt](statement)
+
+    def _batches(self, statement: Select) -> Iterator[tuple[list[str], Sequence[sa.Row]]]:
+        """Yield (column names, rows) batches; yield_per streams from the DB cursor."""
+        with self.session_factory() as session:
+            result = session.exec(statement.execution_options(yield_per=self.batch_size))
+            columns = list(result.keys())
+            rows = 0
+            for partition in result.partitions():
+                rows += len(partition)
+                yield columns, partition
+            logger.info("export_streamed", rows=rows)
+
+    def _encode_csv(self, statement: Select) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.name for column in statement.selected_columns])
+        for _, rows in self._batches(statement):
+            writer.writerows(
+                ["" if value is None else _plain(value) for value in row] for row in rows
+            )
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()  # Header of an empty export
+
+    def _encode_ndjson(self, statement: Select) -> Iterator[bytes]:
+        for columns, rows in self._batches(statement):
+            yield "".join(
+                json.dumps(
+                    {name: _plain(value) for name, value in zip(columns, row, strict=True)},
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for row in rows
+            ).encode()
+
+    def _encode_parquet(self, statement: Select) -> Iterator[bytes]:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        schema = pa.schema(
+            [
+                (column.name, _arrow_type(pa, column.type))
+                for column in statement.selected_columns
+            ]
+        )
+        sink = _DrainableSink()
+        # One row group per fetched batch, handed to the client as it is written
+        with pq.ParquetWriter(sink, schema) as writer:
+            for _, rows in self._batches(statement):
+                columns = list(zip(*rows, strict=True))
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            pa.array(
+                                [
+                                    value.value if isinstance(value, enum.Enum) else value
+                                    for value in values
+                                ],
+                                type=field.type,
+                            )
+                            for values, field in zip(columns, schema, strict=True)
+                        ],
+                        schema=schema,
+                    )
+                )
+                yield sink.drain()
+        yield sink.drain()  # Footer
+
+
+def _arrow_type(pa: Any, column_type: sa.types.TypeEngine) -> Any:
+    """Arrow type for a SQL column type."""
+    if isinstance(column_type, sa.Boolean):
+        return pa.bool_()
+    if isinstance(column_type, sa.Integer):
+        return pa.int64()
+    if isinstance(column_type, sa.Float):
+        return pa.float64()
+    if isinstance(column_type, sa.Numeric):
+        return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+    if isinstance(column_type, sa.DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose buffered bytes can be taken out as they arrive."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
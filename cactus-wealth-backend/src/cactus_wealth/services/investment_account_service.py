@@ -1,13 +1,27 @@
 """Investment Account Service for Cactus Wealth application."""
 
 import logging
+from collections.abc import Sequence
+from datetime import datetime
 from decimal import Decimal
 
+import pandas as pd  # type: ignore[import-untyped]
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Row, tuple_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlmodel import Session, select
 
 from cactus_wealth import schemas
+from cactus_wealth.core.bulk_upload import (
+    UNREADABLE_FILE_ERRORS,
+    first_failure,
+    iter_upload_chunks,
+    numeric_column,
+    rejected_rows,
+    text_column,
+    upsert_insert,
+)
+from cactus_wealth.core.config import settings
 from cactus_wealth.models import InvestmentAccount, User, UserRole
 from cactus_wealth.repositories.client_repository import ClientRepository
 from cactus_wealth.repositories.investment_account_repository import (
@@ -16,6 +30,12 @@ from cactus_wealth.repositories.investment_account_repository import (
 
 logger = logging.getLogger(__name__)
 
+BULK_UPLOAD_COLUMNS = ("platform", "account_number", "aum")
+# Only the first rejected rows are echoed back; the count covers all of them
+MAX_REPORTED_UPLOAD_ERRORS = 1000
+# aum is NUMERIC(15, 2)
+MAX_ACCOUNT_AUM = 10**13
+
 
 class InvestmentAccountService:
     """Service class for Investment Account business logic with authorization."""
@@ -142,9 +162,26 @@ class InvestmentAccountService:
         # Verify client ownership/access
         self._verify_client_access(client_id, current_advisor)
 
-        # Fallback to simple by-client fetch as repo lacks pagination helpers
-        _ = (skip, limit)  # kept for signature compatibility
-        return self.investment_account_repo.get_by_client_id(client_id)
+        return self.investment_account_repo.get_by_client_id(client_id, skip=skip, limit=limit)
+
+    def get_account_rows_by_client(
+        self,
+        client_id: int,
+        current_advisor: User,
+        names: Sequence[str],
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Row]:
+        """
+        Sparse account list for a client: only the named columns.
+
+        Raises:
+            HTTPException: If authorization fails or client not found
+        """
+        self._verify_client_access(client_id, current_advisor)
+        return self.investment_account_repo.get_columns(
+            names, InvestmentAccount.client_id == client_id, skip=skip, limit=limit
+        )
 
     def update_account(
         self,
@@ -213,75 +250,149 @@ class InvestmentAccountService:
         return account
 
     def bulk_upload_investment_accounts(
-        self, client_id: int, file: UploadFile, _current_advisor: User
+        self,
+        client_id: int,
+        file: UploadFile,
+        current_advisor: User,
+        chunk_size: int | None = None,
     ) -> dict[str, int | bool | list[dict[str, object]] | str]:
-        from io import BytesIO
+        """
+        Create or update a client's investment accounts from a CSV/Excel file.
 
-        import pandas as pd  # type: ignore[import-untyped]
+        The file is streamed in chunks of ``chunk_size`` rows: each chunk is
+        validated as a whole and written with a single upsert keyed on
+        (client_id, account_number), so memory use is bounded by the chunk
+        size rather than the file size. The upload is applied atomically.
 
-        # Leer archivo Excel o CSV
-        content = file.file.read()
-        try:
-            filename = file.filename or ""
-            if filename.endswith(".csv"):
-                df = pd.read_csv(BytesIO(content))
-            else:
-                df = pd.read_excel(BytesIO(content))
-        except Exception as e:
-            return {"error": f"Archivo inválido: {str(e)}"}
+        Args:
+            client_id: ID of the client that owns the accounts
+            file: Uploaded .csv or .xlsx file with platform, account_number
+                and aum columns
+            current_advisor: Current authenticated advisor
+            chunk_size: Rows per chunk (defaults to BULK_UPLOAD_CHUNK_SIZE)
 
-        required_cols = {"platform", "account_number", "aum"}
-        missing = required_cols - set(df.columns)
-        if missing:
-            return {"error": f"Faltan columnas requeridas: {', '.join(missing)}"}
+        Returns:
+            Created/updated/invalid counts plus the rejected rows, or an
+            ``error`` entry if the file or the database write failed
 
-        valid_rows = []
-        invalid_rows = []
-        created = 0
-        updated = 0
-
-        for idx, row in df.iterrows():
-            if not all(pd.notnull(row[col]) for col in required_cols):
-                invalid_rows.append({"row": idx + 2, "data": row.to_dict()})
-                continue
-
-            # Buscar si ya existe cuenta con mismo account_number y client_id
-            existing = self.db.exec(
-                select(InvestmentAccount).where(
-                    InvestmentAccount.client_id == client_id,
-                    InvestmentAccount.account_number == str(row["account_number"]),
-                )
-            ).first()
-
-            if existing:
-                # Actualizar cuenta existente
-                existing.platform = row["platform"]
-                existing.aum = Decimal(str(row["aum"]))
-                self.db.add(existing)
-                updated += 1
-            else:
-                # Crear nueva cuenta
-                new_account = InvestmentAccount(
-                    client_id=client_id,
-                    platform=row["platform"],
-                    account_number=str(row["account_number"]),
-                    aum=Decimal(str(row["aum"]))
-                )
-                self.db.add(new_account)
-                created += 1
-
-            valid_rows.append({"row": idx + 2, "data": row.to_dict()})
+        Raises:
+            HTTPException: If authorization fails or client not found
+        """
+        self._verify_client_access(client_id, current_advisor)
+        chunk_size = chunk_size or settings.BULK_UPLOAD_CHUNK_SIZE
 
+        created = 0
+        valid_rows = 0
+        invalid_rows = 0
+        errors: list[dict[str, object]] = []
         try:
-            self.db.commit()
-            return {
-                "success": True,
-                "created": created,
-                "updated": updated,
-                "valid_rows": len(valid_rows),
-                "invalid_rows": len(invalid_rows),
-                "errors": invalid_rows
-            }
-        except Exception as e:
+            for chunk in iter_upload_chunks(file.file, file.filename or "", chunk_size):
+                missing = set(BULK_UPLOAD_COLUMNS) - set(chunk.columns)
+                if missing:
+                    return {
+                        "error": f"Faltan columnas requeridas: {', '.join(sorted(missing))}"
+                    }
+
+                valid, rejected = validate_account_rows(chunk)
+                invalid_rows += len(rejected)
+                errors.extend(rejected[: MAX_REPORTED_UPLOAD_ERRORS - len(errors)])
+                if not valid.empty:
+                    created += upsert_investment_accounts(
+                        self.db, valid.assign(client_id=client_id)
+                    )
+                    valid_rows += len(valid)
+        except UNREADABLE_FILE_ERRORS as e:
+            self.db.rollback()
+            return {"error": f"Archivo inválido: {str(e)}"}
+        except SQLAlchemyError as e:
             self.db.rollback()
+            logger.error(f"Bulk upload failed for client {client_id}: {str(e)}")
             return {"error": f"Error al guardar en base de datos: {str(e)}"}
+
+        self.db.commit()
+        return {
+            "success": True,
+            "created": created,
+            "updated": valid_rows - created,
+            "valid_rows": valid_rows,
+            "invalid_rows": invalid_rows,
+            "errors": errors,
+        }
+
+
+def validate_account_rows(
+    chunk: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[dict[str, object]]]:
+    """
+    Split a chunk of account rows into normalized valid rows and rejected rows.
+
+    Valid rows come back as platform/account_number/aum columns, indexed like
+    the chunk.
+    """
+    platform = text_column(chunk, "platform")
+    number = text_column(chunk, "account_number")
+    aum = numeric_column(chunk, "aum")
+
+    reasons = first_failure(
+        chunk.index,
+        [
+            (platform.str.len().between(1, 100), "platform inválida"),
+            (number.str.len().between(1, 100), "account_number inválido"),
+            (aum.notna() & (aum.abs() < MAX_ACCOUNT_AUM), "aum inválido"),
+        ],
+    )
+    valid = reasons.isna()
+    rows = pd.DataFrame({"platform": platform, "account_number": number, "aum": aum})
+    return rows[valid], rejected_rows(chunk, reasons)
+
+
+def upsert_investment_accounts(db: Session, rows: pd.DataFrame) -> int:
+    """
+    Upsert validated account rows with one statement and count the new accounts.
+
+    Args:
+        db: Database session; the caller owns the transaction
+        rows: client_id/platform/account_number/aum rows
+
+    Returns:
+        Number of (client_id, account_number) pairs that did not exist yet
+    """
+    # A row may only be touched once per upsert statement; later rows win,
+    # as they would have if the file were applied row by row.
+    rows = rows.drop_duplicates(["client_id", "account_number"], keep="last")
+    keys = list(zip(rows["client_id"].tolist(), rows["account_number"].tolist(), strict=True))
+    existing = set(
+        db.exec(
+            select(InvestmentAccount.client_id, InvestmentAccount.account_number).where(
+                tuple_(InvestmentAccount.client_id, InvestmentAccount.account_number).in_(keys)
+            )
+        ).all()
+    )
+
+    now = datetime.utcnow()
+    insert = upsert_insert(db)(InvestmentAccount).values(
+        [
+            {
+                "client_id": client_id,
+                "platform": platform,
+                "account_number": number,
+                "aum": Decimal(str(aum)),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (client_id, number), platform, aum in zip(
+                keys, rows["platform"], rows["aum"], strict=True
+            )
+        ]
+    )
+    db.exec(
+        insert.on_conflict_do_update(
+            index_elements=["client_id", "account_number"],
+            set_={
+                "platform": insert.excluded.platform,
+                "aum": insert.excluded.aum,
+                "updated_at": insert.excluded.updated_at,
+            },
+        )
+    )
+    return len(set(keys) - existing)
@@ -0,0 +1,183 @@
+"""Shared lifecycle of persisted background jobs: queueing, execution and progress streaming."""
+
+import uuid
+from collections.abc import Awaitable
+from datetime import datetime
+from typing import Any, ClassVar, Generic, Protocol, TypeVar
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from ..core.arq import ARQConfig
+from ..core.logging_config import get_structured_logger
+from ..core.websocket_manager import publish_user_message
+from ..models import JobBase, User, UserRole
+
+logger = get_structured_logger(__name__)
+
+
+class ProgressCallback(Protocol):
+    """Reports a stage and percent done; extra keyword fields go into the message."""
+
+    def __call__(self, stage: str, percent: int, **details: Any) -> Awaitable[None]: ...
+
+
+J = TypeVar("J", bound=JobBase)
+R = TypeVar("R", bound=BaseModel)
+
+
+class JobService(Generic[J, R]):
+    """
+    Base class for services whose work runs in an ARQ worker and is stored on a job row.
+
+    Subclasses set the job model, its read schema, the schema of the stored
+    result and the ``name`` prefixing WebSocket message types and log events
+    (``<name>_job_progress`` / ``<name>_job_completed`` / ``<name>_job_failed``),
+    and implement ``_execute``.
+    """
+
+    job_model: ClassVar[type[JobBase]]
+    read_schema: ClassVar[type[BaseModel]]
+    result_schema: ClassVar[type[BaseModel]]
+    name: ClassVar[str]
+
+    def __init__(self, db_session: Session):
+        """Initialize the job service."""
+        self.db = db_session
+
+    def _add_job(self, current_user: User, **fields: Any) -> J:
+        """Persist a queued job owned by ``current_user``."""
+        job = self.job_model(id=uuid.uuid4().hex, user_id=current_user.id, **fields)
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    async def enqueue(self, job: J) -> None:
+        """
+        Queue ``run_<name>_job`` for a persisted job.
+
+        Raises:
+            HTTPException: 503 if the queue is unreachable; the job is marked failed
+        """
+        try:
+            await ARQConfig.enqueue_persisted_job(f"run_{self.name}_job", job.id)
+        except Exception as e:
+            self.mark_failed(job, f"Failed to enqueue job: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Background jobs are unavailable",
+            ) from e
+
+    def mark_failed(self, job: J, error: str) -> None:
+        """Record a job failure."""
+        job.status = "FAILED"
+        job.error = error[:1000]
+        job.completed_at = datetime.utcnow()
+        self.db.add(job)
+        self.db.commit()
+
+    def get_visible_job(self, job_id: str, current_user: User) -> J:
+        """
+        Fetch a job row the user may see: their own, or any for ADMIN/GOD.
+
+        Raises:
+            HTTPException: If the job does not exist or belongs to another user
+        """
+        job = self.db.get(self.job_model, job_id)
+        if not job or (
+            job.user_id != current_user.id
+            and current_user.role not in (UserRole.ADMIN, UserRole.GOD)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.name.capitalize()} job not found",
+            )
+        return job
+
+    def get_job(self, job_id: str, current_user: User) -> BaseModel:
+        """
+        Fetch a job with its stored result.
+
+        Raises:
+            HTTPException: If the job does not exist or belongs to another user
+        """
+        return self.to_read(self.get_visible_job(job_id, current_user))
+
+    @classmethod
+    def to_read(cls, job: J) -> BaseModel:
+        result = cls.result_schema.model_validate_json(job.result) if job.result else None
+        return cls.read_schema.model_validate({**job.model_dump(), "result": result})
+
+    async def _execute(self, job: J, report_progress: ProgressCallback) -> R:
+        """Do the job's work; raising marks the job as failed."""
+        raise NotImplementedError
+
+    async def _on_completed(self, job: J, result: R) -> None:
+        """Hook run after the result is stored and before the completion message."""
+
+    async def run_job(self, job_id: str) -> None:
+        """
+        Execute a queued job (ARQ worker side) and stream its progress.
+
+        Failures are stored on the job rather than raised: a stored failure is
+        final. Progress only moves forward, so a job retried by the worker does
+        not report stages it already passed.
+        """
+        job = self.db.get(self.job_model, job_id)
+        if job is None:
+            logger.warning(f"{self.name}_job_missing", job_id=job_id)
+            return
+        if job.status == "COMPLETED":
+            return
+
+        job.status = "RUNNING"
+        self.db.add(job)
+        self.db.commit()
+
+        async def report_progress(stage: str, percent: int, **details: Any) -> None:
+            if percent <= job.progress:
+                return
+            job.progress = percent
+            self.db.add(job)
+            self.db.commit()
+            await self._notify(
+                job,
+                {
+                    "type": f"{self.name}_job_progress",
+                    "stage": stage,
+                    "progress": percent,
+                    **details,
+                },
+            )
+
+        try:
+            result = await self._execute(job, report_progress)
+        except Exception as e:
+            logger.error(f"{self.name}_job_failed", job_id=job_id, error=str(e))
+            self.mark_failed(job, str(e))
+            await self._notify(job, {"type": f"{self.name}_job_failed", "error": job.error})
+            return
+
+        job.status = "COMPLETED"
+        job.progress = 100
+        job.result = result.model_dump_json()
+        job.completed_at = datetime.utcnow()
+        self.db.add(job)
+        self.db.commit()
+
+        logger.info(f"{self.name}_job_completed", job_id=job_id, user_id=job.user_id)
+        await self._on_completed(job, result)
+        await self._notify(
+            job,
+            {"type": f"{self.name}_job_completed", "result": result.model_dump(mode="json")},
+        )
+
+    async def _notify(self, job: J, message: dict) -> None:
+        try:
+            await publish_user_message(
+                {**message, "job_id": job.id, "status": job.status}, job.user_id
+            )
+        except Exception as e:
+            logger.warning(f"{self.name}_job_notify_failed", job_id=job.id, error=str(e))
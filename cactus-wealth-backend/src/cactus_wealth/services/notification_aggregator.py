@@ -0,0 +1,150 @@
+"""Coalescing of bursts of notification events into per-user digests."""
+
+import time
+from collections import defaultdict
+from collections.abc import Callable, Collection
+from datetime import datetime
+from typing import Any
+
+import redis
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..core.websocket_manager import publish_user_message
+from ..models import Notification
+from .notification_service import NotificationService
+
+logger = get_structured_logger(__name__)
+
+# Message of a digest that stands for several events of one kind
+DIGEST_MESSAGES = {
+    "portfolio_valuation": "{count} valoraciones de portfolio actualizadas",
+    "report_generated": "{count} reportes generados",
+}
+DEFAULT_DIGEST_MESSAGE = "{count} notificaciones nuevas"
+
+
+class NotificationAggregator:
+    """
+    Buffers notification events per user and writes them as digests.
+
+    Events of a user are held for ``window`` seconds from the first one; when
+    the window closes, each kind of event becomes one notification (the
+    event's own message if it is alone, a digest such as "23 valoraciones de
+    portfolio actualizadas" otherwise). Each flush writes every user's digests
+    with one multi-row INSERT and pushes one ``notifications`` WebSocket frame
+    per user, whose ``data`` is the list of new notifications in the shape of
+    a single ``notification`` frame's.
+
+    Windows are checked whenever an event is added, and everything still
+    buffered is flushed on exit, so use it as an async context manager::
+
+        async with NotificationAggregator(session) as notifier:
+            await notifier.add(user_id, "portfolio_valuation", message)
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        window: float | None = None,
+        redis_client: redis.Redis | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            db_session: Database session; flushes commit on it
+            window: Seconds to buffer a user's events (NOTIFICATION_DIGEST_WINDOW)
+            redis_client: Synchronous Redis client for the unread counters
+            clock: Monotonic time source
+        """
+        self.db = db_session
+        self.window = settings.NOTIFICATION_DIGEST_WINDOW if window is None else window
+        self.notification_service = NotificationService(db_session, redis_client)
+        self.clock = clock
+        # user_id -> kind -> messages, in arrival order
+        self._pending: dict[int, dict[str, list[str]]] = {}
+        self._opened_at: dict[int, float] = {}
+
+    async def __aenter__(self) -> "NotificationAggregator":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events."""
+        return sum(len(messages) for kinds in self._pending.values() for messages in kinds.values())
+
+    async def add(self, user_id: int, kind: str, message: str) -> None:
+        """Buffer an event for a user, flushing every window that has closed."""
+        now = self.clock()
+        self._opened_at.setdefault(user_id, now)
+        self._pending.setdefault(user_id, defaultdict(list))[kind].append(message)
+        due = [uid for uid, opened in self._opened_at.items() if now - opened >= self.window]
+        if due:
+            await self.flush(due)
+
+    async def flush(self, user_ids: Collection[int] | None = None) -> int:
+        """
+        Write and push the buffered events of some users (all by default).
+
+        Returns:
+            Number of notifications written
+        """
+        users = [uid for uid in (self._pending if user_ids is None else user_ids) if uid in self._pending]
+        if not users:
+            return 0
+        buffers = {uid: self._pending.pop(uid) for uid in users}
+        for uid in users:
+            self._opened_at.pop(uid, None)
+
+        now = datetime.utcnow()
+        rows = [
+            {"user_id": uid, "message": self._digest(kind, messages), "is_read": False, "created_at": now}
+            for uid, kinds in buffers.items()
+            for kind, messages in kinds.items()
+        ]
+        try:
+            statement = insert(Notification).returning(Notification.id, sort_by_parameter_order=True)
+            ids = list(self.db.exec(statement, params=rows).scalars())
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error("notification_digest_write_failed", users=len(users), error=str(e))
+            return 0
+
+        frames: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for row, notification_id in zip(rows, ids, strict=True):
+            frames[row["user_id"]].append(
+                {
+                    "id": notification_id,
+                    "message": row["message"],
+                    "is_read": False,
+                    "created_at": now.isoformat(),
+                }
+            )
+        for uid, notifications in frames.items():
+            self.notification_service.adjust_unread_count(uid, len(notifications))
+            try:
+                await publish_user_message({"type": "notifications", "data": notifications}, uid)
+            except Exception as e:
+                logger.warning("notification_digest_push_failed", user_id=uid, error=str(e))
+
+        logger.info(
+            "notification_digests_flushed",
+            users=len(frames),
+            notifications=len(rows),
+            events=sum(len(m) for kinds in buffers.values() for m in kinds.values()),
+        )
+        return len(rows)
+
+    @staticmethod
+    def _digest(kind: str, messages: list[str]) -> str:
+        if len(messages) == 1:
+            return messages[0]
+        return DIGEST_MESSAGES.get(kind, DEFAULT_DIGEST_MESSAGE).format(count=len(messages))
@@ -0,0 +1,130 @@
+"""User notification inbox: notifications, read state and the unread badge count."""
+
+import redis
+from fastapi import HTTPException, status
+from sqlmodel import Session
+
+from ..core.cache import get_redis_client
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..models import Notification
+from ..repositories import NotificationRepository
+
+logger = get_structured_logger(__name__)
+
+UNREAD_COUNT_KEY = "notifications:unread:{user_id}"
+
+
+class NotificationService:
+    """
+    Service for user notifications.
+
+    The unread count shown on every page load is kept in a per-user Redis
+    counter: read from Redis when present, counted in the database (and cached
+    for NOTIFICATION_COUNT_TTL) when not, and moved by every write here. A
+    counter that may have drifted is dropped rather than guessed at, and the
+    TTL bounds how long a missed update can be visible.
+    """
+
+    def __init__(self, db_session: Session, redis_client: redis.Redis | None = None):
+        """
+        Initialize the notification service.
+
+        Args:
+            db_session: Database session
+            redis_client: Synchronous Redis client; defaults to the shared one
+        """
+        self.db = db_session
+        self.redis_client = redis_client
+        self.notification_repo = NotificationRepository(db_session)
+
+    def create_notification(self, user_id: int, message: str) -> Notification:
+        """Store a notification for a user."""
+        notification = self.notification_repo.create(
+            Notification(user_id=user_id, message=message)
+        )
+        self.adjust_unread_count(user_id, 1)
+        logger.info("notification_created", user_id=user_id, notification_id=notification.id)
+        return notification
+
+    def unread_count(self, user_id: int) -> int:
+        """Number of unread notifications of a user."""
+        key = UNREAD_COUNT_KEY.format(user_id=user_id)
+        redis_client = self._redis()
+        if redis_client is not None:
+            try:
+                cached = redis_client.get(key)
+                if cached is not None:
+                    return int(cached)
+            except Exception as e:
+                logger.warning("unread_count_cache_read_failed", user_id=user_id, error=str(e))
+
+        count = self.notification_repo.count_unread_for_user(user_id)
+        if redis_client is not None:
+            try:
+                redis_client.setex(key, settings.NOTIFICATION_COUNT_TTL, count)
+            except Exception as e:
+                logger.warning("unread_count_cache_write_failed", user_id=user_id, error=str(e))
+        return count
+
+    def get_notification(self, user_id: int, notification_id: int) -> Notification:
+        """
+        One of the user's notifications.
+
+        Raises:
+            HTTPException: 404 if the notification does not belong to the user
+        """
+        notification = self.db.get(Notification, notification_id)
+        if notification is None or notification.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found"
+            )
+        return notification
+
+    def set_read(self, user_id: int, notification_id: int, is_read: bool = True) -> Notification:
+        """
+        Mark one of the user's notifications as read or unread.
+
+        Raises:
+            HTTPException: 404 if the notification does not belong to the user
+        """
+        notification = self.get_notification(user_id, notification_id)
+        changed = self.notification_repo.set_read_for_user(user_id, [notification_id], is_read)
+        if changed:
+            self.adjust_unread_count(user_id, changed if not is_read else -changed)
+            self.db.refresh(notification)
+        return notification
+
+    def mark_all_read(self, user_id: int, up_to_id: int | None = None) -> int:
+        """
+        Mark the user's unread notifications as read with one UPDATE.
+
+        Args:
+            user_id: The user's ID
+            up_to_id: Leave notifications newer than this one unread
+
+        Returns:
+            Number of notifications marked as read
+        """
+        updated = self.notification_repo.mark_all_as_read_for_user(user_id, up_to_id)
+        if updated:
+            self.adjust_unread_count(user_id, -updated)
+        return updated
+
+    def adjust_unread_count(self, user_id: int, delta: int) -> None:
+        """Move a user's cached unread count after a committed change."""
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+        key = UNREAD_COUNT_KEY.format(user_id=user_id)
+        try:
+            value = redis_client.incrby(key, delta)
+            # The count was not cached (INCRBY started from 0) or has drifted
+            # below zero: drop it so the next read recounts it
+            if value == delta or value < 0:
+                redis_client.delete(key)
+        except Exception as e:
+            logger.warning("unread_count_cache_update_failed", user_id=user_id, error=str(e))
+
+    def _redis(self) -> redis.Redis | None:
+        return self.redis_client or get_redis_client()
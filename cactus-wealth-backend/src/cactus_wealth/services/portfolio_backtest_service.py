@@ -1,63 +1,100 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
+import yfinance as yf
 
+from ..core.backtest_compute import portfolio_daily_returns, run_backtest_computation
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..core.price_series import decode_price_series, encode_price_series
 from ..schemas import BacktestRequest, BacktestResponse, PortfolioComposition
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime
+
+logger = get_structured_logger(__name__)
+
+# Bump when the backtest engine changes so stale cached results are ignored
+RESULT_CACHE_SCHEMA = 2
+RESULT_CACHE_TTL = 86400  # 24h, same as the price series cache
+WEIGHT_PRECISION = 6
+PRICE_CACHE_TTL = 86400  # 24h
+
 
 @dataclass
 class PortfolioBacktestService:
     """Minimal implementation to satisfy tests for backtesting service."""
 
+    # Async Redis client (see core.cache.get_async_redis_client)
     redis_client: Any | None = None
+    # Awaited with (stage, percent) as the backtest advances; used by async jobs
+    progress_callback: Callable[[str, int], Awaitable[None]] | None = None
 
     async def perform_backtest(self, request: BacktestRequest) -> BacktestResponse:
         total_weight = sum(c.weight for c in request.composition)
         if not np.isclose(total_weight, 1.0):
             raise ValueError("Portfolio weights must sum to 1.0")
 
-        # Simulate historical data download
+        cache_key = self._result_cache_key(request)
+        cached = await self._get_cached_result(cache_key)
+        if cached is not None:
+            # Equivalent requests share one entry; echo this request's ordering back
+            return cached.model_copy(
+                update={
+                    "portfolio_composition": request.composition,
+                    "benchmarks": request.benchmarks,
+                }
+            )
+
+        result = await self._run_backtest(request)
+        await self._cache_result(cache_key, result)
+        return result
+
+    async def _report_progress(self, stage: str, percent: int) -> None:
+        if self.progress_callback is None:
+            return
+        try:
+            await self.progress_callback(stage, percent)
+        except Exception as e:
+            logger.warning("backtest_progress_report_failed", stage=stage, error=str(e))
+
+    async def _run_backtest(self, request: BacktestRequest) -> BacktestResponse:
+        await self._report_progress("loading_prices", 10)
+        tickers = [c.ticker for c in request.composition]
+        # Portfolio and benchmark series come from one cache round trip
         data = await self._download_historical_data_cached(
-            [c.ticker for c in request.composition], request.period
+            tickers + [b for b in request.benchmarks if b not in tickers],
+            request.period,
         )
 
+        if data.empty:
+            raise ValueError("Historical data is empty")
+        await self._report_progress("computing", 50)
+
         start_date = data.index.min().strftime("%Y-%m-%d")
         end_date = data.index.max().strftime("%Y-%m-%d")
 
-        daily_returns = self._calculate_portfolio_daily_returns(
-            data, request.composition, [c.ticker for c in request.composition]
+        # Returns, metrics and data points are CPU-bound: run them off the loop
+        weights = np.array([c.weight for c in request.composition])
+        computed = await run_backtest_computation(
+            data[tickers + [c for c in data.columns if c not in tickers]],
+            weights,
+            request.benchmarks,
+            rebalancing=request.rebalancing,
+            rebalance_threshold=request.rebalance_threshold,
+            transaction_cost_bps=request.transaction_cost_bps,
         )
-
-        base = 100.0
-        values = base * (1 + daily_returns).cumprod()
-
-        performance_metrics = {
-            "total_return": float(values.iloc[-1] / base - 1),
-            "annualized_return": float(values.pct_change().mean() * 252),
-            "annualized_volatility": float(values.pct_change().std() * np.sqrt(252)),
-            "sharpe_ratio": float(
-                (values.pct_change().mean() / (values.pct_change().std() + 1e-9))
-                * np.sqrt(252)
-            ),
-            "max_drawdown": float((values / values.cummax() - 1).min()),
-            "start_value": float(base),
-            "end_value": float(values.iloc[-1]),
-        }
-
-        data_points = [
-            {
-                "date": ts.strftime("%Y-%m-%d"),
-                "portfolio_value": float(v),
-                "benchmark_values": {},
-                "dividend_events": [],
-            }
-            for ts, v in values.items()
-        ]
+        performance_metrics = computed["performance_metrics"]
+        data_points = computed["data_points"]
+        await self._report_progress("computed", 90)
 
         return BacktestResponse(
             start_date=start_date,
@@ -68,6 +105,59 @@ class PortfolioBacktestService:
             performance_metrics=performance_metrics,
         )
 
+    def _data_version(self) -> str:
+        """
+        Marker that changes whenever the daily price series gain a new close.
+
+        Daily series are extended once per trading session, so the last business
+        day identifies the data a cached result was computed from.
+        """
+        today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+        return pd.offsets.BDay().rollback(today).strftime("%Y-%m-%d")
+
+    def _result_cache_key(self, request: BacktestRequest) -> str:
+        """Build a canonical cache key so equivalent requests hit the same entry."""
+        canonical = {
+            "schema": RESULT_CACHE_SCHEMA,
+            "composition": sorted(
+                (c.ticker, round(c.weight, WEIGHT_PRECISION)) for c in request.composition
+            ),
+            # Tickers and benchmarks are already normalized by BacktestRequest
+            "benchmarks": sorted(set(request.benchmarks)),
+            "period": request.period,
+            "rebalancing": request.rebalancing,
+            "rebalance_threshold": (
+                request.rebalance_threshold if request.rebalancing == "threshold" else None
+            ),
+            "transaction_cost_bps": request.transaction_cost_bps,
+            "data_version": self._data_version(),
+        }
+        digest = hashlib.sha256(
+            json.dumps(canonical, separators=(",", ":")).encode()
+        ).hexdigest()
+        return f"backtest:result:{digest}"
+
+    async def _get_cached_result(self, cache_key: str) -> BacktestResponse | None:
+        if self.redis_client is None:
+            return None
+        try:
+            raw = await self.redis_client.get(cache_key)
+            if raw:
+                return BacktestResponse.model_validate_json(raw)
+        except Exception as e:
+            logger.warning("backtest_result_cache_read_failed", error=str(e))
+        return None
+
+    async def _cache_result(self, cache_key: str, result: BacktestResponse) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.setex(
+                cache_key, RESULT_CACHE_TTL, result.model_dump_json()
+            )
+        except Exception as e:
+            logger.warning("backtest_result_cache_write_failed", error=str(e))
+
     def _ensure_timezone_aware(self, date: datetime, index: pd.DatetimeIndex) -> datetime:
         if isinstance(index.tz, type(None)):
             return date
@@ -87,25 +177,145 @@ class PortfolioBacktestService:
             raise ValueError("Historical data must have DatetimeIndex")
 
         weights = np.array([c.weight for c in composition])
-        prices = historical_data[tickers].ffill().bfill()
-        returns = prices.pct_change().fillna(0.0)
-        portfolio_returns = returns.values @ weights
-        return pd.Series(portfolio_returns, index=returns.index)
-
-    async def _download_historical_data_cached(self, tickers: list[str], period: str) -> pd.DataFrame:
-        # Simple deterministic frame for tests
-        dates = pd.date_range(start="2023-01-01", end="2023-06-30", freq="D")
-        data = pd.DataFrame(index=dates)
-        rng = np.random.default_rng(42)
-        for t in tickers:
-            data[t] = 100 * (1 + rng.normal(0, 0.01, len(dates))).cumprod()
-
-        if self.redis_client is not None:
+        portfolio_returns = portfolio_daily_returns(
+            historical_data[tickers].to_numpy(dtype=np.float64), weights
+        )
+        return pd.Series(portfolio_returns, index=historical_data.index)
+
+    def _generate_cache_key(self, ticker: str, period: str, data_type: str = "prices") -> str:
+        key_string = f"{data_type}:bin1:{ticker}:{period}"
+        return f"yfinance:{hashlib.sha256(key_string.encode()).hexdigest()}"
+
+    async def get_close_prices(self, tickers: list[str], period: str) -> pd.DataFrame:
+        """
+        Daily closes for the given tickers, aligned on common trading days.
+
+        Served from the shared price-series cache when possible.
+        """
+        return await self._download_historical_data_cached(tickers, period)
+
+    async def get_latest_prices(self, tickers: list[str], period: str = "5d") -> dict[str, float]:
+        """
+        Most recent close for each ticker, from the shared price-series cache when possible.
+
+        Tickers without data are left out instead of failing the whole lookup,
+        so callers can fall back to stored prices for them.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+        prices = await self._get_cached_price_series(tickers, period)
+
+        missing = [t for t in tickers if t not in prices]
+        if missing:
+            downloaded = await asyncio.to_thread(
+                self._fetch_close_prices, missing, period, False
+            )
+            await self._cache_price_series(downloaded, period)
+            prices.update(downloaded)
+
+        return {t: float(series.iloc[-1]) for t, series in prices.items() if len(series)}
+
+    async def _download_historical_data_cached(
+        self, tickers: list[str], period: str
+    ) -> pd.DataFrame:
+        """
+        Load daily closes for all tickers, aligned on common trading days.
+
+        Cached series are read with a single MGET; the misses are downloaded in
+        one batch and written back through a pipeline.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prices = await self._get_cached_price_series(tickers, period)
+
+        missing = [t for t in tickers if t not in prices]
+        if missing:
+            downloaded = await asyncio.to_thread(self._fetch_close_prices, missing, period)
+            await self._cache_price_series(downloaded, period)
+            prices.update(downloaded)
+
+        data = pd.DataFrame({t: prices[t] for t in tickers}).sort_index()
+        return data.dropna()
+
+    async def _get_cached_price_series(
+        self, tickers: list[str], period: str
+    ) -> dict[str, pd.Series]:
+        if self.redis_client is None:
+            return {}
+        try:
+            payloads = await self.redis_client.mget(
+                [self._generate_cache_key(t, period) for t in tickers]
+            )
+            pairs = list(zip(tickers, payloads, strict=True))
+        except Exception as e:
+            logger.warning("price_cache_read_failed", error=str(e))
+            return {}
+
+        prices: dict[str, pd.Series] = {}
+        for ticker, payload in pairs:
+            if not payload:
+                continue
             try:
-                self.redis_client.setex("backtest-cache", 60, b"ok")
-            except Exception:
-                pass
-        return data
+                prices[ticker] = decode_price_series(payload)
+            except Exception as e:
+                # Entries written by an older encoding are simply refetched
+                logger.warning("price_cache_decode_failed", ticker=ticker, error=str(e))
+        return prices
+
+    async def _cache_price_series(self, prices: dict[str, pd.Series], period: str) -> None:
+        if self.redis_client is None or not prices:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for ticker, series in prices.items():
+                pipe.setex(
+                    self._generate_cache_key(ticker, period),
+                    PRICE_CACHE_TTL,
+                    encode_price_series(series, compress=settings.PRICE_CACHE_COMPRESS),
+                )
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("price_cache_write_failed", error=str(e))
+
+    def _fetch_close_prices(
+        self, tickers: list[str], period: str, strict: bool = True
+    ) -> dict[str, pd.Series]:
+        """
+        Download daily closes for all tickers in one yfinance call.
+
+        With ``strict`` a ticker without data raises ValueError; otherwise it is
+        left out of the result.
+        """
+        data = yf.download(
+            tickers if len(tickers) > 1 else tickers[0],
+            period=period,
+            interval="1d",
+            auto_adjust=True,
+            progress=False,
+        )
+        if data is None or data.empty:
+            if not strict:
+                return {}
+            raise ValueError(f"No historical data available for {', '.join(tickers)}")
+
+        closes = data["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+
+        prices: dict[str, pd.Series] = {}
+        for ticker in tickers:
+            series = closes[ticker].dropna() if ticker in closes.columns else None
+            if series is None or series.empty:
+                if not strict:
+                    continue
+                raise ValueError(f"No historical data available for {ticker}")
+            index = pd.DatetimeIndex(series.index)
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            prices[ticker] = pd.Series(
+                series.to_numpy(dtype=np.float64), index=index.normalize()
+            )
+        return prices
 
     async def _download_dividend_data_concurrent(self, tickers: list[str], period: str) -> dict[str, pd.Series]:
         return {t: pd.Series(dtype=float) for t in tickers}
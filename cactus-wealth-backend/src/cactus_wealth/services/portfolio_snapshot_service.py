@@ -0,0 +1,92 @@
+"""Nightly portfolio snapshots: one valuation pass over every portfolio."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from ..core.cache import get_async_redis_client
+from ..core.logging_config import get_structured_logger
+from ..models import Client, Portfolio, PortfolioSnapshot, Position
+from .notification_aggregator import NotificationAggregator
+from .portfolio_backtest_service import PortfolioBacktestService
+from .report_service import price_portfolio
+
+logger = get_structured_logger(__name__)
+
+
+class PortfolioSnapshotService:
+    """Service for snapshotting the value of every portfolio."""
+
+    def __init__(
+        self, db_session: Session, price_service: PortfolioBacktestService | None = None
+    ):
+        """Initialize the portfolio snapshot service."""
+        self.db = db_session
+        self._price_service = price_service
+
+    @property
+    def price_service(self) -> PortfolioBacktestService:
+        # Created on first use: the async Redis client needs a running event loop
+        if self._price_service is None:
+            self._price_service = PortfolioBacktestService(
+                redis_client=get_async_redis_client()
+            )
+        return self._price_service
+
+    async def snapshot_all(self, notifier: NotificationAggregator | None = None) -> int:
+        """
+        Value every portfolio at the latest prices and store one snapshot each.
+
+        Positions are loaded in one query, prices are fetched once for the
+        union of tickers and all snapshots are written in one transaction.
+        Each owner is told through the notifier, which collapses a run into
+        one digest per owner.
+
+        Returns:
+            Number of snapshots created
+        """
+        rows = self.db.exec(
+            select(Portfolio, Client.owner_id)
+            .join(Client, Client.id == Portfolio.client_id)
+            .options(selectinload(Portfolio.positions).selectinload(Position.asset))
+            .order_by(Portfolio.id)
+        ).all()
+        tickers = sorted(
+            {pos.asset.ticker_symbol for portfolio, _ in rows for pos in portfolio.positions}
+        )
+        try:
+            prices = await self.price_service.get_latest_prices(tickers)
+        except Exception as e:
+            # Stored position prices still give a (stale) valuation
+            logger.warning("snapshot_price_fetch_failed", error=str(e))
+            prices = {}
+
+        now = datetime.utcnow()
+        valued = [(price_portfolio(portfolio, prices)[0], owner_id) for portfolio, owner_id in rows]
+        try:
+            self.db.add_all(
+                PortfolioSnapshot(
+                    portfolio_id=valuation.portfolio_id,
+                    value=Decimal(str(round(valuation.total_value, 2))),
+                    timestamp=now,
+                )
+                for valuation, _ in valued
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if notifier is not None:
+            for valuation, owner_id in valued:
+                await notifier.add(
+                    owner_id,
+                    "portfolio_valuation",
+                    f"Valoración del portfolio '{valuation.portfolio_name}' actualizada. "
+                    f"Nuevo valor: ${valuation.total_value:,.2f}",
+                )
+
+        logger.info("portfolio_snapshots_created", snapshots=len(valued))
+        return len(valued)
@@ -0,0 +1,187 @@
+"""Monte Carlo projection service for portfolios and clients."""
+
+import asyncio
+from collections import defaultdict
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException, status
+from sqlmodel import Session, select
+
+from ..core.backtest_compute import get_process_pool, portfolio_daily_returns
+from ..core.logging_config import get_structured_logger
+from ..core.monte_carlo import simulate_value_bands
+from ..models import Asset, Client, Portfolio, Position, User, UserRole
+from ..schemas import ProjectionBand, ProjectionRequest, ProjectionResponse
+from .portfolio_backtest_service import PortfolioBacktestService
+
+logger = get_structured_logger(__name__)
+
+# Fewer monthly observations than this cannot support a meaningful distribution
+MIN_HISTORY_MONTHS = 12
+
+
+class ProjectionService:
+    """Projects the future value distribution of a client's holdings."""
+
+    def __init__(
+        self,
+        db_session: Session,
+        backtest_service: PortfolioBacktestService | None = None,
+    ):
+        """Initialize the projection service."""
+        self.db = db_session
+        self.backtest_service = backtest_service or PortfolioBacktestService()
+
+    def _get_client_with_access(self, client_id: int, current_user: User) -> Client:
+        """Fetch a client, verifying that the current user may access it."""
+        client = self.db.get(Client, client_id)
+        if not client:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+            )
+        if current_user.role in (UserRole.ADMIN, UserRole.GOD):
+            return client
+        if client.owner_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied. You can only project your own clients.",
+            )
+        return client
+
+    async def project_portfolio(
+        self, portfolio_id: int, request: ProjectionRequest, current_user: User
+    ) -> ProjectionResponse:
+        """
+        Project a single portfolio.
+
+        Raises:
+            HTTPException: If the portfolio or its client is not accessible
+            ValueError: If the portfolio cannot be projected
+        """
+        portfolio = self.db.get(Portfolio, portfolio_id)
+        if not portfolio:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
+            )
+        client = self._get_client_with_access(portfolio.client_id, current_user)
+        return await self._project(client, [portfolio_id], request)
+
+    async def project_client(
+        self, client_id: int, request: ProjectionRequest, current_user: User
+    ) -> ProjectionResponse:
+        """
+        Project all portfolios of a client as one combined book.
+
+        Raises:
+            HTTPException: If the client is not accessible
+            ValueError: If the client has nothing to project
+        """
+        client = self._get_client_with_access(client_id, current_user)
+        portfolio_ids = list(
+            self.db.exec(select(Portfolio.id).where(Portfolio.client_id == client_id)).all()
+        )
+        return await self._project(client, portfolio_ids, request)
+
+    async def _project(
+        self, client: Client, portfolio_ids: list[int], request: ProjectionRequest
+    ) -> ProjectionResponse:
+        holdings = self._market_value_by_ticker(portfolio_ids)
+        initial_value = sum(holdings.values())
+        if initial_value <= 0:
+            raise ValueError("No positions with market value to project")
+
+        tickers = list(holdings)
+        weights = np.array([holdings[t] for t in tickers]) / initial_value
+        monthly_returns = await self._historical_monthly_returns(
+            tickers, weights, request.history_period
+        )
+
+        monthly_contribution = (
+            request.monthly_contribution
+            if request.monthly_contribution is not None
+            else client.savings_capacity or 0.0
+        )
+
+        # Vectorized but CPU-bound: keep it off the event loop
+        loop = asyncio.get_running_loop()
+        simulation = await loop.run_in_executor(
+            get_process_pool(),
+            partial(
+                simulate_value_bands,
+                monthly_returns,
+                initial_value=initial_value,
+                monthly_contribution=monthly_contribution,
+                horizon_years=request.horizon_years,
+                n_paths=request.n_paths,
+                percentiles=request.percentiles,
+                method=request.method,
+                seed=request.seed,
+            ),
+        )
+
+        labels = [f"p{p:g}" for p in request.percentiles]
+        bands = [
+            ProjectionBand(
+                year=year,
+                mean=float(simulation["mean"][year]),
+                percentiles={
+                    label: float(simulation["bands"][i][year])
+                    for i, label in enumerate(labels)
+                },
+            )
+            for year in range(request.horizon_years + 1)
+        ]
+
+        logger.info(
+            "projection_completed",
+            client_id=client.id,
+            portfolios=len(portfolio_ids),
+            n_paths=request.n_paths,
+            horizon_years=request.horizon_years,
+        )
+
+        return ProjectionResponse(
+            client_id=client.id,
+            portfolio_ids=portfolio_ids,
+            initial_value=initial_value,
+            monthly_contribution=monthly_contribution,
+            horizon_years=request.horizon_years,
+            n_paths=request.n_paths,
+            method=request.method,
+            seed=simulation["seed"],
+            loss_probability=simulation["loss_probability"],
+            bands=bands,
+        )
+
+    def _market_value_by_ticker(self, portfolio_ids: list[int]) -> dict[str, float]:
+        """Aggregate current market value per ticker across portfolios."""
+        if not portfolio_ids:
+            return {}
+        rows = self.db.exec(
+            select(Asset.ticker_symbol, Position.quantity, Position.current_price)
+            .join(Asset, Asset.id == Position.asset_id)
+            .where(Position.portfolio_id.in_(portfolio_ids))
+        ).all()
+
+        holdings: dict[str, float] = defaultdict(float)
+        for ticker, quantity, price in rows:
+            holdings[ticker] += float(quantity * price)
+        return {t: v for t, v in holdings.items() if v > 0}
+
+    async def _historical_monthly_returns(
+        self, tickers: list[str], weights: np.ndarray, period: str
+    ) -> np.ndarray:
+        """Compound weighted daily portfolio returns into calendar-month returns."""
+        prices = await self.backtest_service.get_close_prices(tickers, period)
+        daily = pd.Series(
+            portfolio_daily_returns(prices[tickers].to_numpy(dtype=np.float64), weights),
+            index=prices.index,
+        )
+        monthly = (1 + daily).groupby(daily.index.to_period("M")).prod() - 1
+        if len(monthly) < MIN_HISTORY_MONTHS:
+            raise ValueError(
+                f"At least {MIN_HISTORY_MONTHS} months of price history are required"
+            )
+        return monthly.to_numpy()
@@ -0,0 +1,199 @@
+"""Bulk report runs over an advisor's book: valuation, rendering and progress streaming."""
+
+import asyncio
+
+from sqlmodel import Session, select
+
+from ..core.cache import get_async_redis_client
+from ..core.config import settings
+from ..core.logging_config import get_structured_logger
+from ..core.report_storage import ReportStorage
+from ..models import Client, Report, ReportJob, User, UserRole
+from ..schemas import (
+    BulkReportRequest,
+    BulkReportResult,
+    BulkReportSkip,
+    ReportJobRead,
+)
+from .job_service import JobService, ProgressCallback
+from .notification_aggregator import NotificationAggregator
+from .portfolio_backtest_service import PortfolioBacktestService
+from .report_service import (
+    NO_HOLDINGS,
+    ReportService,
+    has_holdings,
+    report_tickers,
+    with_report_holdings,
+)
+
+logger = get_structured_logger(__name__)
+
+CLIENT_NOT_FOUND = "Client not found or access denied"
+
+
+class ReportBatchService(JobService[ReportJob, BulkReportResult]):
+    """Service for generating reports for many clients in one run."""
+
+    job_model = ReportJob
+    read_schema = ReportJobRead
+    result_schema = BulkReportResult
+    name = "report"
+
+    def __init__(
+        self,
+        db_session: Session,
+        price_service: PortfolioBacktestService | None = None,
+        storage: ReportStorage | None = None,
+    ):
+        """Initialize the bulk report service."""
+        super().__init__(db_session)
+        self._price_service = price_service
+        self.report_service = ReportService(db_session, None, storage)
+
+    @property
+    def price_service(self) -> PortfolioBacktestService:
+        # Created on first use: the async Redis client needs a running event loop
+        if self._price_service is None:
+            self._price_service = PortfolioBacktestService(
+                redis_client=get_async_redis_client()
+            )
+        return self._price_service
+
+    def create_job(self, request: BulkReportRequest, current_user: User) -> ReportJob:
+        """Persist a queued bulk report job."""
+        return self._add_job(current_user, request=request.model_dump_json())
+
+    async def generate_reports(
+        self,
+        request: BulkReportRequest,
+        advisor: User,
+        progress_callback: ProgressCallback | None = None,
+    ) -> BulkReportResult:
+        """
+        Generate one consolidated report per client of the advisor's book (or the requested subset).
+
+        Each report covers all of the client's portfolios, accounts and policies,
+        as single client reports do. Holdings for every client are loaded in one
+        query and priced with one lookup for the union of tickers; PDFs render
+        concurrently in the PDF pool, unless an identical report is already
+        stored, and all Report rows are written in a single transaction. Clients
+        that cannot be reported on are listed in ``skipped`` with a reason
+        instead of failing the run.
+        """
+
+        async def report_progress(stage: str, percent: int) -> None:
+            if progress_callback is not None:
+                await progress_callback(stage, percent)
+
+        clients, skipped = self._load_clients(request, advisor)
+        await report_progress("loaded", 5)
+
+        try:
+            prices = await self.price_service.get_latest_prices(report_tickers(clients))
+        except Exception as e:
+            # Stored position prices are still a valid (if stale) report
+            logger.warning("bulk_report_price_fetch_failed", error=str(e))
+            prices = {}
+        await report_progress("priced", 15)
+
+        semaphore = asyncio.Semaphore(max(1, settings.PDF_RENDER_WORKERS) * 2)
+        done = 0
+
+        async def produce(client: Client) -> tuple[str, str, bool]:
+            nonlocal done
+            outcome = await self.report_service.produce_client_report(
+                client, prices, request.report_type, semaphore
+            )
+            done += 1
+            await report_progress("rendering", 15 + 75 * done // len(clients))
+            return outcome
+
+        produced = await asyncio.gather(
+            *(produce(client) for client in clients), return_exceptions=True
+        )
+
+        reports: list[Report] = []
+        reused_count = 0
+        for client, outcome in zip(clients, produced, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning("bulk_report_render_failed", client_id=client.id, error=str(outcome))
+                skipped.append(
+                    BulkReportSkip(client_id=client.id, reason=f"Rendering failed: {outcome}")
+                )
+                continue
+            content_hash, storage_key, reused = outcome
+            reused_count += reused
+            reports.append(
+                Report(
+                    client_id=client.id,
+                    advisor_id=advisor.id,
+                    file_path=storage_key,
+                    report_type=request.report_type,
+                    content_hash=content_hash,
+                )
+            )
+
+        # Stored PDFs are content-addressed, so a failed commit leaves nothing to clean up
+        try:
+            self.db.add_all(reports)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        await report_progress("saved", 100)
+        logger.info(
+            "bulk_reports_generated",
+            advisor_id=advisor.id,
+            generated=len(reports),
+            skipped=len(skipped),
+        )
+        return BulkReportResult(
+            generated=len(reports),
+            reused=reused_count,
+            report_ids=[report.id for report in reports],
+            skipped=skipped,
+        )
+
+    def _load_clients(
+        self, request: BulkReportRequest, advisor: User
+    ) -> tuple[list[Client], list[BulkReportSkip]]:
+        """
+        Clients in scope with everything their report shows eager-loaded.
+
+        Clients without holdings and requested clients outside the advisor's
+        book are returned as skipped.
+        """
+        statement = with_report_holdings(select(Client).order_by(Client.id))
+        if advisor.role not in (UserRole.ADMIN, UserRole.GOD):
+            statement = statement.where(Client.owner_id == advisor.id)
+        if request.client_ids:
+            statement = statement.where(Client.id.in_(request.client_ids))
+
+        clients: list[Client] = []
+        skipped: list[BulkReportSkip] = []
+        for client in self.db.exec(statement).all():
+            if has_holdings(client):
+                clients.append(client)
+            else:
+                skipped.append(BulkReportSkip(client_id=client.id, reason=NO_HOLDINGS))
+        found = {client.id for client in clients} | {skip.client_id for skip in skipped}
+        skipped.extend(
+            BulkReportSkip(client_id=client_id, reason=CLIENT_NOT_FOUND)
+            for client_id in sorted(set(request.client_ids or ()) - found)
+        )
+        return clients, skipped
+
+    async def _execute(
+        self, job: ReportJob, report_progress: ProgressCallback
+    ) -> BulkReportResult:
+        return await self.generate_reports(
+            BulkReportRequest.model_validate_json(job.request),
+            self.db.get(User, job.user_id),
+            report_progress,
+        )
+
+    async def _on_completed(self, job: ReportJob, result: BulkReportResult) -> None:
+        async with NotificationAggregator(self.db) as notifier:
+            for _ in result.report_ids:
+                await notifier.add(job.user_id, "report_generated", "Reporte generado")
@@ -1,15 +1,209 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import json
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from jinja2 import Environment, FileSystemLoader
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
-from ..models import Client, Portfolio, Position
+from ..core.cache import get_async_redis_client
+from ..core.logging_config import get_structured_logger
+from ..core.pdf_renderer import (
+    REPORT_STYLESHEET,
+    TEMPLATES_DIR,
+    render_pdf,
+    render_pdf_sync,
+)
+from ..core.report_storage import ReportStorage, get_report_storage
+from ..models import (
+    Client,
+    InsurancePolicy,
+    InvestmentAccount,
+    Portfolio,
+    Position,
+    Report,
+    User,
+    UserRole,
+)
 from ..schemas import PortfolioValuation, ReportResponse
+from .portfolio_backtest_service import PortfolioBacktestService
+
+if TYPE_CHECKING:
+    from sqlmodel.sql.expression import SelectOfScalar
+
+logger = get_structured_logger(__name__)
+
+CLIENT_REPORT_TEMPLATE = "client_report.html"
+NO_HOLDINGS = "No holdings found for client"
+
+
+class ReportLine(NamedTuple):
+    """Position as shown in a report, priced at the run's market prices."""
+
+    asset: Any
+    quantity: float
+    purchase_price: float
+    current_price: float
+
+
+def price_portfolio(
+    portfolio: Portfolio, prices: dict[str, float]
+) -> tuple[PortfolioValuation, list[ReportLine]]:
+    """
+    Value a portfolio (positions and assets loaded) at the given market prices.
+
+    Positions whose ticker has no price fall back to their stored current price.
+    """
+    lines = [
+        ReportLine(
+            asset=pos.asset,
+            quantity=float(pos.quantity),
+            purchase_price=float(pos.purchase_price),
+            current_price=prices.get(pos.asset.ticker_symbol, float(pos.current_price)),
+        )
+        for pos in portfolio.positions
+    ]
+    total_value = sum(line.quantity * line.current_price for line in lines)
+    total_cost_basis = sum(line.quantity * line.purchase_price for line in lines)
+    total_pnl = total_value - total_cost_basis
+    valuation = PortfolioValuation(
+        portfolio_id=portfolio.id,
+        portfolio_name=portfolio.name,
+        total_value=total_value,
+        total_cost_basis=total_cost_basis,
+        total_pnl=total_pnl,
+        total_pnl_percentage=(total_pnl / total_cost_basis * 100) if total_cost_basis else 0.0,
+        positions_count=len(lines),
+        last_updated=datetime.utcnow(),
+    )
+    return valuation, lines
+
+
+def with_report_holdings(statement: SelectOfScalar[Client]) -> SelectOfScalar[Client]:
+    """Eager-load everything a consolidated client report shows onto a Client select."""
+    return statement.options(
+        selectinload(Client.portfolios)
+        .selectinload(Portfolio.positions)
+        .selectinload(Position.asset),
+        selectinload(Client.investment_accounts),
+        selectinload(Client.insurance_policies),
+    )
+
+
+def has_holdings(client: Client) -> bool:
+    """Whether a client loaded by ``with_report_holdings`` has anything to report."""
+    return bool(client.portfolios or client.investment_accounts or client.insurance_policies)
+
+
+def report_tickers(clients: list[Client]) -> list[str]:
+    """Sorted union of the tickers held across the clients' portfolios."""
+    return sorted(
+        {pos.asset.ticker_symbol for c in clients for p in c.portfolios for pos in p.positions}
+    )
+
+
+@cache
+def report_template_version(template_name: str = "report.html") -> str:
+    """Digest of a report template and the stylesheet; changes whenever either is edited."""
+    digest = hashlib.sha256()
+    for path in (TEMPLATES_DIR / template_name, REPORT_STYLESHEET):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _position_key(positions: list[Any]) -> list[tuple]:
+    return sorted(
+        (
+            position.asset.ticker_symbol,
+            position.asset.name,
+            getattr(position.asset.asset_type, "value", position.asset.asset_type),
+            round(float(position.quantity), 6),
+            round(float(position.purchase_price), 2),
+            round(float(position.current_price), 2),
+        )
+        for position in positions
+    )
+
+
+def _valuation_key(valuation: PortfolioValuation) -> list:
+    return [
+        round(valuation.total_value, 2),
+        round(valuation.total_cost_basis, 2),
+        round(valuation.total_pnl, 2),
+        round(valuation.total_pnl_percentage, 2),
+        valuation.positions_count,
+    ]
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+
+
+def report_content_hash(
+    valuation: PortfolioValuation,
+    portfolio_name: str,
+    positions: list[Any],
+    report_type: str,
+) -> str:
+    """
+    Content hash of everything a rendered report shows.
+
+    Amounts are rounded as the template displays them, so price noise below a
+    cent does not defeat reuse. The generation timestamps are left out: a
+    reused artifact keeps the date it was first rendered.
+    """
+    return _digest(
+        {
+            "report_type": report_type,
+            "template": report_template_version(),
+            "portfolio": [valuation.portfolio_id, portfolio_name],
+            "valuation": _valuation_key(valuation),
+            "positions": _position_key(positions),
+        }
+    )
+
+
+def client_report_content_hash(
+    client: Client,
+    portfolios: list[tuple[PortfolioValuation, list[ReportLine]]],
+    accounts: list[InvestmentAccount],
+    policies: list[InsurancePolicy],
+    report_type: str,
+) -> str:
+    """Content hash of a consolidated client report (see ``report_content_hash``)."""
+    return _digest(
+        {
+            "report_type": report_type,
+            "template": report_template_version(CLIENT_REPORT_TEMPLATE),
+            "client": [client.id, client.first_name, client.last_name],
+            "portfolios": [
+                [valuation.portfolio_id, valuation.portfolio_name, _valuation_key(valuation), _position_key(lines)]
+                for valuation, lines in portfolios
+            ],
+            "accounts": [
+                [a.id, a.platform, a.account_number, round(float(a.aum), 2)] for a in accounts
+            ],
+            "policies": [
+                [
+                    p.id,
+                    p.policy_number,
+                    p.insurance_type,
+                    round(float(p.coverage_amount), 2),
+                    round(float(p.premium_amount), 2),
+                ]
+                for p in policies
+            ],
+        }
+    )
 
 
 @dataclass
@@ -18,42 +212,209 @@ class ReportService:
 
     db: Session
     market_data_provider: Any
+    storage: ReportStorage | None = None
+    # Batched quote source (PortfolioBacktestService); created on first use
+    price_service: Any | None = None
 
     def __post_init__(self) -> None:
-        templates_dir = Path(__file__).resolve().parents[1] / "templates"
-        self.env = Environment(loader=FileSystemLoader(str(templates_dir)))
+        if self.storage is None:
+            self.storage = get_report_storage()
+        self.env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
         # Placeholder attribute used in tests
         self.portfolio_service = self
 
     async def generate_portfolio_report(self, client_id: int, advisor, report_type: str) -> ReportResponse:
-        # Validate client access
+        """
+        Generate a report on the client's primary (lowest id) portfolio.
+
+        Positions are priced with one batched quote fetch, as consolidated
+        client reports are.
+        """
         client = self.db.exec(select(Client).where(Client.id == client_id)).first()
-        if client is None or (advisor.role.name != "ADMIN" and client.owner_id != advisor.id):
+        if client is None or (
+            advisor.role not in (UserRole.ADMIN, UserRole.GOD) and client.owner_id != advisor.id
+        ):
             return ReportResponse(success=False, message="Client not found or access denied")
 
-        # Fetch portfolios
-        portfolios = self.db.exec(select(Portfolio).where(Portfolio.client_id == client_id)).all()
-        if not portfolios:
+        portfolio = self.db.exec(
+            select(Portfolio)
+            .where(Portfolio.client_id == client_id)
+            .order_by(Portfolio.id)
+            .options(selectinload(Portfolio.positions).selectinload(Position.asset))
+        ).first()
+        if portfolio is None:
             return ReportResponse(success=False, message="No portfolios found for client")
 
-        # Build a mock valuation via portfolio_service.get_portfolio_valuation
+        tickers = sorted({pos.asset.ticker_symbol for pos in portfolio.positions})
+        try:
+            prices = await self._get_price_service().get_latest_prices(tickers) if tickers else {}
+        except Exception as e:
+            # Stored position prices are still a valid (if stale) report
+            logger.warning("portfolio_report_price_fetch_failed", client_id=client_id, error=str(e))
+            prices = {}
+        valuation, lines = price_portfolio(portfolio, prices)
+
+        # Identical inputs reuse the stored PDF; otherwise render off the event loop
+        content_hash = report_content_hash(valuation, portfolio.name, lines, report_type)
+        storage_key = await self.stored_report_key(content_hash)
+        if storage_key is None:
+            try:
+                pdf_bytes = await self.render_portfolio_report_pdf(valuation, portfolio.name, lines)
+            except Exception as exc:
+                return ReportResponse(success=False, message=f"Report generation failed: {exc}")
+            storage_key = await self.store_report_pdf(content_hash, pdf_bytes)
+
+        report = Report(
+            client_id=client_id,
+            advisor_id=advisor.id,
+            file_path=storage_key,
+            report_type=report_type,
+            content_hash=content_hash,
+        )
+        self.db.add(report)
+        self.db.commit()
+        self.db.refresh(report)
+
+        return ReportResponse(
+            success=True,
+            message="Report generated successfully",
+            report_id=report.id,
+            file_path=storage_key,
+        )
+
+    async def generate_client_report(
+        self, client_id: int, advisor: User, report_type: str = "CLIENT_CONSOLIDATED"
+    ) -> ReportResponse:
+        """
+        Generate one consolidated report over all of a client's holdings.
+
+        Covers every portfolio plus the client's investment accounts and
+        insurance policies. The client graph is loaded by a single eager query
+        and all positions are priced with one batched quote fetch.
+        """
+        client = self.load_client_for_report(client_id)
+        if client is None or (
+            advisor.role not in (UserRole.ADMIN, UserRole.GOD) and client.owner_id != advisor.id
+        ):
+            return ReportResponse(success=False, message="Client not found or access denied")
+        if not has_holdings(client):
+            return ReportResponse(success=False, message=NO_HOLDINGS)
+
+        try:
+            prices = await self._get_price_service().get_latest_prices(report_tickers([client]))
+        except Exception as e:
+            # Stored position prices are still a valid (if stale) report
+            logger.warning("client_report_price_fetch_failed", client_id=client_id, error=str(e))
+            prices = {}
+
         try:
-            valuation: PortfolioValuation = self.portfolio_service.get_portfolio_valuation(portfolios[0].id)
-        except Exception as exc:  # used by tests to simulate failure
-            self.db.rollback()
+            content_hash, storage_key, _ = await self.produce_client_report(
+                client, prices, report_type
+            )
+        except Exception as exc:
             return ReportResponse(success=False, message=f"Report generation failed: {exc}")
 
-        # Generate PDF bytes (mocked in tests)
-        pdf_bytes = self.generate_portfolio_report_pdf(valuation, portfolios[0].name)
+        report = Report(
+            client_id=client_id,
+            advisor_id=advisor.id,
+            file_path=storage_key,
+            report_type=report_type,
+            content_hash=content_hash,
+        )
+        self.db.add(report)
+        self.db.commit()
+        self.db.refresh(report)
+
+        return ReportResponse(
+            success=True,
+            message="Report generated successfully",
+            report_id=report.id,
+            file_path=storage_key,
+        )
+
+    def load_client_for_report(self, client_id: int) -> Client | None:
+        """Client with portfolios, positions, assets, accounts and policies eager-loaded."""
+        return self.db.exec(with_report_holdings(select(Client).where(Client.id == client_id))).first()
+
+    async def produce_client_report(
+        self,
+        client: Client,
+        prices: dict[str, float],
+        report_type: str,
+        render_limit: asyncio.Semaphore | None = None,
+    ) -> tuple[str, str, bool]:
+        """
+        Stored PDF of a client's consolidated report, rendered unless an identical one exists.
 
-        # Write to a temporary path
-        reports_dir = Path("./reports")
-        reports_dir.mkdir(parents=True, exist_ok=True)
-        out_path = reports_dir / f"portfolio_report_{client_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.pdf"
-        with open(out_path, "wb") as f:
-            f.write(pdf_bytes)
+        The client must be loaded by ``with_report_holdings``; positions are
+        valued at ``prices``. Returns the content hash, the storage key and
+        whether the stored PDF was reused. Rendering errors propagate.
+        """
+        portfolios = sorted(client.portfolios, key=lambda p: p.id)
+        accounts = sorted(client.investment_accounts, key=lambda a: a.id)
+        policies = sorted(client.insurance_policies, key=lambda p: p.id)
+        priced = [price_portfolio(p, prices) for p in portfolios]
 
-        return ReportResponse(success=True, message="Report generated successfully", file_path=str(out_path))
+        content_hash = client_report_content_hash(client, priced, accounts, policies, report_type)
+        storage_key = await self.stored_report_key(content_hash)
+        if storage_key is not None:
+            return content_hash, storage_key, True
+
+        html_content = self.render_client_report_html(client, priced, accounts, policies)
+        async with render_limit or contextlib.nullcontext():
+            pdf_bytes = await render_pdf(html_content)
+        return content_hash, await self.store_report_pdf(content_hash, pdf_bytes), False
+
+    def _get_price_service(self) -> Any:
+        # The async Redis client needs a running event loop, so build it lazily
+        if self.price_service is None:
+            self.price_service = PortfolioBacktestService(redis_client=get_async_redis_client())
+        return self.price_service
+
+    def render_client_report_html(
+        self,
+        client: Client,
+        portfolios: list[tuple[PortfolioValuation, list[ReportLine]]],
+        accounts: list[InvestmentAccount],
+        policies: list[InsurancePolicy],
+    ) -> str:
+        """Render the consolidated client report template."""
+        portfolios_value = sum(valuation.total_value for valuation, _ in portfolios)
+        accounts_aum = sum(float(a.aum) for a in accounts)
+        template = self.env.get_template(CLIENT_REPORT_TEMPLATE)
+        return template.render(
+            client_id=client.id,
+            client_name=f"{client.first_name} {client.last_name}",
+            report_date=datetime.utcnow(),
+            portfolios=[{"valuation": v, "lines": lines} for v, lines in portfolios],
+            accounts=accounts,
+            policies=policies,
+            portfolios_value=portfolios_value,
+            accounts_aum=accounts_aum,
+            total_wealth=portfolios_value + accounts_aum,
+            total_coverage=sum(float(p.coverage_amount) for p in policies),
+        )
+
+    def load_report_positions(self, portfolio_id: int) -> list[Position]:
+        """Positions of a portfolio with their assets, as shown in its report."""
+        return list(
+            self.db.exec(
+                select(Position)
+                .where(Position.portfolio_id == portfolio_id)
+                .options(selectinload(Position.asset))
+            ).all()
+        )
+
+    async def stored_report_key(self, content_hash: str) -> str | None:
+        """Storage key of an already rendered report with this content hash, if any."""
+        key = f"{content_hash}.pdf"
+        return key if await asyncio.to_thread(self.storage.exists, key) else None
+
+    async def store_report_pdf(self, content_hash: str, pdf_bytes: bytes) -> str:
+        """Store a rendered report under its content hash and return its storage key."""
+        key = f"{content_hash}.pdf"
+        await asyncio.to_thread(self.storage.put, key, pdf_bytes)
+        return key
 
     # Compatibility method used in tests (mocked)
     def get_portfolio_valuation(self, portfolio_id: int) -> PortfolioValuation:  # pragma: no cover - mocked in tests
@@ -70,15 +431,45 @@ class ReportService:
             last_updated=datetime.utcnow(),
         )
 
-    def generate_portfolio_report_pdf(self, valuation: PortfolioValuation, portfolio_name: str) -> bytes:
-        # In tests, WeasyPrint is mocked. Fall back to simple bytes for safety.
+    def render_portfolio_report_html(
+        self, valuation: PortfolioValuation, portfolio_name: str, positions: list[Any] | None = None
+    ) -> str:
+        """
+        Render the report template for a valuation and its positions.
+
+        Positions are loaded with their assets unless given; bulk runs pass
+        lines already priced at current market prices.
+        """
+        if positions is None:
+            positions = self.load_report_positions(valuation.portfolio_id)
+        template = self.env.get_template("report.html")
+        return template.render(
+            portfolio_id=valuation.portfolio_id,
+            portfolio_name=portfolio_name,
+            total_value=valuation.total_value,
+            total_cost_basis=valuation.total_cost_basis,
+            total_pnl=valuation.total_pnl,
+            total_pnl_percentage=valuation.total_pnl_percentage,
+            positions_count=valuation.positions_count,
+            last_updated=valuation.last_updated,
+            report_date=datetime.utcnow(),
+            positions=positions,
+        )
+
+    async def render_portfolio_report_pdf(
+        self, valuation: PortfolioValuation, portfolio_name: str, positions: list[Any] | None = None
+    ) -> bytes:
+        """Render the report PDF in the rendering pool without blocking the event loop."""
         try:
-            from weasyprint import HTML  # type: ignore
+            html_content = self.render_portfolio_report_html(valuation, portfolio_name, positions)
+            return await render_pdf(html_content)
+        except Exception as exc:
+            raise Exception(f"WeasyPrint is not available or failed: {exc}")
 
-            template = self.env.get_template("report.html")
-            html_content = template.render(valuation=valuation, portfolio_name=portfolio_name)
-            pdf = HTML(string=html_content).write_pdf()
-            return pdf
+    def generate_portfolio_report_pdf(self, valuation: PortfolioValuation, portfolio_name: str) -> bytes:
+        """Render the report PDF in the calling process."""
+        try:
+            html_content = self.render_portfolio_report_html(valuation, portfolio_name)
+            return render_pdf_sync(html_content)
         except Exception as exc:  # pragma: no cover - exercised in tests
             raise Exception(f"WeasyPrint is not available or failed: {exc}")
-
@@ -0,0 +1,117 @@
+"""
+Webhook service for publishing client events to the Redis outbox stream.
+
+Events are consumed by the ARQ ``EventWorker`` (see ``worker.py``), which reads
+the ``outbox`` stream with a consumer group.
+"""
+
+import json
+from typing import Any
+
+from ..core.cache import get_async_redis_client
+from ..core.logging_config import get_structured_logger
+from ..models import Client
+
+logger = get_structured_logger(__name__)
+
+OUTBOX_STREAM = "outbox"
+# Approximate cap so an idle worker cannot let the stream grow unbounded
+OUTBOX_MAXLEN = 10000
+
+
+class CactusWebhookService:
+    """Emits client lifecycle events through the shared async Redis pool."""
+
+    def __init__(self, redis_client: Any | None = None):
+        self.redis_client = redis_client
+
+    async def emit_client_event(self, event_type: str, client_data: dict[str, Any]) -> bool:
+        """
+        Append an event to the outbox stream.
+
+        Args:
+            event_type: Event name, e.g. ``client.created``
+            client_data: JSON-serializable event payload
+
+        Returns:
+            True if the event was queued, False otherwise
+        """
+        redis_client = self.redis_client or get_async_redis_client()
+        try:
+            await redis_client.xadd(
+                OUTBOX_STREAM,
+                {"event": event_type, "payload": json.dumps(client_data)},
+                maxlen=OUTBOX_MAXLEN,
+                approximate=True,
+            )
+            return True
+        except Exception as e:
+            logger.error("failed_to_queue_event", event_type=event_type, error=str(e))
+            return False
+
+    async def emit_client_events(
+        self, event_type: str, payloads: list[dict[str, Any]]
+    ) -> bool:
+        """
+        Append one event per payload to the outbox stream in a single round trip.
+
+        Returns:
+            True if the events were queued, False otherwise
+        """
+        if not payloads:
+            return True
+        try:
+            redis_client = self.redis_client or get_async_redis_client()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for client_data in payloads:
+                    pipe.xadd(
+                        OUTBOX_STREAM,
+                        {"event": event_type, "payload": json.dumps(client_data)},
+                        maxlen=OUTBOX_MAXLEN,
+                        approximate=True,
+                    )
+                await pipe.execute()
+            logger.info("client_events_emitted", event_type=event_type, count=len(payloads))
+            return True
+        except Exception as e:
+            logger.error(
+                "failed_to_queue_events", event_type=event_type, count=len(payloads), error=str(e)
+            )
+            return False
+
+    async def client_created(self, client_data: dict[str, Any]) -> None:
+        """Queue a ``client.created`` event."""
+        if await self.emit_client_event("client.created", client_data):
+            logger.info("client_created_event_emitted", client_id=client_data.get("id"))
+
+    async def client_updated(self, client_data: dict[str, Any]) -> None:
+        """Queue a ``client.updated`` event."""
+        if await self.emit_client_event("client.updated", client_data):
+            logger.info("client_updated_event_emitted", client_id=client_data.get("id"))
+
+    @staticmethod
+    def client_payload(client: Client) -> dict[str, Any]:
+        """
+        Build the event payload for a client.
+
+        Built eagerly in the request so background emission never touches a
+        closed session.
+        """
+
+        def _value(field: Any) -> str | None:
+            if field is None:
+                return None
+            return field.value if hasattr(field, "value") else str(field)
+
+        return {
+            "id": client.id,
+            "first_name": client.first_name,
+            "last_name": client.last_name,
+            "email": client.email,
+            "status": _value(client.status),
+            "risk_profile": _value(client.risk_profile),
+            "lead_source": _value(client.lead_source),
+            "notes": client.notes,
+            "created_at": client.created_at.isoformat() if client.created_at else None,
+            "updated_at": client.updated_at.isoformat() if client.updated_at else None,
+        }
@@ -5,6 +5,7 @@ from typing import Any
 
 import redis.asyncio as redis
 import structlog
+from arq import func
 from arq.connections import RedisSettings
 from sqlmodel import SQLModel
 
@@ -156,9 +157,21 @@ async def process_events(ctx) -> None:
 
 # ARQ worker settings
 class WorkerSettings:
-    from cactus_wealth.core.tasks import create_all_snapshots
-
-    functions = [process_events, create_all_snapshots]
+    from cactus_wealth.core.tasks import (
+        create_all_snapshots,
+        run_backtest_job,
+        run_import_job,
+        run_report_job,
+    )
+
+    functions = [
+        process_events,
+        create_all_snapshots,
+        run_backtest_job,
+        run_report_job,
+        # Large onboarding files outlive the default job timeout
+        func(run_import_job, timeout=3600),
+    ]
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = RedisSettings.from_dsn(REDIS_URL)
@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.ticker_index import ticker_index
+from cactus_wealth.models import Asset, AssetType
+
+
+@pytest.fixture
+def universe(session):
+    ticker_index.reset()
+    assets = [
+        Asset(ticker_symbol="SPY", name="SPDR S&P 500 ETF", asset_type=AssetType.ETF),
+        Asset(ticker_symbol="SPYG", name="SPDR Portfolio S&P 500 Growth", asset_type=AssetType.ETF),
+        Asset(ticker_symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK),
+        Asset(ticker_symbol="GGAL", name="Grupo Financiero Galicia", asset_type=AssetType.STOCK),
+        Asset(ticker_symbol="YPF", name="YPF Sociedad Anónima", asset_type=AssetType.STOCK),
+        Asset(ticker_symbol="XSPY", name="Cross Index Fund", asset_type=AssetType.ETF),
+    ]
+    session.add_all(assets)
+    session.commit()
+    yield {asset.ticker_symbol: asset for asset in assets}
+    ticker_index.reset()
+
+
+def search(test_client, headers, query, limit=10):
+    response = test_client.get(
+        "/api/v1/assets/search", params={"query": query, "limit": limit}, headers=headers
+    )
+    assert response.status_code == 200
+    return [asset["ticker_symbol"] for asset in response.json()]
+
+
+def test_ranking(test_client: TestClient, universe, test_user, auth_headers_for):
+    headers = auth_headers_for(test_user)
+    # Exact ticker, ticker prefix, name prefix ("SPDR"), then substring
+    assert search(test_client, headers, "spy") == ["SPY", "SPYG", "XSPY"]
+    assert search(test_client, headers, "spdr") == ["SPY", "SPYG"]
+    assert search(test_client, headers, "spy", limit=1) == ["SPY"]
+
+
+def test_name_prefix_and_substring(test_client: TestClient, universe, test_user, auth_headers_for):
+    headers = auth_headers_for(test_user)
+    assert search(test_client, headers, "grupo gal") == ["GGAL"]
+    assert search(test_client, headers, "anonima") == ["YPF"]  # Accents are ignored
+    assert search(test_client, headers, "licia") == ["GGAL"]
+    assert search(test_client, headers, "zzz") == []
+
+
+def test_index_follows_committed_changes(test_client: TestClient, session, universe, test_user, auth_headers_for):
+    headers = auth_headers_for(test_user)
+    assert search(test_client, headers, "AAPL") == ["AAPL"]  # Loads the index
+
+    session.add(Asset(ticker_symbol="MELI", name="MercadoLibre", asset_type=AssetType.STOCK))
+    universe["AAPL"].name = "Apple Computer"
+    session.delete(universe["GGAL"])
+    session.commit()
+
+    assert search(test_client, headers, "mercado") == ["MELI"]
+    assert search(test_client, headers, "computer") == ["AAPL"]
+    assert search(test_client, headers, "GGAL") == []
+
+    session.add(Asset(ticker_symbol="BMA", name="Banco Macro", asset_type=AssetType.STOCK))
+    session.rollback()
+    assert search(test_client, headers, "BMA") == []
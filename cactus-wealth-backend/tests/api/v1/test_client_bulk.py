@@ -0,0 +1,183 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import select
+
+from cactus_wealth.models import (
+    Client,
+    ClientNote,
+    ClientStatus,
+    InvestmentAccount,
+    Portfolio,
+    User,
+    UserRole,
+)
+
+
+@pytest.fixture
+def book(session, test_user, another_user):
+    """Three clients of test_user (B referred by A) and one of another advisor."""
+    clients = {}
+    for name, owner, referrer in [
+        ("A", test_user, None),
+        ("B", test_user, "A"),
+        ("C", test_user, None),
+        ("X", another_user, None),
+    ]:
+        client = Client(
+            first_name=name,
+            last_name="Bulk",
+            email=f"{name.lower()}.bulk@example.com",
+            owner_id=owner.id,
+            referred_by_client_id=clients[referrer].id if referrer else None,
+        )
+        session.add(client)
+        session.commit()
+        clients[name] = client
+    return clients
+
+
+def errors_by_index(body):
+    return {error["index"]: error["reason"] for error in body["errors"]}
+
+
+def test_bulk_create_reports_rejected_items(test_client: TestClient, session, book, test_user, auth_headers_for):
+    item = {"first_name": "New", "last_name": "Client", "risk_profile": "LOW"}
+    response = test_client.post(
+        "/api/v1/clients/bulk",
+        json={
+            "items": [
+                {**item, "email": "new1@example.com", "referred_by_client_id": book["A"].id},
+                {**item, "email": "a.bulk@example.com"},
+                {**item, "email": "new1@example.com"},
+                {**item, "email": "new2@example.com", "referred_by_client_id": 999999},
+                {**item, "email": "new3@example.com", "status": "contacted"},
+            ]
+        },
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert errors_by_index(body) == {
+        1: "A client with this email already exists",
+        2: "Email appears more than once in the request",
+        3: "Referring client not found",
+    }
+    created = [session.get(Client, client_id) for client_id in body["client_ids"]]
+    assert [(c.email, c.owner_id, c.status) for c in created] == [
+        ("new1@example.com", test_user.id, ClientStatus.prospect),
+        ("new3@example.com", test_user.id, ClientStatus.contacted),
+    ]
+    assert created[0].referred_by_client_id == book["A"].id
+
+
+def test_bulk_update_rejects_loops_closed_by_the_batch(test_client: TestClient, session, book, test_user, auth_headers_for):
+    response = test_client.patch(
+        "/api/v1/clients/bulk",
+        json={
+            "items": [
+                # A -> C and C -> A are fine alone but form a loop together
+                {"id": book["A"].id, "referred_by_client_id": book["C"].id},
+                {"id": book["C"].id, "referred_by_client_id": book["A"].id},
+                {"id": book["B"].id, "phone": "555-0100", "email": "b.new@example.com"},
+                {"id": book["X"].id, "phone": "555-0199"},
+                {"id": book["B"].id, "email": "c.bulk@example.com"},
+                {"id": book["C"].id, "first_name": None},
+            ]
+        },
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    loop = "A client cannot be referred by itself or by its own referrals"
+    assert errors_by_index(body) == {
+        0: loop,
+        1: loop,
+        3: "Client not found",
+        4: "Client appears more than once in the request",
+        5: "Client appears more than once in the request",
+    }
+    assert body["client_ids"] == [book["B"].id]
+    session.expire_all()
+    assert (book["B"].phone, book["B"].email) == ("555-0100", "b.new@example.com")
+    assert book["A"].referred_by_client_id is None
+    assert book["X"].phone is None
+
+
+def test_bulk_status_and_reassign(test_client: TestClient, session, book, test_user, another_user, test_admin, auth_headers_for):
+    god = User(username="god_bulk", email="god.bulk@example.com", hashed_password="x", role=UserRole.GOD)
+    session.add(god)
+    session.commit()
+    ids = [book["A"].id, book["B"].id, book["X"].id]
+    response = test_client.post(
+        "/api/v1/clients/bulk/status",
+        json={"client_ids": ids, "status": "onboarding"},
+        headers=auth_headers_for(test_user),
+    )
+    assert response.status_code == 200
+    assert response.json()["client_ids"] == ids[:2]
+    assert errors_by_index(response.json()) == {2: "Client not found"}
+
+    # Advisors cannot hand clients to someone outside their book
+    response = test_client.post(
+        "/api/v1/clients/bulk/reassign",
+        json={"client_ids": ids, "owner_id": another_user.id},
+        headers=auth_headers_for(test_user),
+    )
+    assert response.status_code == 404
+
+    # Like single-client writes, bulk writes need ownership (or GOD): an
+    # admin's book-wide view does not let them reassign other advisors' clients
+    response = test_client.post(
+        "/api/v1/clients/bulk/reassign",
+        json={"client_ids": ids, "owner_id": another_user.id},
+        headers=auth_headers_for(test_admin),
+    )
+    assert response.status_code == 200
+    assert response.json()["client_ids"] == []
+
+    response = test_client.post(
+        "/api/v1/clients/bulk/reassign",
+        json={"client_ids": ids, "owner_id": another_user.id},
+        headers=auth_headers_for(god),
+    )
+    assert response.status_code == 200
+    assert response.json() == {"client_ids": ids, "errors": []}
+
+    session.expire_all()
+    assert [(book[n].status, book[n].owner_id) for n in ("A", "B", "C", "X")] == [
+        (ClientStatus.onboarding, another_user.id),
+        (ClientStatus.onboarding, another_user.id),
+        (ClientStatus.prospect, test_user.id),
+        (ClientStatus.prospect, another_user.id),
+    ]
+
+
+def test_bulk_delete(test_client: TestClient, session, book, test_user, auth_headers_for):
+    session.add(InvestmentAccount(client_id=book["A"].id, platform="IOL", account_number="B-1", aum=Decimal("10")))
+    session.add(ClientNote(client_id=book["A"].id, title="Call", content="Follow up", created_by=test_user.id))
+    session.add(Portfolio(name="Growth", client_id=book["C"].id))
+    session.commit()
+    ids = {name: client.id for name, client in book.items()}
+
+    response = test_client.post(
+        "/api/v1/clients/bulk/delete",
+        json={"client_ids": [ids["A"], ids["C"], ids["X"]]},
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["client_ids"] == [ids["A"]]
+    assert errors_by_index(body) == {1: "Client has portfolios or reports", 2: "Client not found"}
+
+    session.expire_all()
+    assert session.get(Client, ids["A"]) is None
+    assert session.exec(select(InvestmentAccount).where(InvestmentAccount.account_number == "B-1")).first() is None
+    assert session.exec(select(ClientNote).where(ClientNote.title == "Call")).first() is None
+    # B keeps existing, without its deleted referrer
+    assert session.get(Client, ids["B"]).referred_by_client_id is None
+    assert session.get(Client, ids["C"]) is not None
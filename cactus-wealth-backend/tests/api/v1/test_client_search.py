@@ -0,0 +1,91 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.models import Client
+
+
+@pytest.fixture
+def book(session, test_user, another_user):
+    clients = {
+        "garcia": Client(first_name="Ana", last_name="García", email="ana.garcia@example.com", owner_id=test_user.id),
+        "anabel": Client(
+            first_name="Bruno",
+            last_name="Diaz",
+            email="anabel@example.com",
+            phone="+54 11 5555 0101",
+            owner_id=test_user.id,
+        ),
+        "noted": Client(
+            first_name="Carla",
+            last_name="Ruiz",
+            email="carla@example.com",
+            notes="Prefers bonos, referred by Ana",
+            portfolio_name="Jubilación",
+            owner_id=test_user.id,
+        ),
+        "theirs": Client(first_name="Ana", last_name="Other", email="ana.other@example.com", owner_id=another_user.id),
+    }
+    session.add_all(clients.values())
+    session.commit()
+    return clients
+
+
+def search(test_client, headers, q, **params):
+    response = test_client.get("/api/v1/clients/search", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_is_ranked_and_scoped(test_client: TestClient, book, test_user, auth_headers_for):
+    hits = search(test_client, auth_headers_for(test_user), "ana")
+
+    assert [hit["id"] for hit in hits] == [
+        book["garcia"].id,  # first name prefix
+        book["anabel"].id,  # email
+        book["noted"].id,  # notes only
+    ]
+    assert hits[0]["rank"] > hits[1]["rank"] > hits[2]["rank"]
+
+
+def test_search_matches_every_term_across_fields(test_client: TestClient, book, test_user, auth_headers_for):
+    assert [hit["id"] for hit in search(test_client, auth_headers_for(test_user), "carla jubilación")] == [book["noted"].id]
+    assert [hit["id"] for hit in search(test_client, auth_headers_for(test_user), "5555")] == [book["anabel"].id]
+    assert search(test_client, auth_headers_for(test_user), "ana zzz") == []
+
+
+def test_admin_searches_every_book(test_client: TestClient, book, test_admin, auth_headers_for):
+    hits = search(test_client, auth_headers_for(test_admin), "Ana", limit=10)
+
+    assert book["theirs"].id in {hit["id"] for hit in hits}
+
+
+def test_search_requires_a_query(test_client: TestClient, test_user, auth_headers_for):
+    response = test_client.get("/api/v1/clients/search", params={"q": "a"}, headers=auth_headers_for(test_user))
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("query", "pattern"),
+    [
+        ("ana.garcia@example.com", "%ana.garcia@example.com%"),
+        ("+54 11 5555", "%+54 11 5555%"),
+        ("50%_off", "%50\\%\\_off%"),
+    ],
+)
+def test_postgres_email_and_phone_match_the_query_as_typed(mock_session, query, pattern):
+    from sqlalchemy.dialects import postgresql
+
+    from cactus_wealth.repositories.client_repository import ClientRepository
+
+    mock_session.get_bind.return_value.dialect.name = "postgresql"
+    mock_session.exec.return_value.all.return_value = []
+
+    ClientRepository(mock_session).search_clients(query, None)
+
+    compiled = mock_session.exec.call_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "clients.email ILIKE" in sql
+    assert "clients.phone ILIKE" in sql
+    assert "ESCAPE" in sql
+    assert pattern in compiled.params.values()
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.pagination import NEXT_CURSOR_HEADER
+from cactus_wealth.models import (
+    ActivityType,
+    Client,
+    ClientActivity,
+    ClientNote,
+    InvestmentAccount,
+    Report,
+)
+
+
+def test_timeline_merges_sources_page_by_page(test_client: TestClient, session, test_user, another_user, auth_headers_for):
+    client = Client(first_name="Tim", last_name="Line", email="tim.line@example.com", owner_id=test_user.id)
+    session.add(client)
+    session.commit()
+    start = datetime(2026, 1, 1)
+    # Sources interleave and share timestamps, so ties are broken across sources
+    stamp = [start + timedelta(hours=i // 3) for i in range(12)]
+    session.add_all(
+        [
+            *(
+                ClientActivity(
+                    client_id=client.id,
+                    activity_type=ActivityType.call_made,
+                    description=f"call {i}",
+                    created_by=test_user.id,
+                    created_at=stamp[i],
+                )
+                for i in (0, 3, 6, 9)
+            ),
+            *(
+                ClientNote(
+                    client_id=client.id,
+                    title=f"note {i}",
+                    content="x" * 1000,
+                    created_by=test_user.id,
+                    created_at=stamp[i],
+                )
+                for i in (1, 4, 7)
+            ),
+            Report(client_id=client.id, advisor_id=test_user.id, file_path="r.pdf", generated_at=stamp[2]),
+            InvestmentAccount(
+                client_id=client.id,
+                platform="IOL",
+                account_number="TL-1",
+                aum=Decimal("1"),
+                created_at=stamp[5],
+                updated_at=stamp[11],
+            ),
+        ]
+    )
+    session.commit()
+
+    events, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = test_client.get(f"/api/v1/clients/{client.id}/timeline", params=params, headers=auth_headers_for(test_user))
+        assert response.status_code == 200
+        events += response.json()
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert pages == 4
+    assert [e["kind"] for e in events] == [
+        "activity",
+        "account_updated",
+        "note",
+        "activity",
+        "note",
+        "activity",
+        "account_opened",
+        "report",
+        "note",
+        "activity",
+    ]
+    keys = [(e["created_at"], e["id"]) for e in events]
+    assert keys == sorted(keys, reverse=True)
+    assert len({e["id"] for e in events}) == len(events)
+    note = next(e for e in events if e["kind"] == "note")
+    assert (note["title"], len(note["detail"]), note["actor_id"]) == ("note 7", 500, test_user.id)
+
+    forbidden = test_client.get(f"/api/v1/clients/{client.id}/timeline", headers=auth_headers_for(another_user))
+    assert forbidden.status_code == 404
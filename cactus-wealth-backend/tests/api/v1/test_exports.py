@@ -0,0 +1,121 @@
+import csv
+import importlib.util
+import io
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.config import settings
+from cactus_wealth.models import Client, InvestmentAccount, RiskProfile
+
+
+@pytest.fixture
+def books(session, test_user, another_user):
+    """Two clients with an account each for test_user, one for another_user."""
+    clients = []
+    for i, owner in enumerate([test_user, test_user, another_user]):
+        client = Client(
+            first_name=f"Export{i}",
+            last_name="Ñandú",
+            email=f"export{i}@example.com",
+            risk_profile=RiskProfile.LOW,
+            owner_id=owner.id,
+        )
+        session.add(client)
+        session.commit()
+        session.add(
+            InvestmentAccount(
+                client_id=client.id,
+                platform="Balanz",
+                account_number=f"E-{i}",
+                aum=Decimal("1234.50"),
+            )
+        )
+        session.commit()
+        clients.append(client)
+    with patch.object(settings, "EXPORT_BATCH_SIZE", 1):
+        yield clients
+
+
+def test_csv_export_is_scoped_to_the_advisor(test_client: TestClient, books, test_user, auth_headers_for):
+    response = test_client.get("/api/v1/exports/clients", headers=auth_headers_for(test_user))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["email"] for r in rows] == ["export0@example.com", "export1@example.com"]
+    assert rows[0]["risk_profile"] == "LOW"
+    assert rows[0]["last_name"] == "Ñandú"
+    assert rows[0]["phone"] == ""
+
+
+def test_ndjson_export(test_client: TestClient, books, another_user, auth_headers_for):
+    response = test_client.get(
+        "/api/v1/exports/investment_accounts",
+        params={"format": "ndjson"},
+        headers=auth_headers_for(another_user),
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["client_email"] == "export2@example.com"
+    assert lines[0]["aum"] == "1234.50"
+
+
+def test_empty_export_keeps_the_header(test_client: TestClient, books, test_user, auth_headers_for):
+    response = test_client.get("/api/v1/exports/notes", headers=auth_headers_for(test_user))
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "id,client_id,title,content,created_by,created_at,updated_at"
+    ]
+
+
+def test_parquet_requires_pyarrow(test_client: TestClient, books, test_user, monkeypatch, auth_headers_for):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, "find_spec", lambda name, *a: None if name == "pyarrow" else find_spec(name, *a)
+    )
+
+    response = test_client.get(
+        "/api/v1/exports/clients", params={"format": "parquet"}, headers=auth_headers_for(test_user)
+    )
+
+    assert response.status_code == 501
+
+
+def test_parquet_export(test_client: TestClient, books, test_user, auth_headers_for):
+    response = test_client.get(
+        "/api/v1/exports/investment_accounts",
+        params={"format": "parquet"},
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    parquet = pq.ParquetFile(io.BytesIO(response.content))
+    assert parquet.metadata.num_row_groups == 2  # One per fetched batch
+    rows = parquet.read().to_pylist()
+    assert [r["account_number"] for r in rows] == ["E-0", "E-1"]
+    assert rows[0]["aum"] == Decimal("1234.50")
+
+
+def test_parquet_export_types(test_client: TestClient, books, test_user, auth_headers_for):
+    response = test_client.get(
+        "/api/v1/exports/clients", params={"format": "parquet"}, headers=auth_headers_for(test_user)
+    )
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert str(table.schema.field("id").type) == "int64"
+    assert str(table.schema.field("created_at").type) == "timestamp[us]"
+    rows = table.to_pylist()
+    assert [(r["first_name"], r["last_name"], r["risk_profile"]) for r in rows] == [
+        ("Export0", "Ñandú", "LOW"),
+        ("Export1", "Ñandú", "LOW"),
+    ]
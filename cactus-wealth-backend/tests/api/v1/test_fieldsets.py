@@ -0,0 +1,131 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.pagination import NEXT_CURSOR_HEADER
+from cactus_wealth.models import (
+    Asset,
+    AssetType,
+    Client,
+    InvestmentAccount,
+    Portfolio,
+    Position,
+)
+
+
+@pytest.fixture
+def book(session, test_user):
+    ana = Client(first_name="Ana", last_name="Sparse", email="ana.sparse@example.com", owner_id=test_user.id)
+    session.add(ana)
+    session.commit()
+    referred = Client(
+        first_name="Bo",
+        last_name="Sparse",
+        email="bo.sparse@example.com",
+        owner_id=test_user.id,
+        referred_by_client_id=ana.id,
+    )
+    account = InvestmentAccount(client_id=ana.id, platform="Balanz", account_number="S-1", aum=Decimal("10.50"))
+    asset = Asset(ticker_symbol="SPY", name="SPDR S&P 500 ETF", asset_type=AssetType.ETF)
+    portfolio = Portfolio(name="Growth", client_id=ana.id, current_value=Decimal("99.90"))
+    session.add_all([referred, account, asset, portfolio])
+    session.commit()
+    session.add(
+        Position(
+            portfolio_id=portfolio.id,
+            asset_id=asset.id,
+            quantity=Decimal("2"),
+            purchase_price=Decimal("400"),
+            average_price=Decimal("400"),
+            current_price=Decimal("450"),
+        )
+    )
+    session.commit()
+    return ana, referred, portfolio
+
+
+def test_client_fields_and_include(test_client: TestClient, book, test_user, auth_headers_for):
+    ana, referred, _ = book
+
+    response = test_client.get(
+        "/api/v1/clients/",
+        params={"fields": "first_name,status", "include": "investment_accounts", "limit": 1},
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": referred.id, "first_name": "Bo", "status": "prospect", "investment_accounts": []}
+    ]
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+
+    response = test_client.get(
+        "/api/v1/clients/",
+        params={"fields": "first_name", "include": "investment_accounts,referred_clients", "cursor": cursor},
+        headers=auth_headers_for(test_user),
+    )
+    [item] = response.json()
+    assert (item["id"], item["first_name"]) == (ana.id, "Ana")
+    assert [a["aum"] for a in item["investment_accounts"]] == ["10.50"]
+    assert [c["id"] for c in item["referred_clients"]] == [referred.id]
+    assert "insurance_policies" not in item
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_unknown_fields_are_rejected(test_client: TestClient, book, test_user, auth_headers_for):
+    for params in ({"fields": "first_name,hashed_password"}, {"include": "owner"}):
+        response = test_client.get("/api/v1/clients/", params=params, headers=auth_headers_for(test_user))
+        assert response.status_code == 400
+
+
+def test_account_fields(test_client: TestClient, book, test_user, auth_headers_for):
+    ana, _, _ = book
+
+    response = test_client.get(
+        f"/api/v1/clients/{ana.id}/investment-accounts/",
+        params={"fields": "platform,aum"},
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    assert [{k: v for k, v in a.items() if k != "id"} for a in response.json()] == [
+        {"platform": "Balanz", "aum": "10.50"}
+    ]
+
+
+@pytest.mark.parametrize("fields", [None, "account_number"])
+def test_account_list_pages_with_and_without_fields(
+    test_client: TestClient, session, book, test_user, auth_headers_for, fields
+):
+    ana, _, _ = book
+    session.add_all(
+        InvestmentAccount(client_id=ana.id, platform="IOL", account_number=f"S-{i}", aum=Decimal("1"))
+        for i in range(2, 5)
+    )
+    session.commit()
+
+    params = {"skip": 1, "limit": 2} | ({"fields": fields} if fields else {})
+    response = test_client.get(
+        f"/api/v1/clients/{ana.id}/investment-accounts/",
+        params=params,
+        headers=auth_headers_for(test_user),
+    )
+
+    assert response.status_code == 200
+    assert [a["account_number"] for a in response.json()] == ["S-2", "S-3"]
+
+
+def test_portfolio_fields_and_positions(test_client: TestClient, book):
+    ana, _, portfolio = book
+
+    response = test_client.get(
+        f"/api/v1/portfolios/portfolios/client/{ana.id}",
+        params={"fields": "name,current_value", "include": "positions"},
+    )
+
+    assert response.status_code == 200
+    [item] = response.json()["portfolios"]
+    assert (item["id"], item["name"], item["current_value"]) == (portfolio.id, "Growth", "99.90")
+    assert [p["asset"]["ticker_symbol"] for p in item["positions"]] == ["SPY"]
+    assert "client_id" not in item
@@ -0,0 +1,44 @@
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.pagination import NEXT_CURSOR_HEADER
+from cactus_wealth.models import Notification
+
+
+def test_inbox_read_state(test_client: TestClient, session, test_user, another_user, auth_headers_for):
+    notifications = [Notification(user_id=test_user.id, message=f"m{i}", is_read=i % 2 == 0) for i in range(6)]
+    notifications.append(Notification(user_id=another_user.id, message="other"))
+    session.add_all(notifications)
+    session.commit()
+    unread_ids = [n.id for n in reversed(notifications[:6]) if not n.is_read]
+
+    response = test_client.get("/api/v1/notifications/unread-count", headers=auth_headers_for(test_user))
+    assert response.json() == {"unread": 3}
+
+    first = test_client.get("/api/v1/notifications", params={"unread_only": True, "limit": 2}, headers=auth_headers_for(test_user))
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    second = test_client.get(
+        "/api/v1/notifications", params={"unread_only": True, "limit": 2, "cursor": cursor}, headers=auth_headers_for(test_user)
+    )
+    assert [n["id"] for n in first.json() + second.json()] == unread_ids
+
+    response = test_client.patch(
+        f"/api/v1/notifications/{unread_ids[0]}", json={"is_read": True}, headers=auth_headers_for(test_user)
+    )
+    assert response.status_code == 200
+    assert response.json()["is_read"] is True
+
+    response = test_client.patch(
+        f"/api/v1/notifications/{notifications[-1].id}", json={"is_read": True}, headers=auth_headers_for(test_user)
+    )
+    assert response.status_code == 404
+
+    # Notifications newer than the one the user last saw stay unread
+    response = test_client.post(
+        "/api/v1/notifications/read-all", params={"up_to_id": unread_ids[2]}, headers=auth_headers_for(test_user)
+    )
+    assert response.json() == {"unread": 1}
+    response = test_client.post("/api/v1/notifications/read-all", headers=auth_headers_for(test_user))
+    assert response.json() == {"unread": 0}
+
+    response = test_client.get("/api/v1/notifications/unread-count", headers=auth_headers_for(another_user))
+    assert response.json() == {"unread": 1}
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.pagination import NEXT_CURSOR_HEADER
+from cactus_wealth.models import (
+    ActivityType,
+    Client,
+    ClientActivity,
+    ClientNote,
+    Notification,
+)
+
+# Several rows share a timestamp so the id tiebreak is exercised
+STAMPS = [datetime(2026, 1, 1) + timedelta(minutes=i // 2) for i in range(7)]
+
+
+def collect(test_client, url, headers, limit, **params):
+    """Follow X-Next-Cursor until the last page, returning the ids in order."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = test_client.get(url, params=query, headers=headers)
+        assert response.status_code == 200
+        ids += [item["id"] for item in response.json()]
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.fixture
+def client_book(session, test_user, another_user):
+    clients = [
+        Client(
+            first_name=f"Page{i}",
+            last_name="Client",
+            email=f"page{i}@example.com",
+            owner_id=test_user.id,
+            created_at=stamp,
+        )
+        for i, stamp in enumerate(STAMPS)
+    ]
+    clients.append(
+        Client(first_name="Other", last_name="Client", email="other@example.com", owner_id=another_user.id)
+    )
+    session.add_all(clients)
+    session.commit()
+    return clients[:-1]
+
+
+def newest_first(rows):
+    return [row.id for row in sorted(rows, key=lambda r: (r.created_at, r.id), reverse=True)]
+
+
+def test_clients_are_keyset_paginated(test_client: TestClient, client_book, test_user, auth_headers_for):
+    ids, pages = collect(test_client, "/api/v1/clients/", auth_headers_for(test_user), limit=3)
+
+    assert ids == newest_first(client_book)
+    assert pages == 3
+
+
+def test_cursor_is_stable_under_inserts(test_client: TestClient, session, client_book, test_user, auth_headers_for):
+    first = test_client.get("/api/v1/clients/", params={"limit": 3}, headers=auth_headers_for(test_user))
+    session.add(
+        Client(first_name="Late", last_name="Client", email="late@example.com", owner_id=test_user.id)
+    )
+    session.commit()
+
+    second = test_client.get(
+        "/api/v1/clients/",
+        params={"limit": 3, "cursor": first.headers[NEXT_CURSOR_HEADER]},
+        headers=auth_headers_for(test_user),
+    )
+
+    assert [c["id"] for c in second.json()] == newest_first(client_book)[3:6]
+
+
+def test_notes_activities_and_notifications(test_client: TestClient, session, client_book, test_user, auth_headers_for):
+    client = client_book[0]
+    notes = [
+        ClientNote(title=f"n{i}", content="x", client_id=client.id, created_by=test_user.id, created_at=stamp)
+        for i, stamp in enumerate(STAMPS)
+    ]
+    activities = [
+        ClientActivity(
+            activity_type=ActivityType.call_made,
+            description="call",
+            client_id=client.id,
+            created_by=test_user.id,
+            created_at=stamp,
+        )
+        for stamp in STAMPS
+    ]
+    notifications = [
+        Notification(message=f"m{i}", user_id=test_user.id, created_at=stamp)
+        for i, stamp in enumerate(STAMPS)
+    ]
+    session.add_all(notes + activities + notifications)
+    session.commit()
+
+    note_ids, _ = collect(test_client, f"/api/v1/clients/{client.id}/notes", auth_headers_for(test_user), limit=2)
+    activity_ids, _ = collect(test_client, f"/api/v1/clients/{client.id}/activities", auth_headers_for(test_user), limit=4)
+    notification_ids, _ = collect(test_client, "/api/v1/notifications", auth_headers_for(test_user), limit=5)
+
+    assert note_ids == newest_first(notes)
+    assert activity_ids == newest_first(activities)
+    assert notification_ids == newest_first(notifications)
+
+
+def test_invalid_cursor(test_client: TestClient, test_user, auth_headers_for):
+    response = test_client.get(
+        "/api/v1/clients/", params={"cursor": "not-a-cursor"}, headers=auth_headers_for(test_user)
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.models import Client, InvestmentAccount
+
+
+@pytest.fixture
+def tree(session, test_user, another_user):
+    """A -> (B -> C -> E*, D); E belongs to another advisor."""
+    clients = {}
+    for name, parent, owner, aum in [
+        ("A", None, test_user, None),
+        ("B", "A", test_user, "100"),
+        ("C", "B", test_user, "50"),
+        ("D", "A", test_user, "10"),
+        ("E", "C", another_user, "1000"),
+    ]:
+        client = Client(
+            first_name=name,
+            last_name="Tree",
+            email=f"{name.lower()}.tree@example.com",
+            owner_id=owner.id,
+            referred_by_client_id=clients[parent].id if parent else None,
+        )
+        session.add(client)
+        session.commit()
+        if aum:
+            session.add(InvestmentAccount(client_id=client.id, platform="IOL", account_number=f"T-{name}", aum=Decimal(aum)))
+            session.commit()
+        clients[name] = client
+    return clients
+
+
+def test_client_downline_and_chain(test_client: TestClient, tree, test_user, auth_headers_for):
+    response = test_client.get(f"/api/v1/clients/{tree['A'].id}/referrals", headers=auth_headers_for(test_user))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [(n["first_name"], n["depth"]) for n in body["downline"]] == [("B", 1), ("D", 1), ("C", 2)]
+    assert body["downline_size"] == 3
+    assert Decimal(body["attributed_aum"]) == Decimal("160")  # E is not visible
+    assert body["chain"] == []
+
+    chain = test_client.get(f"/api/v1/clients/{tree['C'].id}/referrals", headers=auth_headers_for(test_user)).json()["chain"]
+    assert [(n["first_name"], n["depth"]) for n in chain] == [("B", 1), ("A", 2)]
+
+
+def test_top_referrers(test_client: TestClient, tree, test_user, test_admin, auth_headers_for):
+    response = test_client.get("/api/v1/clients/referrals/top", headers=auth_headers_for(test_user))
+
+    assert response.status_code == 200
+    assert [
+        (r["first_name"], r["direct_referrals"], r["downline_size"], r["depth"], Decimal(r["attributed_aum"]))
+        for r in response.json()
+    ] == [("A", 2, 3, 2, Decimal("160")), ("B", 1, 1, 1, Decimal("50"))]
+
+    # Admins see the whole book, including the other advisor's client
+    top = test_client.get("/api/v1/clients/referrals/top", headers=auth_headers_for(test_admin)).json()[0]
+    assert (top["first_name"], top["downline_size"], Decimal(top["attributed_aum"])) == ("A", 4, Decimal("1160"))
+
+
+def test_referral_cycles_are_rejected(test_client: TestClient, tree, test_user, auth_headers_for):
+    for referrer in ("A", "C"):
+        response = test_client.put(
+            f"/api/v1/clients/{tree['A'].id}",
+            json={"referred_by_client_id": tree[referrer].id},
+            headers=auth_headers_for(test_user),
+        )
+        assert response.status_code == 400
@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cactus_wealth.core.report_storage import LocalReportStorage
+from cactus_wealth.models import Client, Report, RiskProfile
+
+PDF = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture
+def stored_report(session, test_user, tmp_path):
+    client = Client(
+        first_name="Ana",
+        last_name="Download",
+        email="ana.download@example.com",
+        risk_profile=RiskProfile.LOW,
+        owner_id=test_user.id,
+    )
+    session.add(client)
+    session.commit()
+    report = Report(client_id=client.id, advisor_id=test_user.id, file_path="abc.pdf")
+    session.add(report)
+    session.commit()
+
+    storage = LocalReportStorage(tmp_path)
+    storage.put("abc.pdf", PDF)
+    with patch(
+        "cactus_wealth.api.v1.endpoints.reports.get_report_storage", return_value=storage
+    ):
+        yield report
+
+
+def download_url(report):
+    return f"/api/v1/reports/{report.id}/download"
+
+
+def test_full_download(test_client: TestClient, stored_report, auth_headers):
+    response = test_client.get(download_url(stored_report), headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.content == PDF
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["etag"]
+
+
+def test_range_download(test_client: TestClient, stored_report, auth_headers):
+    response = test_client.get(
+        download_url(stored_report), headers={**auth_headers, "Range": "bytes=10-99"}
+    )
+
+    assert response.status_code == 206
+    assert response.content == PDF[10:100]
+    assert response.headers["content-range"] == f"bytes 10-99/{len(PDF)}"
+
+    suffix = test_client.get(
+        download_url(stored_report), headers={**auth_headers, "Range": "bytes=-16"}
+    )
+    assert suffix.status_code == 206
+    assert suffix.content == PDF[-16:]
+
+
+def test_unsatisfiable_range(test_client: TestClient, stored_report, auth_headers):
+    response = test_client.get(
+        download_url(stored_report),
+        headers={**auth_headers, "Range": f"bytes={len(PDF)}-"},
+    )
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(PDF)}"
+
+
+def test_conditional_requests(test_client: TestClient, stored_report, auth_headers):
+    etag = test_client.get(download_url(stored_report), headers=auth_headers).headers["etag"]
+
+    not_modified = test_client.get(
+        download_url(stored_report), headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+
+    # A stale If-Range validator gets the whole file instead of a partial one
+    stale = test_client.get(
+        download_url(stored_report),
+        headers={**auth_headers, "Range": "bytes=0-9", "If-Range": '"stale"'},
+    )
+    assert stale.status_code == 200
+    assert stale.content == PDF
+
+
+def test_other_advisor_cannot_download(
+    test_client: TestClient, stored_report, another_user, auth_headers_for
+):
+    response = test_client.get(download_url(stored_report), headers=auth_headers_for(another_user))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("file_path", ["./reports/legacy.pdf", "missing.pdf", ""])
+def test_unservable_file_path_is_not_found(
+    test_client: TestClient, session, stored_report, auth_headers, file_path
+):
+    stored_report.file_path = file_path
+    session.add(stored_report)
+    session.commit()
+
+    response = test_client.get(download_url(stored_report), headers=auth_headers)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Report file not found"
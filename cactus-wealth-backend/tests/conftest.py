@@ -328,13 +328,22 @@ def test_client_db(session, test_user):
     return create_client(session=session, client_data=client_data, owner_id=test_user.id)
 
 
-@pytest.fixture(scope="function")
-def authenticated_headers(test_user):
-    """Bearer Authorization header for the created test user."""
+@pytest.fixture
+def auth_headers_for():
+    """Build the Bearer Authorization header for any user: ``auth_headers_for(user)``."""
     from cactus_wealth.security import create_access_token
 
-    token = create_access_token(data={"sub": test_user.email})
-    return {"Authorization": f"Bearer {token}"}
+    def build(user) -> dict[str, str]:
+        token = create_access_token(data={"sub": user.email})
+        return {"Authorization": f"Bearer {token}"}
+
+    return build
+
+
+@pytest.fixture(scope="function")
+def authenticated_headers(test_user, auth_headers_for):
+    """Bearer Authorization header for the created test user."""
+    return auth_headers_for(test_user)
 
 
 # Compatibility alias fixtures for test suites expecting specific names
@@ -308,7 +308,8 @@ class TestBulkUploadInvestmentAccounts:
         data = response.json()
         assert data["created"] == 2
         assert data["updated"] == 0
-        assert data["invalid"] == []
+        assert data["invalid"] == 0
+        assert data["errors"] == []
 
 
 # Marcadores para organizar las pruebas
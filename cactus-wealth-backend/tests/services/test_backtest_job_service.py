@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cactus_wealth.models import BacktestJob, User, UserRole
+from cactus_wealth.schemas import (
+    BacktestRequest,
+    BacktestResponse,
+    PortfolioComposition,
+)
+from cactus_wealth.services import BacktestJobService
+
+
+@pytest.fixture
+def backtest_request():
+    return BacktestRequest(
+        composition=[PortfolioComposition(ticker="SPY", weight=1.0)],
+        benchmarks=["SPY"],
+        period="1y",
+    )
+
+
+@pytest.fixture
+def backtest_response(backtest_request):
+    return BacktestResponse(
+        start_date="2024-01-02",
+        end_date="2024-12-31",
+        portfolio_composition=backtest_request.composition,
+        benchmarks=backtest_request.benchmarks,
+        data_points=[],
+        performance_metrics={"total_return": 0.1},
+    )
+
+
+class TestBacktestJobService:
+    """Test cases for queued backtests."""
+
+    def test_create_job_rejects_invalid_weights(self, session, test_user):
+        request = BacktestRequest(
+            composition=[PortfolioComposition(ticker="SPY", weight=0.5)], period="1y"
+        )
+
+        with pytest.raises(ValueError):
+            BacktestJobService(session).create_job(request, test_user)
+
+    @pytest.mark.asyncio
+    async def test_run_job_persists_result_and_streams_progress(
+        self, session, test_user, backtest_request, backtest_response
+    ):
+        service = BacktestJobService(session)
+        job = service.create_job(backtest_request, test_user)
+
+        async def fake_backtest(self, request):
+            await self._report_progress("computing", 50)
+            return backtest_response
+
+        with patch(
+            "cactus_wealth.services.portfolio_backtest_service.PortfolioBacktestService.perform_backtest",
+            fake_backtest,
+        ), patch(
+            "cactus_wealth.services.job_service.publish_user_message",
+            new_callable=AsyncMock,
+        ) as mock_publish:
+            await service.run_job(job.id)
+
+        stored = session.get(BacktestJob, job.id)
+        assert stored.status == "COMPLETED"
+        assert stored.progress == 100
+        assert service.get_job(job.id, test_user).result == backtest_response
+
+        messages = [call.args[0] for call in mock_publish.await_args_list]
+        assert [m["type"] for m in messages] == [
+            "backtest_job_progress",
+            "backtest_job_completed",
+        ]
+        assert all(call.args[1] == test_user.id for call in mock_publish.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_run_job_records_failure(self, session, test_user, backtest_request):
+        service = BacktestJobService(session)
+        job = service.create_job(backtest_request, test_user)
+
+        with patch(
+            "cactus_wealth.services.portfolio_backtest_service.PortfolioBacktestService.perform_backtest",
+            AsyncMock(side_effect=ValueError("No historical data available for SPY")),
+        ), patch(
+            "cactus_wealth.services.job_service.publish_user_message",
+            new_callable=AsyncMock,
+        ) as mock_publish:
+            await service.run_job(job.id)
+
+        stored = session.get(BacktestJob, job.id)
+        assert stored.status == "FAILED"
+        assert "SPY" in stored.error
+        assert mock_publish.await_args.args[0]["type"] == "backtest_job_failed"
+
+    def test_get_job_hidden_from_other_users(self, session, test_user, backtest_request):
+        job = BacktestJobService(session).create_job(backtest_request, test_user)
+        other = User(id=test_user.id + 1000, username="x", email="x@example.com", hashed_password="x", role=UserRole.ADVISOR)
+
+        with pytest.raises(HTTPException) as exc_info:
+            BacktestJobService(session).get_job(job.id, other)
+
+        assert exc_info.value.status_code == 404
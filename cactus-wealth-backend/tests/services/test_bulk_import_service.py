@@ -0,0 +1,200 @@
+import asyncio
+import csv
+import io
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import select
+
+from cactus_wealth.core.config import settings
+from cactus_wealth.models import (
+    Client,
+    ClientStatus,
+    InsurancePolicy,
+    InvestmentAccount,
+    RiskProfile,
+    User,
+    UserRole,
+)
+from cactus_wealth.services import BulkImportService
+
+
+@pytest.fixture
+def book(session, test_user):
+    """One client of test_user and one of another advisor."""
+    other = User(username="other_imp", email="other_imp@example.com", hashed_password="x", role=UserRole.ADVISOR)
+    session.add(other)
+    session.commit()
+    mine = Client(
+        first_name="Ana",
+        last_name="Mine",
+        email="ana@example.com",
+        risk_profile=RiskProfile.HIGH,
+        status=ClientStatus.onboarding,
+        phone="111",
+        owner_id=test_user.id,
+    )
+    theirs = Client(first_name="Bo", last_name="Theirs", email="bo@example.com", owner_id=other.id)
+    session.add_all([mine, theirs])
+    session.commit()
+    session.add(
+        InsurancePolicy(
+            client_id=theirs.id,
+            policy_number="POL-1",
+            insurance_type="life",
+            coverage_amount=Decimal("1000"),
+            premium_amount=Decimal("10"),
+        )
+    )
+    session.commit()
+    return mine, theirs
+
+
+@pytest.fixture
+def service(session, tmp_path):
+    return BulkImportService(session, staging_dir=tmp_path)
+
+
+@pytest.fixture
+def notify():
+    with patch(
+        "cactus_wealth.services.job_service.publish_user_message", new_callable=AsyncMock
+    ) as mock:
+        yield mock
+
+
+async def run_import(service, user, kind, text, chunk_size=2):
+    job = service.create_job(kind, "import.csv", io.BytesIO(text.encode()), user)
+    with patch.object(settings, "BULK_UPLOAD_CHUNK_SIZE", chunk_size):
+        await service.run_job(job.id)
+    return service.to_read(job)
+
+
+class TestBulkImportService:
+    """Test cases for background multi-client imports."""
+
+    def test_create_job_stages_file(self, service, test_user):
+        job = service.create_job("clients", "book.csv", io.BytesIO(b"email\n"), test_user)
+
+        assert job.status == "QUEUED"
+        assert service.staged_path(job).read_bytes() == b"email\n"
+        with pytest.raises(ValueError):
+            service.create_job("clients", "book.txt", io.BytesIO(b""), test_user)
+
+    @pytest.mark.asyncio
+    async def test_client_import(self, session, service, test_user, book, notify):
+        mine, _ = book
+        job = await run_import(
+            service,
+            test_user,
+            "clients",
+            "first_name,last_name,email,risk_profile,phone\n"
+            "Ana,Updated,ana@example.com,,\n"  # blanks keep current values
+            "Carla,New,carla@example.com,low,555\n"
+            "Bo,Hijack,bo@example.com,,\n"  # another advisor's client
+            "Dan,Bad,not-an-email,,\n",
+        )
+
+        assert job.status == "COMPLETED"
+        assert job.result.model_dump() == {
+            "rows": 4,
+            "created": 1,
+            "updated": 1,
+            "invalid": 2,
+            "has_error_report": True,
+        }
+        session.refresh(mine)
+        assert (mine.last_name, mine.risk_profile, mine.status, mine.phone) == (
+            "Updated",
+            RiskProfile.HIGH,
+            ClientStatus.onboarding,
+            "111",
+        )
+        carla = session.exec(select(Client).where(Client.email == "carla@example.com")).one()
+        assert (carla.owner_id, carla.risk_profile, carla.status) == (
+            test_user.id,
+            RiskProfile.LOW,
+            ClientStatus.prospect,
+        )
+
+        with service.get_error_report(job.id, test_user).open() as report:
+            rows = list(csv.DictReader(report))
+        assert [(r["row"], r["error"]) for r in rows] == [
+            ("4", "El cliente pertenece a otro asesor"),
+            ("5", "email inválido"),
+        ]
+
+        types = [call.args[0]["type"] for call in notify.await_args_list]
+        assert "import_job_progress" in types
+        assert types[-1] == "import_job_completed"
+        assert not service.staged_path(job).exists()
+
+    @pytest.mark.asyncio
+    async def test_account_and_policy_import(self, session, service, test_user, book, notify):
+        mine, theirs = book
+        accounts = await run_import(
+            service,
+            test_user,
+            "investment_accounts",
+            "client_email,platform,account_number,aum\n"
+            "ana@example.com,Balanz,A-1,100\n"
+            "bo@example.com,Balanz,B-1,100\n"
+            "ana@example.com,IOL,A-2,oops\n",
+        )
+        policies = await run_import(
+            service,
+            test_user,
+            "insurance_policies",
+            "client_email,policy_number,insurance_type,coverage_amount,premium_amount\n"
+            "ana@example.com,POL-2,life,5000,50\n"
+            "ana@example.com,POL-1,life,5000,50\n",  # held by another client
+        )
+
+        assert accounts.result.created == 1
+        assert accounts.result.invalid == 2
+        assert policies.result.created == 1
+        assert policies.result.invalid == 1
+        assert session.exec(select(InvestmentAccount.account_number)).all() == ["A-1"]
+        held = session.exec(select(InsurancePolicy).where(InsurancePolicy.policy_number == "POL-1")).one()
+        assert (held.client_id, held.coverage_amount) == (theirs.id, Decimal("1000"))
+
+    @pytest.mark.asyncio
+    async def test_missing_columns_fail_the_job(self, service, test_user, notify):
+        job = await run_import(service, test_user, "investment_accounts", "platform,aum\nIOL,1\n")
+
+        assert job.status == "FAILED"
+        assert "client_email" in job.error
+        assert not service.staged_path(job).exists()
+        assert notify.await_args.args[0]["type"] == "import_job_failed"
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_keeps_staged_file(self, service, test_user, book, notify):
+        job = service.create_job(
+            "clients", "book.csv", io.BytesIO(b"first_name,last_name,email\nAna,X,ana@example.com\n"), test_user
+        )
+
+        with (
+            patch.object(service, "_import_chunk", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await service.run_job(job.id)
+
+        # The re-delivered job can still run
+        assert service.staged_path(job).exists()
+        await service.run_job(job.id)
+        assert service.to_read(job).status == "COMPLETED"
+        assert not service.staged_path(job).exists()
+
+        progress = next(
+            call.args[0] for call in notify.await_args_list if call.args[0]["type"] == "import_job_progress"
+        )
+        assert (progress["kind"], progress["rows"]) == ("clients", 1)
+
+    def test_jobs_are_private(self, service, test_user, another_user):
+        job = service.create_job("clients", "book.csv", io.BytesIO(b"email\n"), test_user)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_job(job.id, another_user)
+        assert exc_info.value.status_code == 404
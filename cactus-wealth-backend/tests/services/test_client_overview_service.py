@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from cactus_wealth.models import (
+    ActivityType,
+    Client,
+    ClientActivity,
+    ClientNote,
+    InvestmentAccount,
+    Portfolio,
+    PortfolioSnapshot,
+    Report,
+)
+from cactus_wealth.services import ClientOverviewService
+
+
+class DictRedis:
+    """Minimal in-memory stand-in for the synchronous Redis client."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+@contextmanager
+def count_queries(session):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def build_book(session, owner, portfolios):
+    referrer = Client(first_name="Rita", last_name="Ref", email=f"rita{portfolios}@example.com", owner_id=owner.id)
+    session.add(referrer)
+    session.commit()
+    client = Client(
+        first_name="Ana",
+        last_name="Overview",
+        email=f"ana{portfolios}@example.com",
+        owner_id=owner.id,
+        referred_by_client_id=referrer.id,
+    )
+    session.add(client)
+    session.commit()
+    start = datetime(2026, 1, 1)
+    for i in range(portfolios):
+        portfolio = Portfolio(name=f"P{i}", client_id=client.id, current_value=Decimal("100"))
+        session.add(portfolio)
+        session.commit()
+        session.add_all(
+            PortfolioSnapshot(portfolio_id=portfolio.id, value=Decimal(100 + day), timestamp=start + timedelta(days=day))
+            for day in range(3)
+        )
+        session.add(InvestmentAccount(client_id=client.id, platform="IOL", account_number=f"O-{i}", aum=Decimal("10")))
+        session.add(
+            ClientActivity(
+                client_id=client.id,
+                activity_type=ActivityType.call_made,
+                description="call",
+                created_by=owner.id,
+            )
+        )
+        session.add(ClientNote(client_id=client.id, title="n", content="x", created_by=owner.id))
+    session.add(Client(first_name="Bo", last_name="Kid", email=f"bo{portfolios}@example.com", owner_id=owner.id, referred_by_client_id=client.id))
+    session.add(Report(client_id=client.id, advisor_id=owner.id, file_path="r.pdf"))
+    session.commit()
+    return client, referrer
+
+
+def test_overview_contents(session, test_user):
+    client, referrer = build_book(session, test_user, portfolios=2)
+
+    overview = ClientOverviewService(session, redis_client=DictRedis()).get_overview(client.id, test_user)
+
+    assert overview.client.id == client.id
+    assert [(p.name, p.latest_snapshot_value) for p in overview.portfolios] == [
+        ("P0", Decimal("102")),
+        ("P1", Decimal("102")),
+    ]
+    assert overview.total_aum == Decimal("20")
+    assert len(overview.recent_activities) == len(overview.recent_notes) == 2
+    assert overview.latest_report.file_path == "r.pdf"
+    assert overview.referred_by.id == referrer.id
+    assert [c.first_name for c in overview.referred_clients] == ["Bo"]
+
+
+def test_query_count_does_not_grow_with_data(session, test_user):
+    small, _ = build_book(session, test_user, portfolios=1)
+    large, _ = build_book(session, test_user, portfolios=6)
+    service = ClientOverviewService(session, redis_client=DictRedis())
+
+    with count_queries(session) as small_queries:
+        service.get_overview(small.id, test_user)
+    with count_queries(session) as large_queries:
+        service.get_overview(large.id, test_user)
+
+    assert len(small_queries) == len(large_queries) <= 10
+
+
+def test_cache_follows_client_version(session, test_user):
+    client, _ = build_book(session, test_user, portfolios=1)
+    service = ClientOverviewService(session, redis_client=DictRedis())
+    first = service.get_overview(client.id, test_user)
+
+    with count_queries(session) as queries:
+        assert service.get_overview(client.id, test_user) == first
+    assert len(queries) == 1  # Only the version probe
+
+    session.add(ClientNote(client_id=client.id, title="new", content="x", created_by=test_user.id))
+    session.commit()
+    second = service.get_overview(client.id, test_user)
+
+    assert second.version != first.version
+    assert len(second.recent_notes) == 2
+
+
+def test_overview_is_private(session, test_user, another_user):
+    client, _ = build_book(session, test_user, portfolios=1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        ClientOverviewService(session, redis_client=DictRedis()).get_overview(client.id, another_user)
+    assert exc_info.value.status_code == 404
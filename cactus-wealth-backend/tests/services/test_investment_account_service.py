@@ -0,0 +1,132 @@
+import io
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from openpyxl import Workbook
+from sqlmodel import select
+
+from cactus_wealth.models import Client, InvestmentAccount, RiskProfile
+from cactus_wealth.services import InvestmentAccountService
+
+
+@pytest.fixture
+def client_record(session, test_user):
+    client = Client(
+        first_name="Bulk",
+        last_name="Upload",
+        email="bulk.upload@example.com",
+        risk_profile=RiskProfile.LOW,
+        owner_id=test_user.id,
+    )
+    session.add(client)
+    session.commit()
+    session.add(
+        InvestmentAccount(
+            client_id=client.id, platform="Old", account_number="A-1", aum=Decimal("1")
+        )
+    )
+    session.commit()
+    return client
+
+
+def csv_upload(text, filename="accounts.csv"):
+    return UploadFile(file=io.BytesIO(text.encode()), filename=filename)
+
+
+def xlsx_upload(rows, filename="accounts.xlsx"):
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    return UploadFile(file=buffer, filename=filename)
+
+
+class TestBulkUpload:
+    """Test cases for chunked investment account uploads."""
+
+    def test_upserts_across_chunks(self, session, test_user, client_record):
+        upload = csv_upload(
+            "platform,account_number,aum\n"
+            "Balanz,A-1,1500.50\n"  # existing account -> update
+            "IOL,00042,200\n"  # leading zeros survive
+            ",A-3,10\n"  # missing platform
+            "IOL,A-4,not-a-number\n"
+            "Balanz,A-5,300\n"
+            "Balanz,A-5,350\n"  # repeated in the same chunk -> last one wins
+            "IOL,00042,250\n"  # repeated in a later chunk
+        )
+
+        result = InvestmentAccountService(session).bulk_upload_investment_accounts(
+            client_record.id, upload, test_user, chunk_size=3
+        )
+
+        assert result["created"] == 2
+        assert result["updated"] == 3
+        assert result["valid_rows"] == 5
+        assert result["invalid_rows"] == 2
+        assert [e["row"] for e in result["errors"]] == [4, 5]
+        assert result["errors"][0]["data"]["platform"] is None
+
+        accounts = {
+            a.account_number: a
+            for a in session.exec(
+                select(InvestmentAccount).where(InvestmentAccount.client_id == client_record.id)
+            )
+        }
+        assert set(accounts) == {"A-1", "00042", "A-5"}
+        assert accounts["A-1"].platform == "Balanz"
+        assert accounts["A-1"].aum == Decimal("1500.50")
+        assert accounts["00042"].aum == Decimal("250")
+        assert accounts["A-5"].aum == Decimal("350")
+
+    def test_reads_xlsx_in_chunks(self, session, test_user, client_record):
+        upload = xlsx_upload(
+            [
+                ("platform", "account_number", "aum"),
+                ("Balanz", "A-1", 1500.5),  # existing account -> update
+                ("IOL", "00042", 200),  # text cell keeps its leading zeros
+                (None, "A-3", 10),  # empty platform cell
+                ("IOL", "A-4", "not-a-number"),
+                ("Balanz", "A-5", 300),
+            ]
+        )
+
+        result = InvestmentAccountService(session).bulk_upload_investment_accounts(
+            client_record.id, upload, test_user, chunk_size=2
+        )
+
+        assert (result["created"], result["updated"], result["invalid_rows"]) == (2, 1, 2)
+        # Rows are numbered as in the spreadsheet, across chunks
+        assert [e["row"] for e in result["errors"]] == [4, 5]
+        accounts = {
+            a.account_number: a.aum
+            for a in session.exec(
+                select(InvestmentAccount).where(InvestmentAccount.client_id == client_record.id)
+            )
+        }
+        assert accounts == {"A-1": Decimal("1500.50"), "00042": Decimal("200"), "A-5": Decimal("300")}
+
+    def test_unreadable_xlsx(self, session, test_user, client_record):
+        result = InvestmentAccountService(session).bulk_upload_investment_accounts(
+            client_record.id, csv_upload("not a workbook", "accounts.xlsx"), test_user
+        )
+
+        assert result["error"].startswith("Archivo inválido")
+
+    def test_missing_columns(self, session, test_user, client_record):
+        result = InvestmentAccountService(session).bulk_upload_investment_accounts(
+            client_record.id, csv_upload("platform,aum\nIOL,1\n"), test_user
+        )
+
+        assert result == {"error": "Faltan columnas requeridas: account_number"}
+
+    def test_other_advisor_is_rejected(self, session, another_user, client_record):
+        with pytest.raises(HTTPException) as exc_info:
+            InvestmentAccountService(session).bulk_upload_investment_accounts(
+                client_record.id, csv_upload("platform,account_number,aum\n"), another_user
+            )
+
+        assert exc_info.value.status_code == 403
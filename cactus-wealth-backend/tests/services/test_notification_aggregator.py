@@ -0,0 +1,123 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlmodel import select
+
+from cactus_wealth.models import (
+    Asset,
+    AssetType,
+    Client,
+    Notification,
+    Portfolio,
+    PortfolioSnapshot,
+    Position,
+)
+from cactus_wealth.services import NotificationAggregator, PortfolioSnapshotService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def frames():
+    """WebSocket frames published per user."""
+    published = []
+
+    async def publish(message, user_id):
+        published.append((user_id, message))
+
+    with patch("cactus_wealth.services.notification_aggregator.publish_user_message", publish):
+        yield published
+
+
+def inbox(session, user):
+    return session.exec(
+        select(Notification.message).where(Notification.user_id == user.id).order_by(Notification.id)
+    ).all()
+
+
+@pytest.mark.asyncio
+async def test_events_are_collapsed_into_digests(session, frames, test_user, another_user):
+    async with NotificationAggregator(session, window=60) as notifier:
+        for i in range(23):
+            await notifier.add(test_user.id, "portfolio_valuation", f"Portfolio {i} actualizado")
+        await notifier.add(test_user.id, "report_generated", "Reporte generado")
+        await notifier.add(another_user.id, "portfolio_valuation", "Portfolio X actualizado")
+        assert notifier.pending == 25
+        assert inbox(session, test_user) == []
+
+    assert inbox(session, test_user) == ["23 valoraciones de portfolio actualizadas", "Reporte generado"]
+    assert inbox(session, another_user) == ["Portfolio X actualizado"]
+    # One frame per user carrying all of that user's new notifications
+    assert [(user_id, len(message["data"])) for user_id, message in frames] == [
+        (test_user.id, 2),
+        (another_user.id, 1),
+    ]
+    assert frames[0][1]["type"] == "notifications"
+    assert [(n["message"], n["is_read"]) for n in frames[0][1]["data"]] == [
+        ("23 valoraciones de portfolio actualizadas", False),
+        ("Reporte generado", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_windows_close_per_user(session, frames, test_user, another_user):
+    clock = FakeClock()
+    notifier = NotificationAggregator(session, window=30, clock=clock)
+
+    await notifier.add(test_user.id, "report_generated", "Reporte 1")
+    clock.now = 20
+    await notifier.add(another_user.id, "report_generated", "Reporte 2")
+    await notifier.add(test_user.id, "report_generated", "Reporte 3")
+    assert frames == []
+
+    clock.now = 31  # test_user's window has closed, another_user's has not
+    await notifier.add(another_user.id, "report_generated", "Reporte 4")
+    assert inbox(session, test_user) == ["2 reportes generados"]
+    assert inbox(session, another_user) == []
+
+    await notifier.flush()
+    assert inbox(session, another_user) == ["2 reportes generados"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_run_notifies_each_owner_once(session, frames, test_user):
+    spy = Asset(ticker_symbol="SPY", name="S&P 500 ETF", asset_type=AssetType.ETF)
+    session.add(spy)
+    session.commit()
+    for i in range(3):
+        client = Client(first_name=f"Snap{i}", last_name="Client", email=f"snap{i}@example.com", owner_id=test_user.id)
+        session.add(client)
+        session.commit()
+        portfolio = Portfolio(name=f"Snap {i}", client_id=client.id)
+        session.add(portfolio)
+        session.commit()
+        session.add(
+            Position(
+                quantity=i + 1,
+                purchase_price=100,
+                average_price=100,
+                current_price=100,
+                portfolio_id=portfolio.id,
+                asset_id=spy.id,
+            )
+        )
+        session.commit()
+    price_service = Mock()
+    price_service.get_latest_prices = AsyncMock(return_value={"SPY": 110.0})
+
+    async with NotificationAggregator(session) as notifier:
+        created = await PortfolioSnapshotService(session, price_service).snapshot_all(notifier)
+
+    assert created == 3
+    price_service.get_latest_prices.assert_awaited_once_with(["SPY"])
+    values = session.exec(select(PortfolioSnapshot.value).order_by(PortfolioSnapshot.portfolio_id)).all()
+    assert values == [Decimal("110"), Decimal("220"), Decimal("330")]
+    assert inbox(session, test_user) == ["3 valoraciones de portfolio actualizadas"]
+    assert len(frames) == 1
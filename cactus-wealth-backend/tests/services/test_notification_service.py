@@ -0,0 +1,84 @@
+import pytest
+from fastapi import HTTPException
+
+from cactus_wealth.models import Notification
+from cactus_wealth.services import NotificationService
+from cactus_wealth.services.notification_service import UNREAD_COUNT_KEY
+
+
+class CounterRedis:
+    """Minimal in-memory stand-in for the Redis counter commands."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return None if value is None else str(value).encode()
+
+    def setex(self, key, ttl, value):
+        self.store[key] = int(value)
+
+    def incrby(self, key, amount):
+        self.store[key] = self.store.get(key, 0) + amount
+        return self.store[key]
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def redis_client():
+    return CounterRedis()
+
+
+@pytest.fixture
+def service(session, redis_client):
+    return NotificationService(session, redis_client=redis_client)
+
+
+def test_unread_count_is_cached_and_kept_in_step(service, redis_client, test_user):
+    key = UNREAD_COUNT_KEY.format(user_id=test_user.id)
+
+    # Nothing is cached until the count is first read
+    first = service.create_notification(test_user.id, "one")
+    assert key not in redis_client.store
+    assert service.unread_count(test_user.id) == 1
+    assert redis_client.store[key] == 1
+
+    second = service.create_notification(test_user.id, "two")
+    service.create_notification(test_user.id, "three")
+    assert redis_client.store[key] == 3
+
+    service.set_read(test_user.id, first.id)
+    service.set_read(test_user.id, first.id)  # Already read: no change
+    assert service.unread_count(test_user.id) == 2
+
+    service.set_read(test_user.id, first.id, is_read=False)
+    assert service.unread_count(test_user.id) == 3
+
+    assert service.mark_all_read(test_user.id, up_to_id=second.id) == 2
+    assert service.unread_count(test_user.id) == 1
+    assert service.mark_all_read(test_user.id) == 1
+    assert service.unread_count(test_user.id) == 0
+
+
+def test_drifted_counter_is_recounted(session, service, redis_client, test_user):
+    key = UNREAD_COUNT_KEY.format(user_id=test_user.id)
+    session.add_all([Notification(user_id=test_user.id, message=f"m{i}") for i in range(3)])
+    session.commit()
+    redis_client.store[key] = 1  # Missed two increments
+
+    service.mark_all_read(test_user.id)
+
+    assert key not in redis_client.store
+    assert service.unread_count(test_user.id) == 0
+
+
+def test_notifications_of_other_users_are_not_found(service, test_user, another_user):
+    notification = service.create_notification(another_user.id, "private")
+
+    with pytest.raises(HTTPException) as exc:
+        service.set_read(test_user.id, notification.id)
+    assert exc.value.status_code == 404
+    assert service.unread_count(another_user.id) == 1
@@ -1,3 +1,5 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -6,6 +8,14 @@ import pandas as pd
 import pytest
 
 import cactus_wealth.services as services
+from cactus_wealth.core.backtest_compute import (
+    portfolio_daily_returns,
+    rebalance_starts,
+    rebalanced_values,
+    run_backtest_computation,
+    shutdown_process_pool,
+)
+from cactus_wealth.core.price_series import decode_price_series, encode_price_series
 from cactus_wealth.schemas import (
     BacktestRequest,
     BacktestResponse,
@@ -13,9 +23,24 @@ from cactus_wealth.schemas import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _shut_down_shared_process_pool():
+    """Backtests create the shared process pool on demand; don't let it outlive the test."""
+    yield
+    shutdown_process_pool()
+
+
 class TestPortfolioBacktestService:
     """Test cases for PortfolioBacktestService backtesting functionality."""
 
+    @pytest.fixture
+    def process_pool(self):
+        """A process pool owned by the test, used in place of the shared one."""
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        with patch("cactus_wealth.core.backtest_compute.get_process_pool", return_value=pool):
+            yield pool
+        pool.shutdown(wait=True)
+
     @pytest.fixture
     def backtest_service(self):
         """Create PortfolioBacktestService instance."""
@@ -126,6 +151,185 @@ class TestPortfolioBacktestService:
         with pytest.raises(ValueError, match="Portfolio weights must sum to 1.0"):
             await backtest_service.perform_backtest(invalid_request)
 
+    @pytest.mark.asyncio
+    async def test_backtest_result_cache_serves_equivalent_requests(
+        self, backtest_service, sample_backtest_request, sample_historical_data
+    ):
+        """Equivalent backtests are served from one cached result."""
+        store: dict[str, str] = {}
+        mock_redis = Mock()
+        mock_redis.get = AsyncMock(side_effect=store.get)
+        mock_redis.setex = AsyncMock(
+            side_effect=lambda key, _ttl, value: store.__setitem__(key, value)
+        )
+        backtest_service.redis_client = mock_redis
+
+        reordered_request = BacktestRequest(
+            composition=list(reversed(sample_backtest_request.composition)),
+            benchmarks=["spy"],
+            period="6mo",
+        )
+
+        with patch.object(
+            backtest_service, "_download_historical_data_cached", new_callable=AsyncMock
+        ) as mock_download:
+            mock_download.return_value = sample_historical_data
+            first = await backtest_service.perform_backtest(sample_backtest_request)
+            second = await backtest_service.perform_backtest(reordered_request)
+
+        mock_download.assert_awaited_once()
+        assert len(store) == 1
+        assert second.data_points == first.data_points
+        assert second.performance_metrics == first.performance_metrics
+        assert second.portfolio_composition == reordered_request.composition
+        # Benchmarks are normalized on the request, so the echoed list matches
+        # the keys of the cached benchmark_values
+        assert second.benchmarks == ["SPY"]
+        assert set(second.data_points[0].benchmark_values) == {"SPY"}
+
+    def test_result_cache_key_changes_with_data_version(
+        self, backtest_service, sample_backtest_request
+    ):
+        """Extending the price series invalidates cached results."""
+        with patch.object(backtest_service, "_data_version", return_value="2024-01-02"):
+            key_before = backtest_service._result_cache_key(sample_backtest_request)
+        with patch.object(backtest_service, "_data_version", return_value="2024-01-03"):
+            key_after = backtest_service._result_cache_key(sample_backtest_request)
+
+        assert key_before != key_after
+
+    def test_price_series_binary_round_trip(self):
+        """Encoded price series decode back to identical dates and closes."""
+        series = pd.Series(
+            [100.5, 101.25, np.nan, 99.0],
+            index=pd.date_range("2023-01-02", periods=4, freq="B", tz="UTC"),
+        )
+
+        for compress in (True, False):
+            decoded = decode_price_series(encode_price_series(series, compress=compress))
+            assert decoded.index.equals(series.index.tz_localize(None))
+            np.testing.assert_array_equal(decoded.to_numpy(), series.to_numpy())
+
+        with pytest.raises(ValueError):
+            decode_price_series(b'{"prices": [], "dates": []}')
+
+    @pytest.mark.asyncio
+    async def test_cached_price_series_fetched_with_single_mget(
+        self, backtest_service, sample_historical_data
+    ):
+        """All cached tickers come back from one MGET without downloading."""
+        mock_redis = Mock()
+        mock_redis.mget = AsyncMock(
+            return_value=[
+                encode_price_series(sample_historical_data[t]) for t in ("SPY", "AAPL")
+            ]
+        )
+        backtest_service.redis_client = mock_redis
+
+        with patch("yfinance.download") as mock_yf:
+            result = await backtest_service._download_historical_data_cached(
+                ["SPY", "AAPL"], "6mo"
+            )
+
+        mock_redis.mget.assert_awaited_once()
+        mock_yf.assert_not_called()
+        pd.testing.assert_frame_equal(
+            result, sample_historical_data, check_freq=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_latest_prices_skip_tickers_without_data(
+        self, backtest_service, sample_historical_data
+    ):
+        """A delisted ticker does not fail the lookup for the others."""
+        download = pd.concat(
+            {"Close": sample_historical_data.assign(DEAD=np.nan)}, axis=1
+        )
+
+        with patch("yfinance.download", return_value=download) as mock_yf:
+            prices = await backtest_service.get_latest_prices(["SPY", "AAPL", "DEAD"])
+
+        mock_yf.assert_called_once()
+        assert prices == {
+            "SPY": pytest.approx(sample_historical_data["SPY"].iloc[-1]),
+            "AAPL": pytest.approx(sample_historical_data["AAPL"].iloc[-1]),
+        }
+
+    @pytest.mark.asyncio
+    async def test_process_pool_computation_matches_inline(
+        self, sample_historical_data, process_pool
+    ):
+        """Shared-memory process pool results equal the in-thread computation."""
+        weights = np.array([0.6, 0.4])
+
+        pooled = await run_backtest_computation(
+            sample_historical_data, weights, ["SPY"]
+        )
+        with patch(
+            "cactus_wealth.core.backtest_compute.get_process_pool", return_value=None
+        ):
+            inline = await run_backtest_computation(
+                sample_historical_data, weights, ["SPY"]
+            )
+
+        assert pooled == inline
+        assert pooled["data_points"][0]["date"] == "2023-01-01"
+        assert pooled["data_points"][-1]["benchmark_values"]["SPY"] == pytest.approx(
+            100 * sample_historical_data["SPY"].iloc[-1] / sample_historical_data["SPY"].iloc[0]
+        )
+
+    @staticmethod
+    def _reference_rebalanced_values(prices, weights, mode, dates, threshold, cost_bps):
+        """Day-by-day loop used as the reference for the vectorized engine."""
+        units = 100.0 * weights / prices[0]
+        values = [100.0]
+        for t in range(1, len(prices)):
+            value = float(units @ prices[t])
+            drift = units * prices[t] / value
+            if mode == "monthly":
+                rebalance = dates[t].month != dates[t - 1].month
+            else:
+                rebalance = np.abs(drift - weights).max() > threshold
+            if rebalance:
+                value *= 1 - np.abs(drift - weights).sum() * cost_bps / 10_000
+                units = value * weights / prices[t]
+            values.append(value)
+        return np.array(values)
+
+    @pytest.mark.parametrize("mode", ["monthly", "threshold"])
+    def test_rebalanced_values_match_daily_loop(self, sample_historical_data, mode):
+        """Segment-wise cumprod equals a per-day simulation, costs included."""
+        prices = sample_historical_data[["SPY", "AAPL"]].to_numpy()
+        dates = sample_historical_data.index
+        weights = np.array([0.6, 0.4])
+
+        starts = rebalance_starts(prices, dates.asi8, weights, mode, threshold=0.02)
+        values, turnover = rebalanced_values(prices, weights, starts, cost_bps=25)
+
+        expected = self._reference_rebalanced_values(
+            prices, weights, mode, dates, 0.02, 25
+        )
+        np.testing.assert_allclose(values, expected, rtol=1e-10)
+        assert len(turnover) == len(starts) - 1 > 0
+
+    def test_daily_and_buy_and_hold_rebalancing(self, sample_historical_data):
+        prices = sample_historical_data[["SPY", "AAPL"]].to_numpy()
+        dates_ns = sample_historical_data.index.asi8
+        weights = np.array([0.6, 0.4])
+
+        daily, _ = rebalanced_values(
+            prices, weights, rebalance_starts(prices, dates_ns, weights, "daily")
+        )
+        held, turnover = rebalanced_values(
+            prices, weights, rebalance_starts(prices, dates_ns, weights, "none")
+        )
+
+        np.testing.assert_allclose(
+            daily, 100 * np.cumprod(1 + portfolio_daily_returns(prices, weights))
+        )
+        np.testing.assert_allclose(held, 100 * (prices / prices[0]) @ weights)
+        assert len(turnover) == 0
+
     def test_calculate_portfolio_daily_returns_with_proper_index(
         self, backtest_service, sample_historical_data, sample_composition
     ):
@@ -194,6 +398,8 @@ class TestPortfolioBacktestService:
         """
         # Mock Redis client
         mock_redis = Mock()
+        mock_redis.mget = AsyncMock(return_value=[None])
+        mock_redis.pipeline.return_value.execute = AsyncMock()
         backtest_service.redis_client = mock_redis
 
         # Test with Series (normal case)
@@ -216,8 +422,9 @@ class TestPortfolioBacktestService:
                     ["SPY"], "1mo"
                 )
 
-                # Verify cache was called (serialization didn't fail)
-                mock_redis.setex.assert_called()
+                # Verify cache was written (serialization didn't fail)
+                mock_redis.pipeline.return_value.setex.assert_called()
+                mock_redis.pipeline.return_value.execute.assert_awaited_once()
 
                 # Verify result structure
                 assert isinstance(result, pd.DataFrame)
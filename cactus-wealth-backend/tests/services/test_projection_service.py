@@ -0,0 +1,119 @@
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from cactus_wealth.core.monte_carlo import simulate_value_bands
+from cactus_wealth.models import Client, User, UserRole
+from cactus_wealth.schemas import ProjectionRequest
+from cactus_wealth.services import ProjectionService
+
+
+class TestMonteCarloEngine:
+    """Test cases for the vectorized Monte Carlo engine."""
+
+    @pytest.fixture
+    def monthly_returns(self):
+        rng = np.random.default_rng(7)
+        return rng.normal(0.006, 0.04, 60)
+
+    def test_seeded_runs_are_reproducible(self, monthly_returns):
+        kwargs = {
+            "initial_value": 100_000,
+            "monthly_contribution": 500,
+            "horizon_years": 5,
+            "n_paths": 2_000,
+            "percentiles": [5, 50, 95],
+            "seed": 123,
+            "chunk_size": 512,
+        }
+
+        first = simulate_value_bands(monthly_returns, **kwargs)
+        second = simulate_value_bands(monthly_returns, **kwargs)
+
+        np.testing.assert_array_equal(first["bands"], second["bands"])
+        assert first["seed"] == 123
+        # Bands are ordered and start at the initial value
+        assert (np.diff(first["bands"], axis=0) >= 0).all()
+        np.testing.assert_allclose(first["bands"][:, 0], 100_000)
+
+    def test_zero_returns_accumulate_contributions(self):
+        result = simulate_value_bands(
+            np.zeros(24),
+            initial_value=1_000,
+            monthly_contribution=100,
+            horizon_years=2,
+            n_paths=100,
+            percentiles=[50],
+            method="parametric",
+            seed=1,
+        )
+
+        np.testing.assert_allclose(result["bands"][0], [1_000, 2_200, 3_400])
+        assert result["loss_probability"] == 0.0
+
+    def test_unknown_method_rejected(self, monthly_returns):
+        with pytest.raises(ValueError):
+            simulate_value_bands(
+                monthly_returns, 1_000, 0, 1, 100, [50], method="garch", seed=1
+            )
+
+
+class TestProjectionService:
+    """Test cases for ProjectionService."""
+
+    @pytest.fixture
+    def advisor(self):
+        return User(id=1, username="advisor", email="a@example.com", hashed_password="x", role=UserRole.ADVISOR)
+
+    @pytest.fixture
+    def client(self):
+        return Client(id=5, first_name="Ana", last_name="Pérez", email="ana@example.com", owner_id=1, savings_capacity=250.0)
+
+    @pytest.fixture
+    def price_history(self):
+        dates = pd.bdate_range("2020-01-01", periods=800)
+        rng = np.random.default_rng(3)
+        return pd.DataFrame(
+            {
+                "SPY": 300 * np.cumprod(1 + rng.normal(0.0004, 0.01, len(dates))),
+                "AGG": 100 * np.cumprod(1 + rng.normal(0.0001, 0.003, len(dates))),
+            },
+            index=dates,
+        )
+
+    @pytest.mark.asyncio
+    async def test_project_client_uses_savings_capacity(self, advisor, client, price_history):
+        db = Mock()
+        db.get.return_value = client
+        db.exec.side_effect = [
+            Mock(all=Mock(return_value=[10, 11])),
+            Mock(all=Mock(return_value=[("SPY", 10, 400), ("AGG", 100, 60)])),
+        ]
+        backtest_service = Mock()
+        backtest_service.get_close_prices = AsyncMock(return_value=price_history)
+
+        service = ProjectionService(db, backtest_service)
+        result = await service.project_client(
+            5, ProjectionRequest(horizon_years=3, n_paths=500, seed=42), advisor
+        )
+
+        assert result.initial_value == pytest.approx(10_000)
+        assert result.monthly_contribution == 250.0
+        assert result.portfolio_ids == [10, 11]
+        assert [band.year for band in result.bands] == [0, 1, 2, 3]
+        assert set(result.bands[-1].percentiles) == {"p5", "p25", "p50", "p75", "p95"}
+        assert result.seed == 42
+
+    @pytest.mark.asyncio
+    async def test_project_client_access_denied(self, client):
+        other = User(id=2, username="other", email="o@example.com", hashed_password="x", role=UserRole.ADVISOR)
+        db = Mock()
+        db.get.return_value = client
+
+        with pytest.raises(HTTPException) as exc_info:
+            await ProjectionService(db, Mock()).project_client(5, ProjectionRequest(), other)
+
+        assert exc_info.value.status_code == 403
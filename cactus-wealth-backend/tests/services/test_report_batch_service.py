@@ -0,0 +1,234 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlmodel import select
+
+from cactus_wealth.models import (
+    Asset,
+    AssetType,
+    Client,
+    Portfolio,
+    Position,
+    Report,
+    ReportJob,
+    RiskProfile,
+    User,
+    UserRole,
+)
+from cactus_wealth.schemas import BulkReportRequest
+from cactus_wealth.services import ReportBatchService
+from cactus_wealth.services.report_service import price_portfolio
+
+
+@pytest.fixture
+def book(session, test_user):
+    """Two clients of test_user with overlapping holdings, plus another advisor's client."""
+    other = User(username="other_adv", email="other_adv@example.com", hashed_password="x", role=UserRole.ADVISOR)
+    session.add(other)
+    session.commit()
+
+    spy = Asset(ticker_symbol="SPY", name="S&P 500 ETF", asset_type=AssetType.ETF)
+    agg = Asset(ticker_symbol="AGG", name="Aggregate Bond ETF", asset_type=AssetType.ETF)
+    session.add_all([spy, agg])
+    session.commit()
+
+    clients = []
+    for i, (owner, holdings) in enumerate(
+        [
+            (test_user, [(spy, 10)]),
+            (test_user, [(spy, 5), (agg, 20)]),
+            (other, [(agg, 1)]),
+        ]
+    ):
+        client = Client(
+            first_name=f"Client{i}",
+            last_name="Book",
+            email=f"book{i}@example.com",
+            risk_profile=RiskProfile.MEDIUM,
+            owner_id=owner.id,
+        )
+        session.add(client)
+        session.commit()
+        portfolio = Portfolio(name=f"Portfolio {i}", client_id=client.id)
+        session.add(portfolio)
+        session.commit()
+        for asset, quantity in holdings:
+            session.add(
+                Position(
+                    quantity=quantity,
+                    purchase_price=100,
+                    average_price=100,
+                    current_price=100,
+                    portfolio_id=portfolio.id,
+                    asset_id=asset.id,
+                )
+            )
+        session.commit()
+        clients.append(client)
+    return clients
+
+
+@pytest.fixture
+def price_service():
+    service = Mock()
+    service.get_latest_prices = AsyncMock(return_value={"SPY": 110.0, "AGG": 95.0})
+    return service
+
+
+class TestReportBatchService:
+    """Test cases for bulk report runs."""
+
+    @pytest.mark.asyncio
+    async def test_generates_reports_for_advisor_book(
+        self, session, test_user, book, price_service, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        progress = []
+
+        async def on_progress(stage, percent):
+            progress.append(percent)
+
+        with patch(
+            "cactus_wealth.services.report_service.render_pdf",
+            new_callable=AsyncMock,
+            return_value=b"%PDF-bulk",
+        ) as mock_render:
+            result = await ReportBatchService(session, price_service).generate_reports(
+                BulkReportRequest(), test_user, on_progress
+            )
+
+        assert result.generated == 2
+        assert result.skipped == []
+        assert mock_render.await_count == 2
+        # One price lookup for the union of tickers across the book
+        price_service.get_latest_prices.assert_awaited_once_with(["AGG", "SPY"])
+
+        reports = session.exec(select(Report).where(Report.id.in_(result.report_ids))).all()
+        assert {r.client_id for r in reports} == {book[0].id, book[1].id}
+        assert all((tmp_path / "reports" / r.file_path).read_bytes() == b"%PDF-bulk" for r in reports)
+        assert progress == sorted(progress)
+        assert progress[-1] == 100
+
+    @pytest.mark.asyncio
+    async def test_rerun_reuses_stored_pdfs(
+        self, session, test_user, book, price_service, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        service = ReportBatchService(session, price_service)
+
+        with patch(
+            "cactus_wealth.services.report_service.render_pdf",
+            new_callable=AsyncMock,
+            return_value=b"%PDF",
+        ) as mock_render:
+            first = await service.generate_reports(BulkReportRequest(), test_user)
+            second = await service.generate_reports(BulkReportRequest(), test_user)
+
+        assert mock_render.await_count == 2
+        assert (first.reused, second.reused) == (0, 2)
+        reports = session.exec(select(Report).where(Report.id.in_(first.report_ids + second.report_ids))).all()
+        assert len(reports) == 4
+        # Each client's two reports point at one stored artifact
+        assert len({r.file_path for r in reports}) == 2
+        assert len(list((tmp_path / "reports").glob("*.pdf"))) == 2
+
+    def test_values_positions_at_fetched_prices(self, session, test_user, book):
+        (client,), _ = ReportBatchService(session, Mock())._load_clients(
+            BulkReportRequest(client_ids=[book[1].id]), test_user
+        )
+
+        valuation, lines = price_portfolio(client.portfolios[0], {"SPY": 110.0})
+
+        # AGG has no fetched price and falls back to the stored one
+        assert valuation.total_value == pytest.approx(5 * 110 + 20 * 100)
+        assert valuation.total_cost_basis == pytest.approx(2_500)
+        assert valuation.positions_count == 2
+        assert {line.asset.ticker_symbol: line.current_price for line in lines} == {
+            "SPY": 110.0,
+            "AGG": 100.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_skips_inaccessible_and_failed_clients(
+        self, session, test_user, book, price_service, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+
+        async def flaky_render(html):
+            if "Portfolio 0" in html:
+                raise RuntimeError("font missing")
+            return b"%PDF"
+
+        with patch("cactus_wealth.services.report_service.render_pdf", flaky_render):
+            result = await ReportBatchService(session, price_service).generate_reports(
+                BulkReportRequest(client_ids=[c.id for c in book]), test_user
+            )
+
+        assert result.generated == 1
+        reasons = {skip.client_id: skip.reason for skip in result.skipped}
+        assert reasons[book[2].id] == "Client not found or access denied"
+        assert "font missing" in reasons[book[0].id]
+
+    @pytest.mark.asyncio
+    async def test_reports_every_portfolio_and_lists_clients_without_holdings(
+        self, session, test_user, book, price_service, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        empty = Client(
+            first_name="Empty",
+            last_name="Book",
+            email="empty.book@example.com",
+            risk_profile=RiskProfile.LOW,
+            owner_id=test_user.id,
+        )
+        second = Portfolio(name="Second", client_id=book[0].id)
+        session.add_all([empty, second])
+        session.commit()
+
+        with patch(
+            "cactus_wealth.services.report_service.render_pdf",
+            new_callable=AsyncMock,
+            return_value=b"%PDF",
+        ) as mock_render:
+            result = await ReportBatchService(session, price_service).generate_reports(
+                BulkReportRequest(), test_user
+            )
+
+        assert result.generated == 2
+        assert [skip.model_dump() for skip in result.skipped] == [
+            {"client_id": empty.id, "reason": "No holdings found for client"},
+        ]
+        # The client's report is consolidated over both of its portfolios
+        html = next(
+            call.args[0] for call in mock_render.await_args_list if "Client0" in call.args[0]
+        )
+        assert "Portfolio 0" in html
+        assert "Second" in html
+        reports = session.exec(select(Report).where(Report.id.in_(result.report_ids))).all()
+        assert {r.report_type for r in reports} == {"CLIENT_CONSOLIDATED"}
+
+    @pytest.mark.asyncio
+    async def test_run_job_persists_result_and_streams_progress(
+        self, session, test_user, book, price_service, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        service = ReportBatchService(session, price_service)
+        job = service.create_job(BulkReportRequest(), test_user)
+
+        with patch(
+            "cactus_wealth.services.report_service.render_pdf",
+            new_callable=AsyncMock,
+            return_value=b"%PDF",
+        ), patch(
+            "cactus_wealth.services.job_service.publish_user_message",
+            new_callable=AsyncMock,
+        ) as mock_publish:
+            await service.run_job(job.id)
+
+        stored = session.get(ReportJob, job.id)
+        assert stored.status == "COMPLETED"
+        assert service.get_job(job.id, test_user).result.generated == 2
+
+        types = [call.args[0]["type"] for call in mock_publish.await_args_list]
+        assert types[-1] == "report_job_completed"
+        assert set(types[:-1]) == {"report_job_progress"}
@@ -1,5 +1,5 @@
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from sqlmodel import Session
@@ -129,57 +129,55 @@ class TestReportService:
     ):
         """Test successful portfolio report generation."""
         # Mock database queries
+        sample_position.asset = sample_asset
+        sample_position.current_price = 140.0
+        sample_portfolio.positions = [sample_position]
         mock_db_session.exec.side_effect = [
             # Client query result
             Mock(first=Mock(return_value=sample_client)),
-            # Portfolio query result
-            Mock(all=Mock(return_value=[sample_portfolio])),
+            # Primary portfolio, positions and assets eager-loaded
+            Mock(first=Mock(return_value=sample_portfolio)),
         ]
+        report_service.price_service = Mock(
+            get_latest_prices=AsyncMock(return_value={"AAPL": 150.0})
+        )
 
-        # Mock portfolio service
+        # Mock PDF generation
         with patch.object(
-            report_service, "portfolio_service"
-        ) as mock_portfolio_service:
-            mock_valuation = schemas.PortfolioValuation(
-                portfolio_id=1,
-                portfolio_name="John's Portfolio",
-                total_value=15000.0,
-                total_cost_basis=14000.0,
-                total_pnl=1000.0,
-                total_pnl_percentage=7.14,
-                positions_count=1,
-                last_updated=datetime.now(UTC),
-            )
-            mock_portfolio_service.get_portfolio_valuation.return_value = mock_valuation
-
-            # Mock PDF generation
-            with patch.object(
-                report_service, "generate_portfolio_report_pdf"
-            ) as mock_pdf_gen:
-                mock_pdf_gen.return_value = b"fake_pdf_content"
-
-                # Mock file system operations
-                with (
-                    patch("pathlib.Path.mkdir"),
-                    patch("builtins.open", mock_open_func()),
-                    patch.object(mock_db_session, "add"),
-                    patch.object(mock_db_session, "commit"),
-                    patch.object(mock_db_session, "refresh"),
-                ):
-                    # Execute the test
-                    result = await report_service.generate_portfolio_report(
-                        client_id=1,
-                        advisor=sample_user,
-                        report_type="PORTFOLIO_SUMMARY",
-                    )
-
-                    # Assertions
-                    assert result.success is True
-                    assert "Report generated successfully" in result.message
-                    assert (
-                        result.report_id is None
-                    )  # Would be set by refresh in real scenario
-                    assert result.file_path is not None
+            report_service, "render_portfolio_report_pdf", new_callable=AsyncMock
+        ) as mock_pdf_gen:
+            mock_pdf_gen.return_value = b"fake_pdf_content"
+
+            # Mock file system operations
+            with (
+                patch("pathlib.Path.mkdir"),
+                patch("builtins.open", mock_open_func()),
+                patch("os.replace"),
+                patch.object(mock_db_session, "add"),
+                patch.object(mock_db_session, "commit"),
+                patch.object(mock_db_session, "refresh"),
+            ):
+                # Execute the test
+                result = await report_service.generate_portfolio_report(
+                    client_id=1,
+                    advisor=sample_user,
+                    report_type="PORTFOLIO_SUMMARY",
+                )
+
+                # Assertions
+                assert result.success is True
+                assert "Report generated successfully" in result.message
+                assert (
+                    result.report_id is None
+                )  # Would be set by refresh in real scenario
+                assert result.file_path is not None
+
+        # Positions are valued at the batched quotes
+        report_service.price_service.get_latest_prices.assert_awaited_once_with(["AAPL"])
+        valuation, name, lines = mock_pdf_gen.await_args.args
+        assert name == "John's Portfolio"
+        assert valuation.total_value == pytest.approx(100 * 150.0)
+        assert [line.current_price for line in lines] == [150.0]
 
     @pytest.mark.asyncio
     async def test_generate_portfolio_report_client_not_found(
@@ -208,7 +206,7 @@ class TestReportService:
             # Client query result
             Mock(first=Mock(return_value=sample_client)),
             # Portfolio query result (empty)
-            Mock(all=Mock(return_value=[])),
+            Mock(first=Mock(return_value=None)),
         ]
 
         # Execute the test
@@ -313,7 +311,7 @@ class TestReportService:
             )
 
     @pytest.mark.asyncio
-    async def test_generate_portfolio_report_database_rollback_on_error(
+    async def test_generate_portfolio_report_records_nothing_on_render_error(
         self,
         report_service,
         sample_user,
@@ -321,32 +319,279 @@ class TestReportService:
         sample_portfolio,
         mock_db_session,
     ):
-        """Test that database transaction is rolled back on error."""
+        """Test that no report is recorded when rendering fails."""
         # Mock database queries
         mock_db_session.exec.side_effect = [
             # Client query result
             Mock(first=Mock(return_value=sample_client)),
             # Portfolio query result
-            Mock(all=Mock(return_value=[sample_portfolio])),
+            Mock(first=Mock(return_value=sample_portfolio)),
         ]
 
-        # Mock portfolio service to raise an exception
-        with patch.object(
-            report_service, "portfolio_service"
-        ) as mock_portfolio_service:
-            mock_portfolio_service.get_portfolio_valuation.side_effect = Exception(
-                "Portfolio service error"
+        with (
+            patch.object(
+                report_service, "stored_report_key", new_callable=AsyncMock, return_value=None
+            ),
+            patch.object(
+                report_service,
+                "render_portfolio_report_pdf",
+                new_callable=AsyncMock,
+                side_effect=Exception("Renderer error"),
+            ),
+        ):
+            # Execute the test
+            result = await report_service.generate_portfolio_report(
+                client_id=1, advisor=sample_user, report_type="PORTFOLIO_SUMMARY"
             )
 
-            # Execute the test
+        # Assertions
+        assert result.success is False
+        assert "Report generation failed" in result.message
+        mock_db_session.add.assert_not_called()
+        mock_db_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_portfolio_report_allows_god_on_any_client(
+        self, report_service, sample_client, mock_db_session
+    ):
+        """Test that GOD users pass the access check like ADMIN users do."""
+        god = User(id=3, username="god", email="god@example.com", hashed_password="x", role=UserRole.GOD)
+        mock_db_session.exec.side_effect = [
+            Mock(first=Mock(return_value=sample_client)),
+            Mock(first=Mock(return_value=None)),
+        ]
+
+        result = await report_service.generate_portfolio_report(
+            client_id=1, advisor=god, report_type="PORTFOLIO_SUMMARY"
+        )
+
+        assert result.success is False
+        assert "No portfolios found" in result.message
+
+    @pytest.mark.asyncio
+    async def test_render_portfolio_report_pdf_uses_render_pool(
+        self, report_service, sample_valuation_data, sample_position, mock_db_session
+    ):
+        """Test the awaitable render path passes the full template context to the pool."""
+        mock_db_session.exec.return_value.all.return_value = [sample_position]
+
+        with (
+            patch.object(report_service.env, "get_template") as mock_get_template,
+            patch(
+                "cactus_wealth.services.report_service.render_pdf",
+                new_callable=AsyncMock,
+                return_value=b"%PDF-pooled",
+            ) as mock_render,
+        ):
+            mock_get_template.return_value.render.return_value = "<html>pooled</html>"
+
+            pdf_bytes = await report_service.render_portfolio_report_pdf(
+                sample_valuation_data, "Test Portfolio"
+            )
+
+        assert pdf_bytes == b"%PDF-pooled"
+        mock_render.assert_awaited_once_with("<html>pooled</html>")
+        context = mock_get_template.return_value.render.call_args.kwargs
+        assert context["total_value"] == sample_valuation_data.total_value
+        assert context["positions"] == [sample_position]
+        assert "report_date" in context
+
+
+    def test_report_content_hash_tracks_displayed_inputs(
+        self, sample_valuation_data, sample_position, sample_asset
+    ):
+        """Test the content hash ignores sub-cent noise but not displayed changes."""
+        from cactus_wealth.services.report_service import report_content_hash
+
+        sample_position.asset = sample_asset
+        sample_position.current_price = 150.0
+        base = report_content_hash(
+            sample_valuation_data, "Test Portfolio", [sample_position], "PORTFOLIO_SUMMARY"
+        )
+
+        noisy = sample_valuation_data.model_copy(
+            update={"total_value": 15000.001, "last_updated": datetime(2020, 1, 1)}
+        )
+        assert base == report_content_hash(
+            noisy, "Test Portfolio", [sample_position], "PORTFOLIO_SUMMARY"
+        )
+        assert base != report_content_hash(
+            sample_valuation_data, "Test Portfolio", [sample_position], "QUARTERLY"
+        )
+        sample_position.current_price = 151.0
+        assert base != report_content_hash(
+            sample_valuation_data, "Test Portfolio", [sample_position], "PORTFOLIO_SUMMARY"
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_portfolio_report_reuses_stored_pdf(
+        self,
+        report_service,
+        sample_user,
+        sample_client,
+        sample_portfolio,
+        sample_valuation_data,
+        mock_db_session,
+    ):
+        """Test an identical report is not re-rendered, only recorded."""
+        mock_db_session.exec.side_effect = [
+            Mock(first=Mock(return_value=sample_client)),
+            Mock(first=Mock(return_value=sample_portfolio)),
+        ]
+
+        with (
+            patch.object(
+                report_service,
+                "stored_report_key",
+                new_callable=AsyncMock,
+                return_value="abc.pdf",
+            ),
+            patch.object(
+                report_service, "render_portfolio_report_pdf", new_callable=AsyncMock
+            ) as mock_render,
+        ):
             result = await report_service.generate_portfolio_report(
                 client_id=1, advisor=sample_user, report_type="PORTFOLIO_SUMMARY"
             )
 
-            # Assertions
-            assert result.success is False
-            assert "Report generation failed" in result.message
-            mock_db_session.rollback.assert_called_once()
+        assert result.success is True
+        assert result.file_path == "abc.pdf"
+        mock_render.assert_not_awaited()
+        report = mock_db_session.add.call_args.args[0]
+        assert report.file_path == result.file_path
+        assert len(report.content_hash) == 64
+
+
+class TestClientReport:
+    """Test cases for consolidated client reports."""
+
+    @pytest.fixture
+    def client_with_holdings(self, session, test_user):
+        from cactus_wealth.models import InsurancePolicy, InvestmentAccount
+
+        spy = Asset(ticker_symbol="SPY", name="S&P 500 ETF", asset_type=AssetType.ETF)
+        aapl = Asset(ticker_symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK)
+        client = Client(
+            first_name="Lucía",
+            last_name="Consolidada",
+            email="lucia.consolidada@example.com",
+            risk_profile=RiskProfile.MEDIUM,
+            owner_id=test_user.id,
+        )
+        session.add_all([spy, aapl, client])
+        session.commit()
+        for name, holdings in [("Retiro", [(spy, 10)]), ("Crecimiento", [(spy, 2), (aapl, 5)])]:
+            portfolio = Portfolio(name=name, client_id=client.id)
+            session.add(portfolio)
+            session.commit()
+            session.add_all(
+                Position(
+                    quantity=quantity,
+                    purchase_price=100,
+                    average_price=100,
+                    current_price=100,
+                    portfolio_id=portfolio.id,
+                    asset_id=asset.id,
+                )
+                for asset, quantity in holdings
+            )
+        session.add(InvestmentAccount(platform="Balanz", account_number="BZ-001", aum=25_000, client_id=client.id))
+        session.add(
+            InsurancePolicy(
+                policy_number="POL-77",
+                insurance_type="Vida",
+                coverage_amount=100_000,
+                premium_amount=120,
+                client_id=client.id,
+            )
+        )
+        session.commit()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_consolidates_all_holdings_with_one_quote_fetch(
+        self, session, test_user, client_with_holdings, tmp_path
+    ):
+        from cactus_wealth.core.report_storage import LocalReportStorage
+        from cactus_wealth.models import Report
+
+        price_service = Mock()
+        price_service.get_latest_prices = AsyncMock(return_value={"SPY": 110.0, "AAPL": 200.0})
+        service = services.ReportService(
+            session, None, LocalReportStorage(tmp_path), price_service
+        )
+
+        with patch(
+            "cactus_wealth.services.report_service.render_pdf",
+            new_callable=AsyncMock,
+            return_value=b"%PDF-consolidated",
+        ) as mock_render:
+            result = await service.generate_client_report(client_with_holdings.id, test_user)
+            again = await service.generate_client_report(client_with_holdings.id, test_user)
+
+        assert result.success is True
+        price_service.get_latest_prices.assert_awaited_with(["AAPL", "SPY"])
+        # The unchanged second report reuses the stored PDF
+        mock_render.assert_awaited_once()
+        assert again.file_path == result.file_path
+
+        html = mock_render.await_args.args[0]
+        for text in ("Retiro", "Crecimiento", "BZ-001", "POL-77", "$25,000.00"):
+            assert text in html
+        # Portfolios valued at fetched prices (1,100 + 1,220) plus account AUM
+        assert "$2,320.00" in html
+        assert "$27,320.00" in html
+
+        report = session.get(Report, result.report_id)
+        assert report.report_type == "CLIENT_CONSOLIDATED"
+        assert (tmp_path / report.file_path).read_bytes() == b"%PDF-consolidated"
+
+    @pytest.mark.asyncio
+    async def test_denied_for_other_advisor(self, session, client_with_holdings, another_user, tmp_path):
+        from cactus_wealth.core.report_storage import LocalReportStorage
+
+        service = services.ReportService(session, None, LocalReportStorage(tmp_path), Mock())
+
+        result = await service.generate_client_report(client_with_holdings.id, another_user)
+
+        assert result.success is False
+        assert "access denied" in result.message
+
+
+class TestPdfRenderer:
+    """Test cases for the PDF rendering pool."""
+
+    @pytest.mark.asyncio
+    async def test_render_pdf_runs_in_thread_when_pool_disabled(self):
+        from cactus_wealth.core import pdf_renderer
+
+        with (
+            patch.object(pdf_renderer.settings, "PDF_RENDER_WORKERS", 0),
+            patch.object(
+                pdf_renderer, "render_pdf_sync", return_value=b"%PDF-thread"
+            ) as mock_render,
+        ):
+            assert pdf_renderer.get_render_pool() is None
+            assert await pdf_renderer.render_pdf("<html/>") == b"%PDF-thread"
+
+        mock_render.assert_called_once_with("<html/>")
+
+    def test_render_pool_is_shared_and_warmed(self):
+        from cactus_wealth.core import pdf_renderer
+
+        with (
+            patch.object(pdf_renderer.settings, "PDF_RENDER_WORKERS", 3),
+            patch.object(pdf_renderer, "ProcessPoolExecutor") as mock_executor,
+        ):
+            first = pdf_renderer.get_render_pool()
+            second = pdf_renderer.get_render_pool()
+            pdf_renderer.shutdown_render_pool()
+
+        assert first is second
+        kwargs = mock_executor.call_args.kwargs
+        assert kwargs["max_workers"] == 3
+        assert kwargs["initializer"] is pdf_renderer._init_render_worker
+        first.shutdown.assert_called_once()
 
 
 def mock_open_func():
@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from cactus_wealth.core.report_storage import LocalReportStorage, S3ReportStorage
+
+
+class FakeS3Error(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeBody(io.BytesIO):
+    def iter_chunks(self, chunk_size):
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+
+class FakeS3Client:
+    """In-memory stand-in for the subset of the S3 API the backend uses."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise FakeS3Error("404")
+        data = self.objects[(Bucket, Key)]
+        return {"ContentLength": len(data), "ETag": f'"{hash(data) & 0xFFFF:x}"'}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(x) for x in Range.removeprefix("bytes=").split("-"))
+        return {"Body": FakeBody(self.objects[(Bucket, Key)][start : end + 1])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+@pytest.fixture(params=["local", "s3"])
+def storage(request, tmp_path):
+    if request.param == "local":
+        return LocalReportStorage(tmp_path)
+    return S3ReportStorage("reports-bucket", "reports/", client=FakeS3Client())
+
+
+class TestReportStorage:
+    """Test cases for the report storage backends."""
+
+    def test_put_stat_and_ranges(self, storage):
+        data = bytes(range(256)) * 1000
+        storage.put("abc.pdf", data)
+
+        stored = storage.stat("abc.pdf")
+        assert stored.size == len(data)
+        assert stored.etag.startswith('"')
+        assert b"".join(storage.iter_range("abc.pdf", 0, len(data) - 1, 4096)) == data
+        chunks = list(storage.iter_range("abc.pdf", 100, 70_099, 4096))
+        assert b"".join(chunks) == data[100:70_100]
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    def test_missing_and_deleted_objects(self, storage):
+        assert storage.stat("missing.pdf") is None
+        storage.put("gone.pdf", b"%PDF")
+        storage.delete("gone.pdf")
+        assert not storage.exists("gone.pdf")
+
+    def test_local_keys_cannot_escape_root(self, tmp_path):
+        with pytest.raises(ValueError):
+            LocalReportStorage(tmp_path).stat("../secrets.pdf")
+
+    def test_s3_keys_are_prefixed(self):
+        client = FakeS3Client()
+        S3ReportStorage("bucket", "tenant-a/", client=client).put("abc.pdf", b"%PDF")
+
+        assert list(client.objects) == [("bucket", "tenant-a/abc.pdf")]
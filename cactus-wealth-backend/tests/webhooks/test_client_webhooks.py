@@ -1,9 +1,54 @@
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
 
-# Esqueleto: test de webhooks de clientes
+import pytest
+
+from cactus_wealth.models import Client, ClientStatus, RiskProfile
+from cactus_wealth.services.webhook_service import OUTBOX_STREAM, CactusWebhookService
+
+
+@pytest.mark.asyncio
+async def test_client_webhook_event():
+    """Client events are appended to the outbox stream read by the worker."""
+    redis_client = Mock()
+    redis_client.xadd = AsyncMock(return_value=b"1-0")
+    service = CactusWebhookService(redis_client=redis_client)
+
+    assert await service.emit_client_event("client.created", {"id": 7}) is True
+
+    stream, fields = redis_client.xadd.await_args.args
+    assert stream == OUTBOX_STREAM
+    assert fields["event"] == "client.created"
+    assert json.loads(fields["payload"]) == {"id": 7}
+
+
+@pytest.mark.asyncio
+async def test_client_webhook_event_redis_unavailable():
+    redis_client = Mock()
+    redis_client.xadd = AsyncMock(side_effect=ConnectionError("down"))
+    service = CactusWebhookService(redis_client=redis_client)
+
+    assert await service.emit_client_event("client.updated", {"id": 7}) is False
 
-def test_client_webhook_event():
-    assert True  # TODO: implementar test real
 
 def test_client_webhook_payload_validation():
-    # TODO: implementar validación de payload
-    assert True
+    client = Client(
+        id=3,
+        first_name="Ana",
+        last_name="Pérez",
+        email="ana@example.com",
+        risk_profile=RiskProfile.MEDIUM,
+        status=ClientStatus.prospect,
+        owner_id=1,
+        created_at=datetime(2024, 1, 2, tzinfo=UTC),
+    )
+
+    payload = CactusWebhookService.client_payload(client)
+
+    assert payload["id"] == 3
+    assert payload["status"] == ClientStatus.prospect.value
+    assert payload["risk_profile"] == RiskProfile.MEDIUM.value
+    assert payload["lead_source"] is None
+    assert payload["created_at"] == "2024-01-02T00:00:00+00:00"
+    json.dumps(payload)
@@ -80,6 +80,7 @@ describe('useWebSocket', () => {
       expect(mockWebsocketService.on).toHaveBeenCalledWith('connected', expect.any(Function));
       expect(mockWebsocketService.on).toHaveBeenCalledWith('disconnected', expect.any(Function));
       expect(mockWebsocketService.on).toHaveBeenCalledWith('notification', expect.any(Function));
+      expect(mockWebsocketService.on).toHaveBeenCalledWith('notifications', expect.any(Function));
       expect(mockWebsocketService.on).toHaveBeenCalledWith('connection_stats', expect.any(Function));
       expect(mockWebsocketService.on).toHaveBeenCalledWith('error', expect.any(Function));
     });
@@ -92,6 +93,7 @@ describe('useWebSocket', () => {
       expect(mockWebsocketService.off).toHaveBeenCalledWith('connected', expect.any(Function));
       expect(mockWebsocketService.off).toHaveBeenCalledWith('disconnected', expect.any(Function));
       expect(mockWebsocketService.off).toHaveBeenCalledWith('notification', expect.any(Function));
+      expect(mockWebsocketService.off).toHaveBeenCalledWith('notifications', expect.any(Function));
       expect(mockWebsocketService.off).toHaveBeenCalledWith('connection_stats', expect.any(Function));
       expect(mockWebsocketService.off).toHaveBeenCalledWith('error', expect.any(Function));
     });
@@ -246,6 +248,45 @@ describe('useWebSocket', () => {
   });
 
   describe('Notification Handling', () => {
+    it('should add a batch of notifications at once', () => {
+      let batchHandler: Function;
+      mockWebsocketService.on.mockImplementation((event, handler) => {
+        if (event === 'notifications') {
+          batchHandler = handler;
+        }
+      });
+
+      const { result } = renderHook(() => useWebSocket());
+      const batch = [
+        {
+          id: 2,
+          message: '23 valoraciones de portfolio actualizadas',
+          is_read: false,
+          created_at: '2024-01-01T00:00:00Z',
+        },
+        {
+          id: 3,
+          message: 'Reporte generado',
+          is_read: false,
+          created_at: '2024-01-01T00:00:00Z',
+        },
+      ];
+
+      act(() => {
+        batchHandler!(batch);
+        batchHandler!(batch); // Same frame again
+      });
+
+      expect(result.current.notifications).toEqual(batch);
+      expect(result.current.unreadCount).toBe(2);
+      expect(mockNotification).toHaveBeenCalledWith(
+        'Nueva notificación - Cactus Wealth',
+        expect.objectContaining({
+          body: '23 valoraciones de portfolio actualizadas\nReporte generado',
+        })
+      );
+    });
+
     it('should handle new notifications with debouncing', () => {
       let notificationHandler: Function;
       mockWebsocketService.on.mockImplementation((event, handler) => {
@@ -35,6 +35,21 @@ interface UseWebSocketReturn {
   requestStats: () => void;
 }
 
+/**
+ * Agrega un lote de notificaciones al principio de la lista, sin duplicados,
+ * conservando solo las últimas `limit`
+ */
+function mergeNotifications(
+  current: NotificationData[],
+  batch: NotificationData[],
+  limit: number
+): NotificationData[] {
+  const known = new Set(current.map((n) => n.id));
+  const fresh = batch.filter((n) => !known.has(n.id));
+  if (fresh.length === 0) return current;
+  return [...fresh, ...current].slice(0, limit);
+}
+
 /**
  * Hook personalizado para gestionar WebSocket
  */
@@ -106,6 +121,27 @@ export function useWebSocket(): UseWebSocketReturn {
     []
   );
 
+  // Los digests llegan agrupados en un frame 'notifications'; se agregan
+  // todos juntos, sin pasar por el debounce de las notificaciones sueltas
+  const handleNotificationBatch = useCallback(
+    (batch: NotificationData[]) => {
+      setNotifications((prev) => mergeNotifications(prev, batch, 50));
+
+      if (
+        batch.length > 0 &&
+        'Notification' in window &&
+        Notification.permission === 'granted'
+      ) {
+        new Notification('Nueva notificación - Cactus Wealth', {
+          body: batch.map((n) => n.message).join('\n'),
+          icon: '/favicon.ico',
+          tag: `notification-${batch[0].id}`,
+        });
+      }
+    },
+    []
+  );
+
   const handleConnectionStats = useCallback((stats: ConnectionStats) => {
     setConnectionStats(stats);
   }, []);
@@ -176,6 +212,7 @@ export function useWebSocket(): UseWebSocketReturn {
     websocketService.on('connected', handleConnected);
     websocketService.on('disconnected', handleDisconnected);
     websocketService.on('notification', handleNotification);
+    websocketService.on('notifications', handleNotificationBatch);
     websocketService.on('connection_stats', handleConnectionStats);
     websocketService.on('error', handleError);
 
@@ -189,6 +226,7 @@ export function useWebSocket(): UseWebSocketReturn {
       websocketService.off('connected', handleConnected);
       websocketService.off('disconnected', handleDisconnected);
       websocketService.off('notification', handleNotification);
+      websocketService.off('notifications', handleNotificationBatch);
       websocketService.off('connection_stats', handleConnectionStats);
       websocketService.off('error', handleError);
 
@@ -201,6 +239,7 @@ export function useWebSocket(): UseWebSocketReturn {
     handleConnected,
     handleDisconnected,
     handleNotification,
+    handleNotificationBatch,
     handleConnectionStats,
     handleError,
   ]);
@@ -250,13 +289,22 @@ export function useNotifications() {
     []
   );
 
+  const handleNotificationBatch = useCallback(
+    (batch: NotificationData[]) => {
+      setNotifications((prev) => mergeNotifications(prev, batch, 20));
+    },
+    []
+  );
+
   useEffect(() => {
     websocketService.on('notification', handleNotification);
+    websocketService.on('notifications', handleNotificationBatch);
 
     return () => {
       websocketService.off('notification', handleNotification);
+      websocketService.off('notifications', handleNotificationBatch);
     };
-  }, [handleNotification]);
+  }, [handleNotification, handleNotificationBatch]);
 
   const markAsRead = useCallback((notificationId: number) => {
     setNotifications((prev) =>
@@ -337,6 +337,12 @@ class WebSocketService {
           this.emit('notification', message.data);
           break;
 
+        case 'notifications':
+          // Lote de notificaciones (digests) en un solo frame
+          this.debugLog('🔔 WebSocket: Notification batch received');
+          this.emit('notifications', message.data);
+          break;
+
         case 'kpi_update':
           this.debugLog('📊 WebSocket: KPI update');
           this.emit('kpi_update', message.data);